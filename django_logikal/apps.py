@@ -4,7 +4,7 @@ from django.apps import AppConfig
 from django.conf import global_settings, settings
 from django.core.checks import Error, register
 from django.db.migrations import writer
-from django.template.loader import get_template
+from django.utils.autoreload import autoreload_started, file_changed
 
 from django_logikal.migration.writer import FormattedMigrationWriter
 
@@ -19,13 +19,24 @@ class DjangoLogikalConfig(AppConfig):
             from django_logikal.bibliography import (  # pylint: disable=import-outside-toplevel
                 Bibliography,
             )
+            from django_logikal.templates.jinja import (  # pylint: disable=import-outside-toplevel
+                template_path,
+            )
 
             Bibliography.add_bibliographies({
-                # Note: both Django and Jinja2 templates have an origin attribute, so this is fine
-                name: get_template(path).origin.name  # type: ignore[attr-defined]
-                for name, path in bibliographies.items()
+                name: template_path(path) for name, path in bibliographies.items()
             })
 
+        # Invalidate changed templates
+        from django_logikal.templates import jinja  # pylint: disable=import-outside-toplevel
+
+        autoreload_started.connect(
+            jinja.watch_template_changes, dispatch_uid='django_logikal_watch_template_changes',
+        )
+        file_changed.connect(
+            jinja.template_changed, dispatch_uid='django_logikal_template_changed',
+        )
+
         # Format migrations
         writer.MigrationWriter = FormattedMigrationWriter  # type: ignore[misc]
 
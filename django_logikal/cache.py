@@ -0,0 +1,254 @@
+"""
+Cache entire pages while keeping the content security policy nonce fresh on every request.
+
+The following settings can be used to configure the page cache:
+
+- ``PAGE_CACHE_ALIAS``: the cache alias to use (defaults to ``default``)
+- ``PAGE_CACHE_TIMEOUT``: the cache timeout to use in seconds (defaults to the cache default)
+- ``PAGE_CACHE_VERSION``: the version of the deployment (defaults to the hash of the Jinja
+  templates), cached pages are automatically invalidated when it changes
+"""
+from collections.abc import Callable, Iterable
+from functools import cache, wraps
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.middleware.csp import get_nonce
+from django.template import engines
+from django.template.response import SimpleTemplateResponse
+from django.utils import translation
+from django.utils.cache import has_vary_header
+
+from django_logikal.middleware import Middleware
+from django_logikal.views.generic import ViewFunction, is_public
+
+#: The placeholder of the content security policy nonce in the cached pages.
+NONCE_PLACEHOLDER = b'{{page-cache-csp-nonce}}'
+
+#: The response headers that are stored along with the cached pages.
+CACHED_HEADERS = frozenset({'content-type', 'content-language', 'vary'})
+
+
+@cache
+def deployment_version() -> str:
+    """
+    Return the version of the current deployment.
+    """
+    if version := getattr(settings, 'PAGE_CACHE_VERSION', None):
+        return str(version)
+    from django_logikal.templates.jinja import (  # pylint: disable=import-outside-toplevel
+        JinjaTemplates,
+    )
+
+    version_hash = sha1(usedforsecurity=False)
+    for backend in engines.all():
+        if isinstance(backend, JinjaTemplates):
+            for template_name in backend.template_names():
+                version_hash.update(template_name.encode('utf-8'))
+                if path := backend.template_path(template_name):
+                    version_hash.update(Path(path).read_bytes())
+    return version_hash.hexdigest()[:16]
+
+
+class PageCache:
+    """
+    Store and retrieve rendered pages.
+
+    Pages are only cached for ``GET`` and ``HEAD`` requests without a session cookie, and only when
+    the response is a successful HTML response that does not set cookies or use a CSRF token. The
+    cache keys depend on the host, path, query string, active language and deployment version, as
+    well as on the values of the request headers listed in the ``Vary`` header of the response
+    (similarly to :func:`django.utils.cache.get_cache_key`). Responses that vary on every header
+    are not cached. The resources preloaded while rendering a page are stored along with it, so
+    that the :class:`~django_logikal.templates.preload.PreloadMiddleware` sends the same ``Link``
+    header for the cached page.
+
+    Args:
+        alias: The cache alias to use. Defaults to the ``PAGE_CACHE_ALIAS`` setting.
+        timeout: The cache timeout to use in seconds. Defaults to the ``PAGE_CACHE_TIMEOUT``
+            setting.
+
+    """
+    def __init__(self, alias: str | None = None, timeout: float | None = DEFAULT_TIMEOUT):
+        self.alias = alias or str(getattr(settings, 'PAGE_CACHE_ALIAS', 'default'))
+        self.timeout = (
+            timeout if timeout is not DEFAULT_TIMEOUT
+            else getattr(settings, 'PAGE_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+        )
+
+    @staticmethod
+    def url_key(request: HttpRequest) -> str:
+        """
+        Return the cache key of the URL and active language of a given request.
+        """
+        url = f'{request.get_host()}{request.path}?{request.META.get('QUERY_STRING', '')}'
+        url_hash = sha1(url.encode('utf-8'), usedforsecurity=False).hexdigest()
+        return f'page:{deployment_version()}:{translation.get_language()}:{url_hash}'
+
+    @classmethod
+    def key(cls, request: HttpRequest, vary_headers: Iterable[str] = ()) -> str:
+        """
+        Return the cache key of a given request.
+
+        Args:
+            request: The request to use.
+            vary_headers: The :attr:`~django.http.HttpRequest.META` keys of the request headers
+                that the response varies on.
+
+        """
+        vary_hash = sha1(usedforsecurity=False)
+        for header in vary_headers:
+            value = request.META.get(header, '').encode('utf-8')
+            vary_hash.update(b'%d:%s,' % (len(value), value))
+        return f'{cls.url_key(request)}:{vary_hash.hexdigest()[:16]}'
+
+    @staticmethod
+    def vary_headers(response: HttpResponseBase) -> list[str]:
+        """
+        Return the :attr:`~django.http.HttpRequest.META` keys of the headers listed in ``Vary``.
+
+        The ``Accept-Language`` header is skipped, as the cache keys depend on the active language.
+        """
+        headers = {
+            header.strip().upper().replace('-', '_')
+            for header in response.headers.get('Vary', '').split(',')
+        }
+        headers.discard('ACCEPT_LANGUAGE')
+        return sorted(
+            header if header in {'CONTENT_LENGTH', 'CONTENT_TYPE'} else f'HTTP_{header}'
+            for header in headers if header
+        )
+
+    @staticmethod
+    def cacheable_request(request: HttpRequest) -> bool:
+        """
+        Check whether the response of a given request may be cached.
+        """
+        return (
+            request.method in {'GET', 'HEAD'}
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        )
+
+    @staticmethod
+    def cacheable_response(request: HttpRequest, response: HttpResponseBase) -> bool:
+        """
+        Check whether a given response may be cached.
+        """
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and response.headers.get('Content-Type', '').startswith('text/html')
+            and not response.cookies
+            and 'private' not in response.headers.get('Cache-Control', '')
+            and 'no-store' not in response.headers.get('Cache-Control', '')
+            and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+            and not has_vary_header(response, '*')
+        )
+
+    def get(self, request: HttpRequest) -> HttpResponse | None:
+        """
+        Return the cached response of a given request, if available.
+        """
+        if not self.cacheable_request(request):
+            return None
+        page_cache = caches[self.alias]
+        if (vary_headers := page_cache.get(f'{self.url_key(request)}:vary')) is None:
+            return None
+        if (cached := page_cache.get(self.key(request, vary_headers))) is None:
+            return None
+        content, headers, preload_links = cached
+        if NONCE_PLACEHOLDER in content:
+            if (nonce := get_nonce(request)) is None:
+                return None
+            content = content.replace(NONCE_PLACEHOLDER, str(nonce).encode('ascii'))
+        if preload_links:
+            request.__dict__.setdefault('_preload_links', []).extend(preload_links)
+        return HttpResponse(content, headers=headers)
+
+    def set(self, request: HttpRequest, response: HttpResponseBase) -> None:
+        """
+        Cache a given response, if possible.
+        """
+        if not (self.cacheable_request(request) and self.cacheable_response(request, response)):
+            return
+        content = response.content  # type: ignore[attr-defined]
+        if nonce := get_nonce(request):  # only true when the nonce has been used
+            content = content.replace(str(nonce).encode('ascii'), NONCE_PLACEHOLDER)
+        headers = {
+            header: value for header, value in response.headers.items()
+            if header.lower() in CACHED_HEADERS
+        }
+        preload_links = list(request.__dict__.get('_preload_links', []))
+        vary_headers = self.vary_headers(response)
+        caches[self.alias].set_many({
+            f'{self.url_key(request)}:vary': vary_headers,
+            self.key(request, vary_headers): (content, headers, preload_links),
+        }, self.timeout)
+
+
+class PageCacheMiddleware(Middleware):
+    """
+    Cache the pages of public views.
+
+    The cached pages are served with a fresh content security policy nonce on every request.
+
+    .. note:: The middleware must be placed after the
+        :class:`~django.middleware.csp.ContentSecurityPolicyMiddleware`.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.page_cache = PageCache()
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., Any],
+        view_args: list[Any],  # pylint: disable=unused-argument
+        view_kwargs: dict[str, Any],  # pylint: disable=unused-argument
+    ) -> HttpResponse | None:
+        if not is_public(view_func):
+            return None
+        if (response := self.page_cache.get(request)) is None:
+            request.page_cache_miss = True  # type: ignore[attr-defined]
+        return response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if getattr(request, 'page_cache_miss', False):
+            self.page_cache.set(request, response)
+        return response
+
+
+def cache_page(
+    alias: str | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> Callable[[ViewFunction], ViewFunction]:
+    """
+    Cache the pages rendered by a view.
+
+    Works like the :class:`PageCacheMiddleware`, except that the view does not need to be public.
+    Note that the page content must not depend on the current user.
+    """
+    page_cache = PageCache(alias=alias, timeout=timeout)
+
+    def decorator(view: ViewFunction) -> ViewFunction:
+        @wraps(view)
+        def view_wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+            if (cached_response := page_cache.get(request)) is not None:
+                return cached_response
+            response = view(request, *args, **kwargs)
+            if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+                response.add_post_render_callback(
+                    lambda rendered: page_cache.set(request, rendered),
+                )
+            else:
+                page_cache.set(request, response)
+            return response
+        return view_wrapper
+
+    return decorator
@@ -0,0 +1,362 @@
+"""
+Render static sites in parallel and incrementally.
+
+.. note:: Requires the :ref:`static extra <index:Static Sites>`.
+"""
+import filecmp
+import json
+import os
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from multiprocessing import get_context
+from pathlib import Path
+from shutil import copy2
+from typing import Any
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import HttpResponse
+from django.template import engines
+from django.utils import translation
+from django_distill.distill import urls_to_distill
+from django_distill.errors import DistillError
+from django_distill.renderer import DistillRender, filter_dirs, get_filepath, load_urls, write_file
+
+from django_logikal.templates.jinja import JinjaTemplates
+
+#: A rendered page as a tuple of its URI, file name, content and content type.
+RenderedPage = tuple[str, str | None, bytes, str | None]
+#: A page to render as a tuple of its URL pattern index, view parameters and language.
+Page = tuple[int, tuple[Any, ...] | dict[str, Any], str]
+#: The name of the build manifest in the output folder of incremental builds.
+BUILD_MANIFEST = '.build-manifest.json'
+
+
+def _set_up_worker() -> None:
+    django.setup()
+    load_urls()
+
+
+def _render_pattern(index: int) -> list[RenderedPage] | str:
+    try:
+        return [
+            (uri, file_name, response.content, response.get('Content-Type'))
+            for uri, file_name, response in DistillRender([urls_to_distill[index]]).render()
+        ]
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return f'{urls_to_distill[index][4]}: {error}'
+
+
+def _render_pages(pages: list[Page]) -> list[RenderedPage | str]:
+    renderer = ProcessDistillRender(urls_to_distill)
+    results: list[RenderedPage | str] = []
+    for page in pages:
+        try:
+            results.append(renderer.render_page(page))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results.append(f'{urls_to_distill[page[0]][4]}: {error}')
+    return results
+
+
+class ProcessDistillRender(DistillRender):  # type: ignore[misc]
+    """
+    Render the distill paths across a pool of processes.
+
+    The number of processes is specified by the ``--parallel-render`` option of the
+    ``distill-local`` command (or the ``--jobs`` option of the ``generate`` command). Django is set
+    up once per process, and each process renders all pages and languages of a given URL pattern.
+    The pages are returned in the same order as with serial rendering, and the failures of all URL
+    patterns are reported together.
+
+    .. note:: Enabled by the ``DISTILL_RENDERER`` setting (which is set automatically by the
+        static site settings modules).
+    """
+    def render_all_urls(self, do_render: bool = True) -> Iterator[tuple[str, str | None, Any]]:
+        if not do_render or self.parallel_render <= 1 or len(self.urls_to_distill) <= 1:
+            yield from super().render_all_urls(do_render=do_render)
+            return
+        errors = []
+        with ProcessPoolExecutor(
+            max_workers=self.parallel_render,
+            mp_context=get_context('spawn'),
+            initializer=_set_up_worker,
+        ) as executor:
+            for pages in executor.map(_render_pattern, range(len(self.urls_to_distill))):
+                if isinstance(pages, str):
+                    errors.append(pages)
+                    continue
+                for uri, file_name, content, content_type in pages:
+                    yield uri, file_name, HttpResponse(content, content_type=content_type)
+        if errors:
+            raise DistillError('\n'.join(['Failed to render the following URLs:', *errors]))
+
+    def pages(self) -> Iterator[Page]:
+        """
+        Return the pages to render in the order of serial rendering.
+        """
+        for index, (_, distill_func, _, _, view_name, _, _) in enumerate(self.urls_to_distill):
+            for values in self.get_uri_values(distill_func, view_name):
+                params = (values,) if isinstance(values, str) else values or ()
+                for language in self.get_langs():
+                    yield index, params, language
+
+    def page_file(self, page: Page) -> tuple[str, str | None]:
+        """
+        Return the URI and file name of a given page.
+        """
+        index, params, language = page
+        url, _, file_name, _, view_name, _, _ = self.urls_to_distill[index]
+        with translation.override(language):
+            uri = self.generate_uri(url, view_name, params)
+        return uri, self._get_filename(file_name, uri, params)
+
+    def render_page(self, page: Page) -> RenderedPage:
+        """
+        Render a given page.
+        """
+        index, params, language = page
+        url, _, file_name, status_codes, view_name, args, kwargs = self.urls_to_distill[index]
+        with translation.override(language):
+            uri = self.generate_uri(url, view_name, params)
+            response = self.render_view(uri, status_codes, params, args, kwargs)
+        file_name = self._get_filename(file_name, uri, params)
+        return uri, file_name, response.content, response.get('Content-Type')
+
+
+def files_digest(paths: Iterable[Path]) -> str:
+    """
+    Return the digest of the paths and contents of the given files.
+    """
+    digest = sha256()
+    for path in sorted(set(paths)):
+        digest.update(f'{path}\0'.encode('utf-8'))
+        digest.update(path.read_bytes() if path.is_file() else b'\0')
+    return digest.hexdigest()
+
+
+def template_files(template_name: str | None) -> list[Path]:
+    """
+    Return the paths of a given Jinja template and the templates it references.
+
+    All template files are returned when the template is not a Jinja template or when it references
+    templates dynamically.
+    """
+    backends = [backend for backend in engines.all() if isinstance(backend, JinjaTemplates)]
+    for backend in backends:
+        if template_name and backend.template_path(template_name):
+            graph = backend.dependency_graph
+            if graph.is_dynamic(template_name):
+                break
+            names = {template_name, *graph.dependencies(template_name)}
+            return sorted(Path(path) for name in names if (path := backend.template_path(name)))
+    return sorted(
+        Path(path)
+        for backend in backends for name in backend.template_names()
+        if (path := backend.template_path(name))
+    )
+
+
+def translation_files() -> list[Path]:
+    """
+    Return the paths of the compiled translation catalogs of the project and its applications.
+    """
+    folders = [Path(path) for path in settings.LOCALE_PATHS]
+    folders += [Path(app.path) / 'locale' for app in apps.get_app_configs()]
+    return sorted(file for folder in folders for file in folder.rglob('*.mo'))
+
+
+def static_files() -> list[Path]:
+    """
+    Return the paths of the static file manifest and the critical styles (when specified).
+    """
+    files = []
+    if manifest_name := getattr(staticfiles_storage, 'manifest_name', None):
+        files.append(Path(str(settings.STATIC_ROOT)) / manifest_name)
+    if critical_css := getattr(settings, 'CRITICAL_CSS', None):
+        files.append(Path(critical_css))
+    return files
+
+
+def _view_template(args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> str | None:
+    view = args[1] if len(args) > 1 else kwargs.get('view')
+    if template_name := getattr(view, 'view_initkwargs', {}).get('template_name'):
+        return str(template_name)
+    return getattr(getattr(view, 'view_class', None), 'template_name', None)
+
+
+def _sync_files(
+    source: Path,
+    target: Path,
+    keys: Collection[str] | None = None,
+) -> Iterator[tuple[Path, bool]]:
+    for root, dirs, names in os.walk(source):
+        dirs[:] = filter_dirs(dirs)
+        for name in sorted(names):
+            source_file = Path(root) / name
+            if keys is not None and source_file.relative_to(source).as_posix() not in keys:
+                continue
+            target_file = target / source_file.relative_to(source)
+            if target_file.is_file() and filecmp.cmp(source_file, target_file):
+                yield target_file, False
+                continue
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            copy2(source_file, target_file)
+            yield target_file, True
+
+
+def _read_manifest(path: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _page_digests(  # pylint: disable=too-many-locals
+    renderer: ProcessDistillRender, output_dir: Path,
+) -> tuple[dict[str, Page], dict[str, str]]:
+    shared_inputs = {
+        'translations': files_digest(translation_files()),
+        'static': files_digest(static_files()),
+    }
+    template_digests: dict[str | None, str] = {}
+    pages: dict[str, Page] = {}
+    digests: dict[str, str] = {}
+    for page in renderer.pages():
+        index, params, language = page
+        _, _, _, _, view_name, args, kwargs = renderer.urls_to_distill[index]
+        if (template_name := _view_template(args, kwargs)) not in template_digests:
+            template_digests[template_name] = files_digest(template_files(template_name))
+        uri, file_name = renderer.page_file(page)
+        full_path, _ = get_filepath(str(output_dir), file_name, uri)
+        key = Path(full_path).relative_to(output_dir).as_posix()
+        inputs = {
+            **shared_inputs,
+            'templates': template_digests[template_name],
+            'view': view_name,
+            'uri': uri,
+            'parameters': repr(params),
+            'language': language,
+        }
+        pages[key] = page  # the last language is kept, as with distill
+        digests[key] = sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+    return pages, digests
+
+
+def _render_changed(
+    output_dir: Path,
+    groups: Mapping[int, Mapping[str, Page]],
+    stdout: Callable[[str], Any],
+    jobs: int,
+) -> tuple[set[str], list[str]]:
+    batches = [list(group.values()) for group in groups.values()]
+    if jobs <= 1 or len(batches) <= 1:
+        results = [_render_pages(batch) for batch in batches]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=get_context('spawn'), initializer=_set_up_worker,
+        ) as executor:
+            results = list(executor.map(_render_pages, batches))
+    rendered = set()
+    errors = []
+    for group, batch_results in zip(groups.values(), results):
+        for key, result in zip(group, batch_results):
+            if isinstance(result, str):
+                errors.append(result)
+                continue
+            _, _, content, content_type = result
+            stdout(f'Rendering page: {key} ["{content_type}", {len(content)} bytes]')
+            write_file(str(output_dir / key), content)
+            rendered.add(key)
+    return rendered, errors
+
+
+def _manifest_static_files() -> set[str] | None:
+    if not (manifest_name := getattr(staticfiles_storage, 'manifest_name', None)):
+        return None
+    manifest = _read_manifest(Path(str(settings.STATIC_ROOT)) / manifest_name)
+    if not isinstance(paths := manifest.get('paths'), dict):
+        return None
+    return {manifest_name, *paths, *paths.values()}
+
+
+def _sync_static_files(output_dir: Path, stdout: Callable[[str], Any]) -> dict[str, bool]:
+    files = {}
+    # the stale files of previous collections are left out via the static file manifest
+    folders = [(str(settings.STATIC_ROOT), str(settings.STATIC_URL), _manifest_static_files())]
+    if settings.MEDIA_ROOT:
+        folders.append((str(settings.MEDIA_ROOT), str(settings.MEDIA_URL), None))
+    for root, url, keys in folders:
+        for file, copied in _sync_files(Path(root), output_dir / url.lstrip('/'), keys=keys):
+            files[key := file.relative_to(output_dir).as_posix()] = copied
+            if copied:
+                stdout(f'Copying file: {key}')
+    return files
+
+
+def _remove_files(output_dir: Path, keys: Iterable[str], stdout: Callable[[str], Any]) -> None:
+    for key in sorted(keys):
+        if not (file := output_dir / key).is_file():
+            continue
+        stdout(f'Removing file: {key}')
+        file.unlink()
+        for folder in file.parents:
+            if folder == output_dir or any(folder.iterdir()):
+                break
+            folder.rmdir()
+
+
+def build_incremental(output_dir: Path, stdout: Callable[[str], Any], jobs: int = 1) -> None:
+    """
+    Render the pages whose inputs changed since the previous build into a given folder.
+
+    The build manifest (see :data:`BUILD_MANIFEST`) stores a digest of the inputs of each page:
+    the view parameters, the language, the template and the templates it references (see
+    :func:`template_files`), the translation catalogs (see :func:`translation_files`) and the
+    static file manifest (see :func:`static_files`). Only the pages whose digest changed (or whose
+    file is missing) are rendered, the static and media files are only copied when their content
+    changed, and the files that are no longer generated are removed. When the static files storage
+    uses a manifest, only the static files in the manifest are copied, so that the files of
+    previous collections are removed as well.
+
+    .. note:: Changes to the Python code (for example, to the views) are not tracked, so a full
+        build is necessary in this case.
+
+    Args:
+        output_dir: The output folder to use.
+        stdout: The function to use for printing progress.
+        jobs: The number of processes to use for rendering.
+
+    """
+    load_urls()
+    manifest_path = output_dir / BUILD_MANIFEST
+    previous = _read_manifest(manifest_path)
+    pages, digests = _page_digests(ProcessDistillRender(urls_to_distill), output_dir)
+    groups: defaultdict[int, dict[str, Page]] = defaultdict(dict)
+    for key, page in pages.items():
+        if previous.get('pages', {}).get(key) != digests[key] or not (output_dir / key).is_file():
+            groups[page[0]][key] = page
+    rendered, errors = _render_changed(output_dir, groups, stdout, jobs)
+    files = _sync_static_files(output_dir, stdout)
+    _remove_files(
+        output_dir,
+        {*previous.get('pages', {}), *previous.get('files', [])} - set(pages) - set(files),
+        stdout,
+    )
+
+    failed = {key for group in groups.values() for key in group} - rendered
+    manifest = {
+        'pages': {key: digest for key, digest in digests.items() if key not in failed},
+        'files': sorted(files),
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    stdout(
+        f'Rendered {len(rendered)} of {len(pages)} pages and copied '
+        f'{sum(files.values())} of {len(files)} static files'
+    )
+    if errors:
+        raise DistillError('\n'.join(['Failed to render the following URLs:', *errors]))
@@ -0,0 +1,301 @@
+"""
+Split the fonts referenced by ``@font-face`` rules into Unicode range subsets.
+
+The following settings can be used to configure font subsetting:
+
+- ``FONT_SUBSETTING``: whether to split the fonts into subsets when the static files are collected
+  (defaults to ``False``)
+- ``FONT_SUBSETTING_GLYPHS``: whether to only keep the glyphs that are used in the compiled
+  translation catalogs and the Jinja templates (defaults to ``False``)
+
+Note that font subsetting requires the ``fonts`` extra.
+"""
+import posixpath
+import string
+import unicodedata
+from collections.abc import Callable, Iterable
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import tinycss2
+from babel import Locale
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.template import engines
+from django.utils.translation import to_locale
+from tinycss2.ast import AtRule
+
+from django_logikal.templates.components import subset_path
+
+#: The Unicode ranges of the font subsets.
+FONT_SUBSETS = {
+    'latin': (
+        'U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, U+0308,'
+        ' U+0329, U+2000-206F, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD'
+    ),
+    'latin-ext': (
+        'U+0100-02BA, U+02BD-02C5, U+02C7-02CC, U+02CE-02D7, U+02DD-02FF, U+0304, U+0308, U+0329,'
+        ' U+1D00-1DBF, U+1E00-1E9F, U+1EF2-1EFF, U+2020, U+20A0-20AB, U+20AD-20C0, U+2113,'
+        ' U+2C60-2C7F, U+A720-A7FF'
+    ),
+    'cyrillic': 'U+0301, U+0400-045F, U+0490-0491, U+04B0-04B1, U+2116',
+    'cyrillic-ext': 'U+0460-052F, U+1C80-1C8A, U+20B4, U+2DE0-2DFF, U+A640-A69F, U+FE2E-FE2F',
+    'greek': 'U+0370-0377, U+037A-037F, U+0384-038A, U+038C, U+038E-03A1, U+03A3-03FF',
+    'greek-ext': 'U+1F00-1FFF',
+    'vietnamese': (
+        'U+0102-0103, U+0110-0111, U+0128-0129, U+0168-0169, U+01A0-01A1, U+01AF-01B0,'
+        ' U+0300-0301, U+0303-0304, U+0308-0309, U+0323, U+0329, U+1EA0-1EF9, U+20AB'
+    ),
+}
+FONT_FLAVORS = {'.woff2': 'woff2', '.woff': 'woff', '.ttf': None, '.otf': None}
+
+
+def code_points(value: str) -> set[int]:
+    """
+    Return the code points of a given ``unicode-range`` descriptor value.
+    """
+    points: set[int] = set()
+    for item in value.split(','):
+        start, _, end = item.strip().removeprefix('U+').partition('-')
+        points.update(range(int(start, 16), int(end or start, 16) + 1))
+    return points
+
+
+def unicode_range(points: Iterable[int]) -> str:
+    """
+    Return the ``unicode-range`` descriptor value of a given set of code points.
+    """
+    ranges: list[list[int]] = []
+    for point in sorted(points):
+        if ranges and ranges[-1][1] == point - 1:
+            ranges[-1][1] = point
+        else:
+            ranges.append([point, point])
+    return ', '.join(
+        f'U+{start:04X}' + (f'-{end:04X}' if end != start else '') for start, end in ranges
+    )
+
+
+def language_characters(language_code: str) -> set[str]:
+    """
+    Return the characters used by the name, month names and day names of a given language.
+    """
+    locale = Locale.parse(to_locale(language_code))
+    return set(''.join([
+        locale.display_name or '',
+        *locale.months['format']['wide'].values(),
+        *locale.months['stand-alone']['wide'].values(),
+        *locale.days['format']['wide'].values(),
+    ]))
+
+
+def language_subsets(language_codes: Iterable[str]) -> list[str]:
+    """
+    Return the font subsets needed by a given set of languages.
+
+    The ``latin`` subset is always included.
+    """
+    characters = {
+        ord(character) for code in language_codes for character in language_characters(code)
+    }
+    return [
+        subset for subset, subset_range in FONT_SUBSETS.items()
+        if subset == 'latin' or code_points(subset_range) & characters
+    ]
+
+
+def _catalog_characters(locales: set[str]) -> set[str]:
+    from babel.messages.mofile import read_mo  # pylint: disable=import-outside-toplevel
+
+    characters: set[str] = set()
+    locale_paths = [
+        *(Path(path) for path in settings.LOCALE_PATHS),
+        *(Path(app.path) / 'locale' for app in apps.get_app_configs()),
+    ]
+    for locale_path in locale_paths:
+        for locale in locales:
+            for catalog_path in sorted((locale_path / locale / 'LC_MESSAGES').glob('*.mo')):
+                with catalog_path.open('rb') as catalog_file:
+                    for message in read_mo(catalog_file):
+                        strings = message.string
+                        if isinstance(strings, str):
+                            strings = [strings]
+                        characters.update(''.join(item or '' for item in strings or []))
+    return characters
+
+
+def _template_characters() -> set[str]:
+    from django_logikal.templates.jinja import (  # pylint: disable=import-outside-toplevel
+        JinjaTemplates,
+    )
+
+    characters: set[str] = set()
+    for backend in engines.all():
+        if isinstance(backend, JinjaTemplates):
+            for template_name in backend.template_names():
+                if path := backend.template_path(template_name):
+                    characters.update(Path(path).read_text(encoding='utf-8'))
+    return characters
+
+
+def used_characters() -> set[str]:
+    """
+    Return the characters used in the compiled translation catalogs and the Jinja templates.
+
+    Printable ASCII characters and the characters of the active languages are always included.
+    """
+    characters = set(string.printable)
+    for language_code, _ in settings.LANGUAGES:
+        characters |= language_characters(language_code)
+    locales = {to_locale(language_code) for language_code, _ in settings.LANGUAGES}
+    return characters | _catalog_characters(locales) | _template_characters()
+
+
+def subset_font(content: bytes, points: set[int], flavor: str | None) -> tuple[bytes, set[int]]:
+    """
+    Return a subset of a given font along with the code points that it contains.
+
+    Layout features and names (including the license information) are retained, and control
+    characters are left out, as they have no visible glyphs. An empty font is returned when the
+    font does not contain any of the code points.
+    """
+    # pylint: disable=import-outside-toplevel
+    from fontTools.subset import Options, Subsetter, save_font
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(BytesIO(content))
+    points = {
+        point for point in points & set(font.getBestCmap())
+        if unicodedata.category(chr(point)) != 'Cc'
+    }
+    if not points:
+        return b'', set()
+    options = Options(flavor=flavor, layout_features=['*'], name_IDs=['*'], notdef_outline=True)
+    subsetter = Subsetter(options=options)
+    subsetter.populate(unicodes=points)
+    subsetter.subset(font)
+    output = BytesIO()
+    save_font(font, output, options)
+    return output.getvalue(), points
+
+
+def _font_url(token: Any) -> str | None:
+    if token.type == 'url':
+        return str(token.value)
+    if token.type == 'function' and token.lower_name == 'url':
+        for argument in token.arguments:
+            if argument.type == 'string':
+                return str(argument.value)
+    return None
+
+
+class FontSubsetMixin:
+    """
+    Split the fonts of ``@font-face`` rules into subsets when the static files are post-processed.
+
+    The fonts are split into the Unicode range subsets needed by the ``LANGUAGES`` setting (see
+    :data:`FONT_SUBSETS`), and each ``@font-face`` rule is replaced with one rule per subset with
+    the appropriate ``unicode-range`` descriptor, so that browsers only download the subsets that
+    a page needs. Only enabled when the ``FONT_SUBSETTING`` setting is ``True``.
+    """
+    def post_process(
+        self,
+        paths: dict[str, tuple[Storage, str]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if getattr(settings, 'FONT_SUBSETTING', False) and not kwargs.get('dry_run'):
+            self.subset_fonts(paths)
+        yield from super().post_process(paths, *args, **kwargs)  # type: ignore[misc]
+
+    def subset_fonts(self, paths: dict[str, tuple[Storage, str]]) -> None:
+        """
+        Split the fonts referenced by the collected style sheets into subsets.
+
+        The subsets are saved next to the original fonts and added to the given paths, and the
+        style sheets are replaced with their rewritten version.
+        """
+        subset_ranges = {
+            subset: code_points(FONT_SUBSETS[subset])
+            for subset in language_subsets(code for code, _ in settings.LANGUAGES)
+        }
+        if getattr(settings, 'FONT_SUBSETTING_GLYPHS', False):
+            characters = {ord(character) for character in used_characters()}
+            subset_ranges = {
+                subset: points & characters for subset, points in subset_ranges.items()
+            }
+
+        font_subsets: dict[str, dict[str, set[int]]] = {}
+
+        def subset(font_path: str) -> dict[str, set[int]]:
+            if font_path not in font_subsets and font_path in paths:
+                storage, source_path = paths[font_path]
+                with storage.open(source_path) as font_file:
+                    content = font_file.read()
+                font_subsets[font_path] = {}
+                flavor = FONT_FLAVORS[posixpath.splitext(font_path)[1]]
+                for name, points in subset_ranges.items():
+                    subset_content, subset_points = subset_font(content, points, flavor)
+                    if subset_points:
+                        path = subset_path(font_path, name)
+                        self._replace(path, subset_content)
+                        paths[path] = (self, path)  # type: ignore[assignment]
+                        font_subsets[font_path][name] = subset_points
+            return font_subsets.get(font_path, {})
+
+        for path, (storage, source_path) in list(paths.items()):
+            if not path.endswith('.css'):
+                continue
+            with storage.open(source_path) as css_file:
+                css = css_file.read().decode('utf-8')
+            if '@font-face' not in css:
+                continue
+            rules = []
+            for rule in tinycss2.parse_stylesheet(css):
+                rules.append(self._font_face_rules(rule, path, subset) or rule.serialize())
+            self._replace(path, ''.join(rules).encode('utf-8'))
+            paths[path] = (self, path)  # type: ignore[assignment]
+
+    def _replace(self, path: str, content: bytes) -> None:
+        if self.exists(path):  # type: ignore[attr-defined]
+            self.delete(path)  # type: ignore[attr-defined]
+        self._save(path, ContentFile(content))  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _font_face_rules(
+        rule: Any,
+        css_path: str,
+        subset: Callable[[str], dict[str, set[int]]],
+    ) -> str | None:
+        if not isinstance(rule, AtRule) or rule.lower_at_keyword != 'font-face':
+            return None
+        if any(  # already split
+            getattr(declaration, 'lower_name', None) == 'unicode-range'
+            for declaration in tinycss2.parse_blocks_contents(rule.content or [])
+        ):
+            return None
+        fonts = {}
+        for token in rule.content or []:
+            url = _font_url(token)
+            if url and posixpath.splitext(url)[1] in FONT_FLAVORS and '://' not in url:
+                font_path = posixpath.normpath(posixpath.join(posixpath.dirname(css_path), url))
+                fonts[url] = subset(font_path)
+        if not fonts:
+            return None
+        rules = []
+        for name in FONT_SUBSETS:
+            if not all(name in font for font in fonts.values()):
+                continue
+            content = ''.join(
+                f'url("{subset_path(url, name)}")' if (url := _font_url(token)) in fonts
+                else token.serialize()
+                for token in rule.content or []
+            ).rstrip()
+            points = set.intersection(*(font[name] for font in fonts.values()))
+            rules.append(
+                f'@font-face {{{content}\n  unicode-range: {unicode_range(points)};\n}}'
+            )
+        return '\n\n'.join(rules)
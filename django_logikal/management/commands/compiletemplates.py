@@ -0,0 +1,48 @@
+"""
+Compile all Jinja templates into importable Python modules ahead of time.
+
+The compiled templates are written into a zip archive when the output path ends with ``.zip`` and
+into a folder otherwise. The output path defaults to the value of the ``compiled_templates``
+template backend option, which also instructs the template backend to load the compiled templates
+instead of the template source files.
+"""
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.template import engines
+from jinja2 import TemplateSyntaxError
+
+from django_logikal.templates.jinja import JinjaTemplates
+
+
+class Command(BaseCommand):
+    help = ' '.join(__doc__.splitlines()[0:2])
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('output', nargs='?', type=Path, help='The output path to use.')
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        backends = [engine for engine in engines.all() if isinstance(engine, JinjaTemplates)]
+        if options.get('output') and len(backends) > 1:
+            raise CommandError('The output path cannot be provided for multiple template backends')
+
+        for backend in backends:
+            if not (output := options.get('output') or backend.compiled_templates):
+                raise CommandError(f'The output path must be provided for "{backend.name}"')
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'Compiling {backend.name} templates:'))
+            output.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                backend.source_env.compile_templates(
+                    target=output,
+                    filter_func=backend.matches_extension,
+                    zip='deflated' if output.suffix == '.zip' else None,
+                    log_function=lambda message: self.stdout.write(f'  {message}'),
+                    ignore_errors=False,
+                )
+            except TemplateSyntaxError as error:
+                error_message = f'Template "{error.name}" cannot be compiled: {error}'
+                raise CommandError(error_message) from error
+
+        self.stdout.write(self.style.SUCCESS('\nTemplates successfully compiled'))
@@ -0,0 +1,39 @@
+"""
+Extract the critical component styles of the template pages.
+
+The output path defaults to the value of the ``CRITICAL_CSS`` setting, which also instructs the
+``component_head`` function to inline the critical styles. Must be run after ``collectstatic``.
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from django_logikal.templates import functions
+from django_logikal.templates.components import critical_styles
+from django_logikal.templates.critical import extract_critical_css
+
+
+class Command(BaseCommand):
+    help = ' '.join(__doc__.splitlines()[0:2])
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('output', nargs='?', type=Path, help='The output path to use.')
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        if not (output := options.get('output') or getattr(settings, 'CRITICAL_CSS', None)):
+            raise CommandError('The output path must be provided')
+        output = Path(output)
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Extracting critical styles:'))
+        styles = extract_critical_css()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(styles, indent=2) + '\n', encoding='utf-8')
+        critical_styles.cache_clear()
+        functions._component_head.cache_clear()  # pylint: disable=protected-access
+        for key, css in styles.items():
+            self.stdout.write(f'  Extracted {len(css)} characters for "{key}"')
+
+        self.stdout.write(self.style.SUCCESS(f'\nCritical styles saved into "{output}"'))
@@ -1,12 +1,24 @@
 """
 Generate static files.
 
+The critical component styles are also extracted when the ``CRITICAL_CSS`` setting is specified,
+and the bytes saved by removing the unused component styles are reported when the
+``CSS_PURGING`` setting is ``True``. The pages are rendered across a pool of processes when the
+``--jobs`` option is greater than one (see :class:`~django_logikal.distill.ProcessDistillRender`).
+Only the pages and static files that changed since the previous build are written when the
+``--incremental`` option is specified (see :func:`~django_logikal.distill.build_incremental`).
+
 .. note:: Requires the :ref:`static extra <index:Static Sites>`.
 """
+from pathlib import Path
 from typing import Any
 
+from django.conf import settings
 from django.core.management import call_command
-from django.core.management.base import BaseCommand, CommandParser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django_distill.errors import DistillError
+
+from django_logikal.distill import build_incremental
 
 
 class Command(BaseCommand):
@@ -14,10 +26,36 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser: CommandParser) -> None:
         parser.add_argument('--no-input', action='store_true', help='Do not prompt for input.')
+        parser.add_argument('-j', '--jobs', type=int, default=1,
+                            help='The number of processes to use for rendering.')
+        parser.add_argument('--incremental', action='store_true',
+                            help='Only render the pages whose inputs changed.')
         parser.add_argument('output_dir', nargs='?', help='The output folder to use.')
 
     def handle(self, *_args: Any, **options: dict[str, Any]) -> None:
         no_input = options.pop('no_input', False)
         output_dir = options.pop('output_dir', None)
-        call_command('collectstatic', clear=True, no_input=not no_input, **options)
-        call_command('distill-local', force=no_input, output_dir=output_dir, **options)
+        jobs = options.pop('jobs', 1)
+        incremental = options.pop('incremental', False)
+        call_command('collectstatic', clear=not incremental, no_input=not no_input, **options)
+        if getattr(settings, 'CSS_PURGING', False):
+            call_command('purgecss', **options)
+        if getattr(settings, 'CRITICAL_CSS', None):
+            call_command('criticalcss', **options)
+        if incremental:
+            self.render_incremental(output_dir=output_dir, jobs=jobs)  # type: ignore[arg-type]
+            return
+        call_command(
+            'distill-local',
+            force=no_input, output_dir=output_dir, parallel_render=jobs, **options,
+        )
+
+    def render_incremental(self, output_dir: str | None, jobs: int) -> None:
+        if not (output_dir := output_dir or getattr(settings, 'DISTILL_DIR', None)):
+            raise CommandError('The output folder must be specified')
+        path = Path(output_dir).expanduser().resolve()
+        path.mkdir(parents=True, exist_ok=True)
+        try:
+            build_incremental(output_dir=path, stdout=self.stdout.write, jobs=jobs)
+        except DistillError as error:
+            raise CommandError(str(error)) from error
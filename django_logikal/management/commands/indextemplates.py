@@ -0,0 +1,38 @@
+"""
+Build the template index that maps template names to file paths.
+
+The output path defaults to the value of the ``template_index`` template backend option, which also
+instructs the template backend to load the index from the given file.
+"""
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.template import engines
+
+from django_logikal.templates.jinja import JinjaTemplates
+from django_logikal.templates.loaders import IndexedFileSystemLoader
+
+
+class Command(BaseCommand):
+    help = ' '.join(__doc__.splitlines()[0:2])
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('output', nargs='?', type=Path, help='The output path to use.')
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        backends = [engine for engine in engines.all() if isinstance(engine, JinjaTemplates)]
+        if options.get('output') and len(backends) > 1:
+            raise CommandError('The output path cannot be provided for multiple template backends')
+
+        for backend in backends:
+            if not (output := options.get('output') or backend.template_index):
+                raise CommandError(f'The output path must be provided for "{backend.name}"')
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'Indexing {backend.name} templates:'))
+            loader = IndexedFileSystemLoader(backend.template_dirs)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            loader.save_index(output)
+            self.stdout.write(f'  Indexed {len(loader.index)} templates into "{output}"')
+
+        self.stdout.write(self.style.SUCCESS('\nTemplates successfully indexed'))
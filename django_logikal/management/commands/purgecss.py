@@ -0,0 +1,29 @@
+"""
+Report the bytes saved by removing the unused rules from the component style sheets.
+
+The unused rules are only removed from the collected static files when the ``CSS_PURGING``
+setting is ``True``. Selectors that are used dynamically can be kept via the
+``CSS_PURGING_SAFELIST`` setting.
+"""
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from django_logikal.purge import purge_report
+
+
+class Command(BaseCommand):
+    help = ' '.join(__doc__.splitlines()[0:2])
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING('Purging component styles:'))
+        total_size = total_purged_size = 0
+        for file, (size, purged_size) in purge_report().items():
+            self.stdout.write(
+                f'  Saved {size - purged_size} of {size} bytes in "{file.as_posix()}"'
+            )
+            total_size += size
+            total_purged_size += purged_size
+        self.stdout.write(self.style.SUCCESS(
+            f'\nSaved {total_size - total_purged_size} of {total_size} bytes in total'
+        ))
@@ -0,0 +1,41 @@
+"""
+Compile all Jinja templates and store their bytecode in the configured bytecode cache.
+
+.. tip:: Run this command during deployment (or container start-up) in order to avoid compiling
+    templates on the first request of each worker process.
+"""
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from jinja2 import TemplateSyntaxError
+
+from django_logikal.templates.jinja import JinjaTemplates
+
+
+class Command(BaseCommand):
+    help = ' '.join(__doc__.splitlines()[0:2])
+
+    def handle(self, *_args: Any, **_options: Any) -> None:
+        backends = [
+            engine for engine in engines.all()
+            if isinstance(engine, JinjaTemplates) and engine.env.bytecode_cache
+        ]
+        if not backends:
+            raise CommandError('No template backend with a bytecode cache is configured')
+
+        errors = 0
+        for backend in backends:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'Warming {backend.name} templates:'))
+            for name in backend.template_names():
+                self.stdout.write(f'  Compiling {name}... ', ending='')
+                try:
+                    backend.env.get_template(name)
+                    self.stdout.write(self.style.SUCCESS('OK'))
+                except TemplateSyntaxError as error:
+                    errors += 1
+                    self.stdout.write(self.style.ERROR('FAILED') + f' – {error}')
+
+        if errors:
+            raise CommandError(f'{errors} template(s) could not be compiled')
+        self.stdout.write(self.style.SUCCESS('\nTemplate bytecode cache successfully warmed'))
@@ -0,0 +1,156 @@
+"""
+Remove the unused rules from the component style sheets.
+
+The following settings can be used to configure style purging:
+
+- ``CSS_PURGING``: whether to remove the unused rules from the component style sheets and bundles
+  when the static files are collected (defaults to ``False``)
+- ``CSS_PURGING_SAFELIST``: the simple selectors to keep even when they do not appear in the
+  scanned sources, for example ``.open``, ``#main``, ``dialog`` or ``[hidden]`` (defaults to
+  ``[]``)
+
+The names used by the Jinja templates, the Python modules of the installed applications (for
+example, the ``attrs`` of form widgets) and the component scripts are kept. Note that the names
+that are only built dynamically (for example, via string concatenation) or only appear in other
+sources must be safelisted.
+"""
+import re
+from collections.abc import Iterator, Set
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.template import engines
+
+NAME_PATTERN = re.compile(r'[A-Za-z_][\w-]*')
+#: The selectors that are always kept, as the component templates build them dynamically.
+SAFELIST = frozenset({'.apple-login', '.google-login', '.microsoft-login'})
+
+
+def source_selectors(source: str) -> set[str]:
+    """
+    Return the simple selectors that the names in a given source may correspond to.
+
+    Every name is considered to be a potential tag name, class, identifier and attribute name.
+    """
+    return {
+        selector
+        for name in NAME_PATTERN.findall(source)
+        for selector in (name.lower(), f'.{name}', f'#{name}', f'[{name.lower()}]')
+    }
+
+
+def _source_files() -> Iterator[Path]:
+    # pylint: disable=import-outside-toplevel
+    from django_logikal.templates.components import COMPONENTS_JS_PATH, STATIC_PATH
+    from django_logikal.templates.jinja import JinjaTemplates
+
+    for backend in engines.all():
+        if isinstance(backend, JinjaTemplates):
+            for template_name in backend.template_names():
+                if path := backend.template_path(template_name):
+                    yield Path(path)
+    for app_config in apps.get_app_configs():
+        yield from sorted(
+            path for path in Path(app_config.path).rglob('*.py')
+            if 'migrations' not in path.relative_to(app_config.path).parts
+        )
+    yield from sorted((STATIC_PATH / COMPONENTS_JS_PATH).rglob('*.mjs'))
+
+
+def used_selectors() -> set[str]:
+    """
+    Return the simple selectors that may be used by the templates.
+
+    The Jinja templates, the Python modules of the installed applications (except for their
+    migrations) and the component scripts are scanned for names, and the safelisted selectors (see
+    :data:`SAFELIST` and the ``CSS_PURGING_SAFELIST`` setting) are added.
+    """
+    selectors = set(SAFELIST) | set(getattr(settings, 'CSS_PURGING_SAFELIST', []))
+    for path in _source_files():
+        selectors |= source_selectors(path.read_text(encoding='utf-8'))
+    return selectors
+
+
+def purge_css(css: str, selectors: Set[str]) -> str:
+    """
+    Remove the style rules that cannot match any of the given selectors from a style sheet.
+
+    The style sheet is minified as well, but its ``@import`` rules are retained.
+    """
+    from django_logikal.templates.bundles import (  # pylint: disable=import-outside-toplevel
+        minify_css,
+    )
+
+    return minify_css(css, selectors=selectors, imports=True) + '\n'
+
+
+def purge_report(selectors: Set[str] | None = None) -> dict[Path, tuple[int, int]]:
+    """
+    Return the size of the component style sheets before and after purging, in bytes.
+
+    The selectors default to the ones returned by :func:`used_selectors`.
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_logikal.templates.components import STATIC_PATH, component_style_files
+
+    selectors = used_selectors() if selectors is None else selectors
+    report = {}
+    for file in component_style_files():
+        css = (STATIC_PATH / file).read_text(encoding='utf-8')
+        report[file] = (len(css.encode('utf-8')), len(purge_css(css, selectors).encode('utf-8')))
+    return report
+
+
+def is_component_style(path: str) -> bool:
+    """
+    Return whether a given static path is a component style sheet or bundle.
+    """
+    # pylint: disable=import-outside-toplevel
+    from django_logikal.templates.components import BUNDLES_PATH, COMPONENTS_CSS_PATH
+
+    static_path = PurePosixPath(path.replace('\\', '/'))
+    return static_path.suffix == '.css' and any(
+        static_path.is_relative_to(folder.as_posix())
+        for folder in (COMPONENTS_CSS_PATH, BUNDLES_PATH)
+    )
+
+
+class StylePurgeMixin:
+    """
+    Remove the unused component style rules when the static files are post-processed.
+
+    The rules whose selectors cannot match the names used by the templates (see
+    :func:`used_selectors`) are removed from the component style sheets and bundles. Only enabled
+    when the ``CSS_PURGING`` setting is ``True``.
+    """
+    def post_process(
+        self,
+        paths: dict[str, tuple[Storage, str]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if getattr(settings, 'CSS_PURGING', False) and not kwargs.get('dry_run'):
+            self.purge_styles(paths)
+        yield from super().post_process(paths, *args, **kwargs)  # type: ignore[misc]
+
+    def purge_styles(self, paths: dict[str, tuple[Storage, str]]) -> None:
+        """
+        Remove the unused rules from the collected component style sheets.
+
+        The style sheets are replaced with their purged version.
+        """
+        selectors = used_selectors()
+        for path, (storage, source_path) in list(paths.items()):
+            if not is_component_style(path):
+                continue
+            with storage.open(source_path) as css_file:
+                css = css_file.read().decode('utf-8')
+            if self.exists(path):  # type: ignore[attr-defined]
+                self.delete(path)  # type: ignore[attr-defined]
+            purged = purge_css(css, selectors).encode('utf-8')
+            self._save(path, ContentFile(purged))  # type: ignore[attr-defined]
+            paths[path] = (self, path)  # type: ignore[assignment]
@@ -6,7 +6,7 @@ from django.http import HttpRequest
 from logikal_utils.imports import try_import
 
 from django_logikal.middleware import Middleware
-from django_logikal.views.generic import PublicViewMixin
+from django_logikal.views.generic import is_public
 
 
 class LoginRequiredByDefaultMiddleware(Middleware):
@@ -40,8 +40,6 @@ class LoginRequiredByDefaultMiddleware(Middleware):
         # (see https://www.django-rest-framework.org/api-guide/authentication/)
         if self._api_view and issubclass(getattr(view_func, 'cls', type(None)), self._api_view):
             return None
-        if getattr(view_func, 'public_view', False):
-            return None
-        if issubclass(getattr(view_func, 'view_class', type(None)), PublicViewMixin):
+        if is_public(view_func):
             return None
         return login_required(view_func)(request, *view_args, **view_kwargs)
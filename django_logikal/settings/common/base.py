@@ -45,6 +45,13 @@ class CommonBaseSettings(SettingsUpdate):
     # Static files
     STATIC_ROOT = Path(os.getcwd()) / 'static'
     STATIC_URL = '/static/'
+    STATICFILES_FINDERS = [
+        'django.contrib.staticfiles.finders.FileSystemFinder',
+        'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+        'django_logikal.templates.bundles.ComponentBundleFinder',
+        'django_logikal.templates.icons.IconSpriteFinder',
+        'django_logikal.templates.catalogs.JavaScriptCatalogFinder',
+    ]
 
     # Internationalization
     LANGUAGES = [('en-us', gettext_lazy('English (United States)'))]
@@ -67,7 +67,9 @@ class BaseSettings(CommonBaseSettings):
 
     # Static files
     STORAGES = {**CommonBaseSettings.STORAGES, **{
-        'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+        'staticfiles': {
+            'BACKEND': 'django_logikal.storage.CompressedManifestStaticFilesStorage',
+        },
     }}
     WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 
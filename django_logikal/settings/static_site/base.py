@@ -14,6 +14,7 @@ class BaseSettings(CommonBaseSettings):
 
     # Static site generation
     DISTILL_DIR = Path(os.getcwd()) / 'generated'
+    DISTILL_RENDERER = 'django_logikal.distill.ProcessDistillRender'
 
     @classmethod
     def apply(cls, settings: Settings) -> None:
@@ -1,12 +1,80 @@
 from pathlib import Path
 from typing import Any
 
+from django.conf import settings
 from django.contrib.staticfiles import storage
+from django.core.files.base import ContentFile, File
 
+from django_logikal.fonts import FontSubsetMixin
+from django_logikal.purge import StylePurgeMixin
+from django_logikal.templates.icons import minify_svg
 
-class ManifestStaticFilesStorage(storage.ManifestStaticFilesStorage):
+
+class SVGMinifyMixin:
+    """
+    Minify SVG files when they are stored (see :func:`~django_logikal.templates.icons.minify_svg`).
+    """
+    def _save(self, name: str, content: File[Any]) -> str:
+        if name.endswith('.svg'):
+            if hasattr(content, 'seek'):
+                content.seek(0)
+            content = ContentFile(minify_svg(content.read().decode('utf-8')).encode('utf-8'))
+        return super()._save(name, content)  # type: ignore[misc, no-any-return]
+
+
+class ManifestIndexMixin(storage.ManifestFilesMixin):
+    """
+    Resolve the URLs of static files via an in-memory index that is built once per process.
+
+    The index maps the static file names of the manifest to their final URLs, and it is extended
+    with the URLs of other names as they are resolved. Indexing is bypassed in debug mode.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._url_index: dict[str, str] | None = None
+
+    @property
+    def url_index(self) -> dict[str, str]:
+        """
+        Return the index that maps static file names to URLs.
+        """
+        if self._url_index is None:
+            self.warm_up()
+        return self._url_index  # type: ignore[return-value]
+
+    def warm_up(self) -> None:
+        """
+        Build the URL index from the manifest.
+        """
+        url = super().url
+        self._url_index = {name: url(name, force=True) for name in self.hashed_files}
+
+    def url(self, name: str | None, force: bool = False) -> str:
+        if name is None or (settings.DEBUG and not force):
+            return super().url(name, force)  # type: ignore[arg-type]
+        if (url := self.url_index.get(name)) is None:
+            url = self.url_index[name] = super().url(name, force=True)
+        return url
+
+    def post_process(self, *args: Any, **kwargs: Any) -> Any:
+        yield from super().post_process(*args, **kwargs)
+        self._url_index = None
+
+
+class ManifestStaticFilesStorage(  # pylint: disable=too-many-ancestors
+    SVGMinifyMixin,
+    FontSubsetMixin,
+    StylePurgeMixin,
+    ManifestIndexMixin,
+    storage.ManifestStaticFilesStorage,
+):
     """
     Remove the unprocessed source files after post-processing.
+
+    The URLs of the static files are resolved via an in-memory index (see
+    :class:`ManifestIndexMixin`), SVG files are minified (see :class:`SVGMinifyMixin`), fonts can
+    be split into subsets (see :class:`~django_logikal.fonts.FontSubsetMixin`), and the unused
+    component styles can be removed (see :class:`~django_logikal.purge.StylePurgeMixin`).
     """
     default_template = 'url(\'%(url)s\')'  # patch the rewriter to use single quotes
 
@@ -15,3 +83,15 @@ class ManifestStaticFilesStorage(storage.ManifestStaticFilesStorage):
             yield name, hashed_name, processed
             if processed:
                 Path(self.path(name)).unlink()
+
+
+def warm_up() -> None:
+    """
+    Build the URL index of the static files storage, if it uses one.
+
+    The index is otherwise built when the first static file URL is resolved. Servers can call this
+    function when loading the application (e.g. in the WSGI or ASGI module), so that the index is
+    available before the first request.
+    """
+    if not settings.DEBUG and isinstance(storage.staticfiles_storage, ManifestIndexMixin):
+        storage.staticfiles_storage.warm_up()
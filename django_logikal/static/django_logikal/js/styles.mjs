@@ -0,0 +1,11 @@
+// Apply the style sheets that are loaded asynchronously when critical styles are inlined
+document.querySelectorAll('link[rel="stylesheet"][data-media]').forEach((link) => {
+  const apply = () => {
+    link.media = link.dataset.media;
+  };
+  if (link.sheet) {
+    apply();
+  } else {
+    link.addEventListener('load', apply);
+  }
+});
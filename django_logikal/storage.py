@@ -0,0 +1,24 @@
+from whitenoise import storage
+
+from django_logikal.fonts import FontSubsetMixin
+from django_logikal.purge import StylePurgeMixin
+from django_logikal.static import ManifestIndexMixin, SVGMinifyMixin
+
+
+class CompressedManifestStaticFilesStorage(  # pylint: disable=too-many-ancestors
+    SVGMinifyMixin,
+    FontSubsetMixin,
+    StylePurgeMixin,
+    ManifestIndexMixin,
+    storage.CompressedManifestStaticFilesStorage,  # type: ignore[misc]
+):
+    """
+    Compress static files, minify SVG files and resolve static file URLs via an in-memory index.
+
+    See :class:`~django_logikal.static.SVGMinifyMixin`,
+    :class:`~django_logikal.fonts.FontSubsetMixin`,
+    :class:`~django_logikal.purge.StylePurgeMixin` and
+    :class:`~django_logikal.static.ManifestIndexMixin` for more details.
+
+    .. note:: Requires the :ref:`dynamic extra <index:Dynamic Sites>`.
+    """
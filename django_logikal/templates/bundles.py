@@ -0,0 +1,263 @@
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator, Set
+from pathlib import Path
+from typing import Any
+
+import tinycss2
+from django.template import engines
+from logikal_utils.operators import unique
+from tinycss2.ast import AtRule, QualifiedRule
+from tinycss2.serializer import serialize_identifier, serialize_string_value
+
+from django_logikal.templates.components import (
+    BUNDLES_PATH, COMPONENTS_JS_PATH, LOCAL_IMPORT_PATTERN, STATIC_PATH, bundle_files,
+    bundleable, component_head_files, import_names, module_dependencies,
+)
+from django_logikal.templates.finders import GeneratedFileFinder
+from django_logikal.templates.functions import THEMES, THEMES_CSS_PATH, static
+from django_logikal.templates.jinja import JinjaTemplates
+from django_logikal.templates.preload import component_head_calls
+
+THEMED = {'themed': True, 'plain': False}
+
+
+GROUPING_RULES = {'media', 'supports', 'layer', 'container'}
+
+
+def _relative_url(url: str, base: str) -> str:
+    if not base or url.startswith(('/', '#', 'data:')) or '://' in url:
+        return url
+    return os.path.normpath(os.path.join(base, url)).replace(os.sep, '/')
+
+
+def _minify_token(token: Any, url: Callable[[str], str]) -> str:
+    if token.type == 'url':
+        return f'url("{serialize_string_value(url(token.value))}")'
+    if token.type == 'function':
+        if token.lower_name == 'url' and token.arguments and token.arguments[0].type == 'string':
+            return f'url("{serialize_string_value(url(token.arguments[0].value))}")'
+        return f'{serialize_identifier(token.name)}({_minify_tokens(token.arguments, url)})'
+    if token.type in {'{} block', '() block', '[] block'}:
+        opening, closing = token.type[0], token.type[1]
+        return f'{opening}{_minify_tokens(token.content, url)}{closing}'
+    return str(token.serialize())
+
+
+def _minify_tokens(tokens: Iterable[Any], url: Callable[[str], str]) -> str:
+    text = ''
+    space = False
+    for token in tokens:
+        if token.type in {'whitespace', 'comment'}:
+            space = True
+            continue
+        value = _minify_token(token, url)
+        if space and text and text[-1] not in '{};,:(>' and value[0] not in '{};,)>':
+            text += ' '
+        text += value
+        space = False
+    return text
+
+
+def _required_selectors(prelude: Iterable[Any]) -> Iterator[set[str]]:
+    required: set[str] = set()
+    previous = None
+    for token in prelude:
+        prefix = previous.value if previous is not None and previous.type == 'literal' else ''
+        if token.type == 'literal' and token.value == ',':
+            yield required
+            required = set()
+        elif token.type == 'ident' and prefix != ':':  # ignore pseudo-classes and pseudo-elements
+            required.add(f'.{token.value}' if prefix == '.' else token.lower_value)
+        elif token.type == 'hash' and token.is_identifier:
+            required.add(f'#{token.value}')
+        elif token.type == '[] block':
+            names = [item.lower_value for item in token.content if item.type == 'ident']
+            required.update(f'[{name}]' for name in names[:1])  # the attribute name
+        previous = token
+    yield required
+
+
+def _minify_rules(
+    rules: Iterable[Any],
+    url: Callable[[str], str],
+    selectors: Set[str] | None,
+    skipped_at_rules: Set[str],
+) -> list[str]:
+    minified = []
+    for rule in rules:
+        if not isinstance(rule, (QualifiedRule, AtRule)) or (
+            isinstance(rule, AtRule) and rule.lower_at_keyword in skipped_at_rules
+        ):
+            continue
+        if isinstance(rule, QualifiedRule) and selectors is not None and not any(
+            required <= selectors for required in _required_selectors(rule.prelude)
+        ):
+            continue
+        prelude = _minify_tokens(rule.prelude, url)
+        if isinstance(rule, AtRule):
+            prelude = f'@{serialize_identifier(rule.at_keyword)} {prelude}'.strip()
+        if rule.content is None:
+            content = ';'
+        elif isinstance(rule, AtRule) and rule.lower_at_keyword in GROUPING_RULES:
+            nested_rules = tinycss2.parse_rule_list(
+                rule.content, skip_comments=True, skip_whitespace=True,
+            )
+            nested = ''.join(_minify_rules(nested_rules, url, selectors, skipped_at_rules))
+            if not nested:
+                continue
+            content = f'{{{nested}}}'
+        else:
+            content = f'{{{_minify_tokens(rule.content, url)}}}'
+        minified.append(prelude + content)
+    return minified
+
+
+def minify_css(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    css: str,
+    base: str = '',
+    selectors: Set[str] | None = None,
+    static_urls: bool = False,
+    font_faces: bool = True,
+    imports: bool = False,
+) -> str:
+    """
+    Remove comments, superfluous whitespace and ``@import`` rules from a style sheet.
+
+    Args:
+        css: The style sheet to minify.
+        base: The path to prepend to relative URLs.
+        selectors: The tag names, classes, identifiers and attribute names used on a page (see
+            :func:`~django_logikal.templates.critical.page_selectors`). When provided, the style
+            rules that cannot match the page are removed as well.
+        static_urls: Whether to replace relative URLs with the URLs of the respective static files.
+        font_faces: Whether to keep the ``@font-face`` rules.
+        imports: Whether to keep the ``@import`` rules.
+
+    """
+    def url(value: str) -> str:
+        relative_url = _relative_url(value, base)
+        return static(relative_url) if static_urls and relative_url != value else relative_url
+
+    rules = tinycss2.parse_stylesheet(css, skip_comments=True, skip_whitespace=True)
+    skipped_at_rules = set() if imports else {'import'}
+    if not font_faces:
+        skipped_at_rules.add('font-face')
+    return '\n'.join(_minify_rules(rules, url, selectors, skipped_at_rules))
+
+
+def component_styles(
+    modules: tuple[str, ...],
+    minify: Callable[[Path], str],
+    use_standard_theme: bool = True,
+) -> str:
+    """
+    Return the minified styles of a given set of component modules.
+
+    The standard theme styles are wrapped into the appropriate ``@media`` rules when requested.
+
+    Args:
+        modules: The component modules to use.
+        minify: The function to use for minifying a given style sheet path.
+        use_standard_theme: Whether to include the standard light and dark theme.
+
+    """
+    styles = []
+    if use_standard_theme:
+        for theme, media in THEMES.items():
+            if css := minify((THEMES_CSS_PATH / theme).with_suffix('.css')):
+                styles.append(f'@media ({media}){{{css}}}' if media else css)
+    styles.extend(
+        css for file in component_head_files(modules)['css'] if (css := minify(file))
+    )
+    return '\n'.join(styles) + '\n'
+
+
+def bundle_css(modules: tuple[str, ...], use_standard_theme: bool = True) -> str:
+    """
+    Return a minified style sheet that contains the styles of a given set of component modules.
+    """
+    bundle_path = bundle_files(modules, use_standard_theme=use_standard_theme)['css']
+
+    def minify(file: Path) -> str:
+        css = (STATIC_PATH / file).read_text(encoding='utf-8')
+        return minify_css(css, base=os.path.relpath(file.parent, bundle_path.parent))
+
+    return component_styles(modules, minify=minify, use_standard_theme=use_standard_theme)
+
+
+def _import_declarations(match: re.Match[str]) -> str:
+    return ''.join(
+        f'const {local_name} = {name};\n'
+        for name, local_name in import_names(match.group('names')) if name != local_name
+    )
+
+
+def bundle_js(modules: tuple[str, ...]) -> str:
+    """
+    Return a JavaScript module that contains the scripts of a given set of component modules.
+
+    The scripts and the modules they import are concatenated in dependency order (each module only
+    once), and the import declarations of local modules are replaced with the declarations of the
+    aliased names (for example, ``import {gettext as translate} from './gettext.mjs'`` becomes
+    ``const translate = gettext;``). Therefore, the modules must not declare conflicting names, and
+    they must be bundleable (see :func:`~django_logikal.templates.components.bundleable`). A
+    :exc:`ValueError` is raised otherwise.
+    """
+    scripts = []
+    for module in unique(
+        dependency
+        for file in [COMPONENTS_JS_PATH / 'gettext.mjs', *component_head_files(modules)['js']]
+        for dependency in module_dependencies(file)
+    ):
+        if not bundleable(module):
+            raise ValueError(f'Cannot bundle "{module}", as it imports other modules')
+        content = (STATIC_PATH / module).read_text(encoding='utf-8')
+        content = LOCAL_IMPORT_PATTERN.sub(_import_declarations, content)
+        scripts.append(f'// {module}\n{content.strip()}\n')
+    return '\n'.join(scripts)
+
+
+class ComponentBundleFinder(GeneratedFileFinder):
+    """
+    Provide the style sheet and JavaScript bundles of component modules as static files.
+
+    The bundles of the ``component_head`` calls that use literal arguments and ``bundle=True`` in
+    the Jinja templates are generated (and thus collected) by the ``collectstatic`` command, while
+    other bundles are generated on demand when they are looked up (for example, during
+    development). Bundles are always regenerated from the current component files. JavaScript
+    bundles are only provided when the scripts can be bundled (see :func:`bundle_js`).
+
+    .. note:: The finder must be added to the ``STATICFILES_FINDERS`` setting (which is done
+        automatically by the standard settings modules).
+    """
+    directory_prefix = 'django-logikal-bundles-'
+
+    def content(self, path: str) -> str | None:
+        bundle_path = Path(path)
+        if not bundle_path.is_relative_to(BUNDLES_PATH):
+            return None
+        parts = bundle_path.relative_to(BUNDLES_PATH).parts
+        modules = tuple(Path(parts[-1]).stem.split('.'))
+        try:
+            if len(parts) == 1 and bundle_path.suffix == '.mjs':
+                if not component_head_files(modules)['js']:
+                    return None
+                return bundle_js(modules)
+            if bundle_path.suffix == '.css' and len(parts) == 2 and parts[0] in THEMED:
+                return bundle_css(modules, use_standard_theme=THEMED[parts[0]])
+        except ValueError:
+            pass
+        return None
+
+    def paths(self) -> Iterator[str]:
+        for backend in engines.all():
+            if not isinstance(backend, JinjaTemplates):
+                continue
+            for args, kwargs in component_head_calls(backend):
+                options = dict(kwargs)
+                if not options.get('bundle'):
+                    continue
+                use_standard_theme = options.get('use_standard_theme', True)
+                for file in bundle_files(args, use_standard_theme=use_standard_theme).values():
+                    yield str(file)
@@ -0,0 +1,109 @@
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from jinja2 import bccache
+from jinja2.environment import Environment
+
+#: The environment attributes that affect the compiled code of the templates.
+COMPILE_OPTIONS = (
+    'block_start_string', 'block_end_string',
+    'variable_start_string', 'variable_end_string',
+    'comment_start_string', 'comment_end_string',
+    'line_statement_prefix', 'line_comment_prefix',
+    'trim_blocks', 'lstrip_blocks', 'newline_sequence', 'keep_trailing_newline',
+    'optimized', 'is_async',
+)
+
+
+def template_cache_key(environment: Environment, name: str, source: str) -> str:
+    """
+    Return a bytecode cache key for a given template source.
+
+    Unlike the default Jinja key, the key does not include the template file path, so cache entries
+    remain valid across deployments that install the project to a different location. Instead, the
+    key depends on the template source and the compilation options of the environment (see
+    :data:`COMPILE_OPTIONS`), so templates with the same name in different template folders or
+    template backends do not overwrite each other's bytecode.
+    """
+    parts = [name, sha1(source.encode('utf-8')).hexdigest()]
+    parts.extend(repr(getattr(environment, option)) for option in COMPILE_OPTIONS)
+    parts.extend(sorted(environment.extensions))
+    return sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class _SourceKeyMixin:
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,  # pylint: disable=unused-argument
+        source: str,
+    ) -> bccache.Bucket:
+        key = template_cache_key(environment, name, source)
+        checksum = self.get_source_checksum(source)  # type: ignore[attr-defined]
+        bucket = bccache.Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)  # type: ignore[attr-defined]
+        return bucket
+
+
+class FileSystemBytecodeCache(_SourceKeyMixin, bccache.FileSystemBytecodeCache):
+    """
+    Store compiled template bytecode in a local directory.
+
+    Args:
+        directory: The directory to use. Defaults to a user-specific temporary directory.
+        pattern: The file name pattern to use.
+
+    """
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        pattern: str = '__jinja2_%s.cache',
+    ):
+        super().__init__(directory=str(directory) if directory else None, pattern=pattern)
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+
+class CacheBytecodeCache(_SourceKeyMixin, bccache.BytecodeCache):
+    """
+    Store compiled template bytecode in a Django cache.
+
+    Args:
+        alias: The cache alias to use.
+        prefix: The prefix to use for the cache keys.
+        timeout: The cache timeout to use in seconds. Defaults to caching forever.
+
+    """
+    def __init__(self, alias: str = 'default', prefix: str = 'jinja2', timeout: int | None = None):
+        self.alias = alias
+        self.prefix = prefix
+        self.timeout = timeout
+
+    def _key(self, bucket: bccache.Bucket) -> str:
+        return f'{self.prefix}:{bucket.key}'
+
+    def load_bytecode(self, bucket: bccache.Bucket) -> None:
+        if (bytecode := caches[self.alias].get(self._key(bucket))) is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: bccache.Bucket) -> None:
+        caches[self.alias].set(self._key(bucket), bucket.bytecode_to_string(), self.timeout)
+
+
+def bytecode_cache(config: Any) -> bccache.BytecodeCache | None:
+    """
+    Return a bytecode cache instance for the given configuration.
+
+    The configuration may be a bytecode cache instance, an import path or a dictionary with a
+    ``BACKEND`` import path and optional ``OPTIONS``.
+    """
+    if config is None or isinstance(config, bccache.BytecodeCache):
+        return config
+    if isinstance(config, str):
+        config = {'BACKEND': config}
+    cache_class: type[bccache.BytecodeCache] = import_string(config['BACKEND'])
+    return cache_class(**config.get('OPTIONS', {}))
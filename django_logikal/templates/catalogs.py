@@ -0,0 +1,185 @@
+import json
+import re
+from collections.abc import Callable, Iterable, Set
+from functools import cache, partial
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from babel.messages.extract import DEFAULT_KEYWORDS, extract
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils import translation
+from django.utils.translation.trans_real import DjangoTranslation
+from django.views.i18n import JavaScriptCatalog
+from logikal_utils.operators import unique
+
+from django_logikal.templates.components import COMPONENTS_JS_PATH, STATIC_PATH
+from django_logikal.templates.finders import GeneratedFileFinder
+
+CATALOGS_PATH = Path('django_logikal/i18n')
+GETTEXT_IMPORT_PATTERN = re.compile(
+    r'^\s*import\s*\{(?P<names>[^}]*)\}\s*from\s*[\'"][^\'"]*\bgettext\.mjs[\'"]',
+    re.MULTILINE,
+)
+CATALOG_FRAGMENT_TEMPLATE = """'use strict';
+{
+  const globals = this;
+  const django = globals.django || (globals.django = {});
+  django.catalog = Object.assign(django.catalog || {}, %s);
+}
+"""
+
+
+def _supported_language(language_code: str | None) -> str:
+    if (language_code := language_code or settings.LANGUAGE_CODE) not in dict(settings.LANGUAGES):
+        language_code = translation.get_supported_language_variant(language_code)
+    return language_code
+
+
+def catalog_file(language_code: str | None, base: bool = False) -> Path:
+    """
+    Return the static path of the JavaScript catalog of a given language.
+
+    The closest language in the ``LANGUAGES`` setting is used for other languages, and the
+    language defaults to the ``LANGUAGE_CODE`` setting.
+
+    Args:
+        language_code: The language to use.
+        base: Whether to return the path of the catalog that contains no messages (see
+            :func:`catalog_fragment_file`).
+
+    """
+    suffix = '.base.js' if base else '.js'
+    return CATALOGS_PATH / f'djangojs.{_supported_language(language_code)}{suffix}'
+
+
+def catalog_fragment_file(language_code: str | None, module: Path) -> Path:
+    """
+    Return the static path of the JavaScript catalog fragment of a given language and module.
+
+    Catalog fragments only contain the messages of a single component script (see
+    :func:`module_messages`), and they must be loaded after the base catalog of the language.
+    """
+    return CATALOGS_PATH / _supported_language(language_code) / module.with_suffix('.js')
+
+
+@cache
+def module_messages(module: Path) -> tuple[str, ...]:
+    """
+    Return the catalog keys of the messages that a given component script translates.
+
+    Only the translation functions that the script imports from the ``gettext.mjs`` module are
+    considered. Messages with a context are returned with the context prefix that Django uses.
+    """
+    content = (STATIC_PATH / module).read_text(encoding='utf-8')
+    keywords = {}
+    for match in GETTEXT_IMPORT_PATTERN.finditer(content):
+        for name in match.group('names').split(','):
+            imported, _, alias = (part.strip() for part in name.partition(' as '))
+            if imported in DEFAULT_KEYWORDS:
+                keywords[alias or imported] = DEFAULT_KEYWORDS[imported]
+    if not keywords:
+        return ()
+    messages = []
+    for _, message, _, context in extract(
+        'javascript', BytesIO(content.encode('utf-8')), keywords=keywords,
+    ):
+        message_id = message[0] if isinstance(message, tuple) else message
+        messages.append(f'{context}\x04{message_id}' if context else message_id)
+    return tuple(unique(messages))
+
+
+def component_scripts() -> list[Path]:
+    """
+    Return the static paths of the component scripts.
+    """
+    return sorted(
+        file.relative_to(STATIC_PATH) for file in (STATIC_PATH / COMPONENTS_JS_PATH).rglob('*.mjs')
+    )
+
+
+class _MessageCatalog(JavaScriptCatalog):
+    messages: Set[str] | None = None
+
+    def get_catalog(self) -> dict[str, Any]:
+        catalog: dict[str, Any] = super().get_catalog()
+        if self.messages is None:
+            return catalog
+        return {
+            key: value for key, value in catalog.items()
+            if key in self.messages  # pylint: disable=unsupported-membership-test
+        }
+
+
+def javascript_catalog(language_code: str, messages: Iterable[str] | None = None) -> str:
+    """
+    Return the JavaScript catalog of a given language.
+
+    The catalog is identical to the one served by Django's
+    :class:`~django.views.i18n.JavaScriptCatalog` view, unless the messages to include are
+    specified.
+    """
+    request = HttpRequest()
+    request.method = 'GET'
+    view = _MessageCatalog.as_view(messages=None if messages is None else frozenset(messages))
+    with translation.override(language_code):
+        response = view(request)
+    return str(response.content.decode(response.charset))  # type: ignore[attr-defined]
+
+
+def catalog_fragment(language_code: str, messages: Iterable[str]) -> str:
+    """
+    Return a JavaScript catalog fragment that adds the given messages of a given language.
+    """
+    view = _MessageCatalog(messages=frozenset(messages))
+    with translation.override(language_code):
+        view.translation = DjangoTranslation(  # pylint: disable=attribute-defined-outside-init
+            language_code, domain=view.domain,
+        )
+        catalog = view.get_catalog()
+    return CATALOG_FRAGMENT_TEMPLATE % json.dumps(catalog, ensure_ascii=False, sort_keys=True)
+
+
+def catalog_files() -> dict[Path, Callable[[], str]]:
+    """
+    Return the static paths of the JavaScript catalogs along with their content generators.
+
+    Each language in the ``LANGUAGES`` setting has a full catalog, a base catalog and a catalog
+    fragment for each component script that translates messages.
+    """
+    files: dict[Path, Callable[[], str]] = {}
+    for language_code, _ in settings.LANGUAGES:
+        files[catalog_file(language_code)] = partial(javascript_catalog, language_code)
+        files[catalog_file(language_code, base=True)] = partial(
+            javascript_catalog, language_code, messages=(),
+        )
+        for module in component_scripts():
+            if messages := module_messages(module):
+                files[catalog_fragment_file(language_code, module)] = partial(
+                    catalog_fragment, language_code, messages,
+                )
+    return files
+
+
+class JavaScriptCatalogFinder(GeneratedFileFinder):
+    """
+    Provide the JavaScript catalogs of the languages in the ``LANGUAGES`` setting as static files.
+
+    The catalogs and catalog fragments (see :func:`catalog_files`) are generated (and thus
+    collected) by the ``collectstatic`` command, so that they can be served with hashed file names
+    and far-future caching. They are regenerated whenever they are looked up (for example, during
+    development).
+
+    .. note:: The finder must be added to the ``STATICFILES_FINDERS`` setting (which is done
+        automatically by the standard settings modules).
+    """
+    directory_prefix = 'django-logikal-catalogs-'
+
+    def content(self, path: str) -> str | None:
+        if (content := catalog_files().get(Path(path))) is None:
+            return None
+        return content()
+
+    def paths(self) -> list[str]:
+        return [str(file) for file in catalog_files()]
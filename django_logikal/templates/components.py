@@ -1,12 +1,32 @@
+import json
+import os
+import posixpath
+import re
 from functools import cache
 from pathlib import Path
 
 import tinycss2
+from django.conf import settings
 from logikal_utils.operators import unique
 
 STATIC_PATH = Path(__file__).parents[1] / 'static'
 COMPONENTS_CSS_PATH = Path('django_logikal/css')
 COMPONENTS_JS_PATH = Path('django_logikal/js')
+BUNDLES_PATH = Path('django_logikal/bundles')
+FONT_TYPES = {'.woff2': 'font/woff2', '.woff': 'font/woff', '.ttf': 'font/ttf', '.otf': 'font/otf'}
+MODULE_IMPORT_PATTERN = re.compile(
+    r'^\s*(?:import|export)\s+(?:[^\'";]*?\s+from\s+)?[\'"](?P<path>\.{1,2}/[^\'"]+)[\'"]',
+    re.MULTILINE,
+)
+#: Matches the named import declarations of local modules (for example, ``import {_} from
+#: './gettext.mjs';``), which can be replaced when the modules are bundled.
+LOCAL_IMPORT_PATTERN = re.compile(
+    r'^[ \t]*import\s*\{(?P<names>[^}]*)\}\s*from\s*[\'"](?P<path>\.{1,2}/[^\'"]+\.mjs)[\'"]'
+    r'[ \t]*;?[ \t]*\n?',
+    re.MULTILINE,
+)
+#: Matches the keyword of import declarations and dynamic imports (also in comments and strings).
+IMPORT_KEYWORD_PATTERN = re.compile(r'\bimport\b')
 
 
 @cache
@@ -21,6 +41,89 @@ def _style_dependencies(file: Path) -> set[str]:
     return dependencies
 
 
+@cache
+def _font_files(file: Path) -> list[Path]:
+    fonts = []
+    for rule in tinycss2.parse_stylesheet(
+        (STATIC_PATH / file).read_text(encoding='utf-8'), skip_comments=True,
+    ):
+        if rule.type == 'at-rule' and rule.lower_at_keyword == 'font-face':
+            for token in rule.content or []:
+                if token.type == 'url':
+                    name = token.value  # type: ignore[attr-defined]
+                elif (
+                    token.type == 'function'
+                    and token.lower_name == 'url'  # type: ignore[attr-defined]
+                ):
+                    name = token.arguments[0].value  # type: ignore[attr-defined]
+                else:
+                    continue
+                font = Path(os.path.normpath(file.parent / name))
+                if font.suffix in FONT_TYPES:
+                    fonts.append(font)
+    return fonts
+
+
+@cache
+def module_dependencies(file: Path) -> list[Path]:
+    """
+    Return the JavaScript modules statically imported by a given module (recursively).
+
+    The dependencies are returned before their dependents, ending with the module itself.
+    """
+    resolved: list[Path] = []
+    visited: set[Path] = set()
+
+    def walk_dependencies(module: Path) -> None:
+        if module in visited:
+            return
+        visited.add(module)
+        content = (STATIC_PATH / module).read_text(encoding='utf-8')
+        for match in MODULE_IMPORT_PATTERN.finditer(content):
+            walk_dependencies(Path(os.path.normpath(module.parent / match.group('path'))))
+        resolved.append(module)
+
+    walk_dependencies(file)
+    return resolved
+
+
+def import_names(names: str) -> list[tuple[str, str]]:
+    """
+    Return the imported and local names of the given named import specifiers.
+
+    For example, ``_, gettext as translate`` becomes ``[('_', '_'), ('gettext', 'translate')]``.
+    """
+    specifiers = []
+    for specifier in names.split(','):
+        if specifier := specifier.strip():
+            name, _, local_name = specifier.partition(' as ')
+            specifiers.append((name.strip(), local_name.strip() or name.strip()))
+    return specifiers
+
+
+@cache
+def bundleable(file: Path) -> bool:
+    """
+    Return whether a given JavaScript module can be bundled along with its dependencies.
+
+    Modules can only be bundled when they import other modules via named import declarations of
+    local modules (see :data:`LOCAL_IMPORT_PATTERN`). Every other occurrence of the ``import``
+    keyword counts as an import, therefore the result may be a false negative but never a false
+    positive.
+    """
+    for module in module_dependencies(file):
+        content = (STATIC_PATH / module).read_text(encoding='utf-8')
+        if any(
+            name == 'default' for match in LOCAL_IMPORT_PATTERN.finditer(content)
+            for name, _ in import_names(match.group('names'))
+        ):
+            return False
+        content = LOCAL_IMPORT_PATTERN.sub('', content)
+        if IMPORT_KEYWORD_PATTERN.search(content) or MODULE_IMPORT_PATTERN.search(content):
+            return False
+    return True
+
+
 @cache
 def _component_style_dependencies() -> dict[str, list[str]]:
     module_files = {
@@ -63,6 +166,17 @@ def _component_style_dependencies() -> dict[str, list[str]]:
     }
 
 
+def component_style_files() -> list[Path]:
+    """
+    Return the style sheets of all component modules in dependency order.
+    """
+    return list(unique(
+        Path(dependency)
+        for dependencies in _component_style_dependencies().values()
+        for dependency in dependencies
+    ))
+
+
 @cache
 def component_head_files(modules: list[str]) -> dict[str, list[Path]]:
     dependencies = _component_style_dependencies()
@@ -82,4 +196,45 @@ def component_head_files(modules: list[str]) -> dict[str, list[Path]]:
         if (STATIC_PATH / js_path).exists():
             js_paths.append(js_path)
 
-    return {'css': css_paths, 'js': js_paths}
+    font_paths = list(unique(font for path in css_paths for font in _font_files(path)))
+
+    return {'css': css_paths, 'js': js_paths, 'fonts': font_paths}
+
+
+def subset_path(path: str, subset: str) -> str:
+    """
+    Return the path of a given subset of a font (see :mod:`django_logikal.fonts`).
+    """
+    root, extension = posixpath.splitext(path)
+    return f'{root}.{subset}{extension}'
+
+
+def style_key(modules: tuple[str, ...], use_standard_theme: bool) -> str:
+    """
+    Return the key that identifies the styles of a given set of modules.
+    """
+    return f'{'themed' if use_standard_theme else 'plain'}/{'.'.join(modules)}'
+
+
+def bundle_files(modules: tuple[str, ...], use_standard_theme: bool) -> dict[str, Path]:
+    """
+    Return the static paths of the style sheet and JavaScript bundles of a given set of modules.
+    """
+    return {
+        'css': BUNDLES_PATH / f'{style_key(modules, use_standard_theme=use_standard_theme)}.css',
+        'js': BUNDLES_PATH / f'{'.'.join(modules)}.mjs',
+    }
+
+
+@cache
+def critical_styles() -> dict[str, str]:
+    """
+    Return the critical styles stored at the path specified by the ``CRITICAL_CSS`` setting.
+
+    The critical styles are keyed by :func:`style_key`, an empty mapping is returned when the
+    setting is not specified or the file does not exist.
+    """
+    if not (path := getattr(settings, 'CRITICAL_CSS', None)) or not Path(path).exists():
+        return {}
+    styles: dict[str, str] = json.loads(Path(path).read_text(encoding='utf-8'))
+    return styles
@@ -0,0 +1,156 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from html.parser import HTMLParser
+from pathlib import Path
+
+from django.conf import settings
+from django.test import Client
+from django.urls import NoReverseMatch, URLPattern, URLResolver, get_resolver, reverse
+from django.utils import translation
+
+from django_logikal.templates.bundles import component_styles, minify_css
+from django_logikal.templates.components import STATIC_PATH, style_key
+from django_logikal.templates.template import TemplatePageView
+
+ComponentHead = tuple[tuple[str, ...], bool]
+
+#: The default maximum size of the critical styles of a ``component_head`` call in bytes, which
+#: roughly corresponds to the initial congestion window of the connection.
+CRITICAL_CSS_MAX_SIZE = 14 * 1024
+#: The default maximum size of the critical styles relative to all styles of the modules.
+CRITICAL_CSS_MAX_RATIO = 0.75
+
+
+class _PageSelectorParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.selectors: set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.selectors.add(tag)
+        for name, value in attrs:
+            self.selectors.add(f'[{name}]')
+            if name == 'class' and value:
+                self.selectors.update(f'.{class_name}' for class_name in value.split())
+            elif name == 'id' and value:
+                self.selectors.add(f'#{value}')
+
+
+def page_selectors(html: str) -> set[str]:
+    """
+    Return the tag names, classes, identifiers and attribute names used on a given page.
+
+    The names are returned as simple CSS selectors (for example, ``div``, ``.menu``, ``#main`` and
+    ``[href]``).
+    """
+    parser = _PageSelectorParser()
+    parser.feed(html)
+    parser.close()
+    return parser.selectors
+
+
+def critical_css(
+    modules: tuple[str, ...],
+    selectors: set[str] | None,
+    use_standard_theme: bool = True,
+) -> str:
+    """
+    Return the styles of a given set of component modules that may match a page.
+
+    The style rules are kept when all tag names, classes, identifiers and attribute names in any of
+    their selectors are used on the page (see :func:`page_selectors`), or when no selectors are
+    provided. Relative URLs are replaced with static file URLs, so that the styles can be inlined
+    into the page. Font faces are removed when the fonts are split into subsets (see
+    :mod:`django_logikal.fonts`), as they would reference the original fonts.
+    """
+    font_faces = not getattr(settings, 'FONT_SUBSETTING', False)
+
+    def minify(file: Path) -> str:
+        css = (STATIC_PATH / file).read_text(encoding='utf-8')
+        return minify_css(
+            css, base=str(file.parent), selectors=selectors, static_urls=True,
+            font_faces=font_faces,
+        )
+
+    return component_styles(modules, minify=minify, use_standard_theme=use_standard_theme)
+
+
+def _template_view_names(
+    patterns: Iterable[URLPattern | URLResolver],
+    namespace: str = '',
+) -> Iterator[str]:
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            prefix = f'{namespace}{pattern.namespace}:' if pattern.namespace else namespace
+            yield from _template_view_names(pattern.url_patterns, namespace=prefix)
+        elif pattern.name and issubclass(
+            getattr(pattern.callback, 'view_class', object), TemplatePageView,
+        ):
+            yield f'{namespace}{pattern.name}'
+
+
+def template_pages() -> Iterator[str]:
+    """
+    Return the paths of the template pages without URL parameters in the active language.
+
+    Template pages are added via the ``path`` and ``static_path`` methods of
+    ``Template`` instances.
+    """
+    for name in dict.fromkeys(_template_view_names(get_resolver().url_patterns)):
+        try:
+            yield reverse(name)
+        except NoReverseMatch:
+            continue
+
+
+def _server_name() -> str:
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*':
+            return host.removeprefix('.')
+    return 'localhost'
+
+
+def _within_budget(css: str, modules: tuple[str, ...], use_standard_theme: bool) -> bool:
+    size = len(css.encode())
+    full_css = critical_css(modules, selectors=None, use_standard_theme=use_standard_theme)
+    return (
+        size <= getattr(settings, 'CRITICAL_CSS_MAX_SIZE', CRITICAL_CSS_MAX_SIZE)
+        and size <= getattr(settings, 'CRITICAL_CSS_MAX_RATIO', CRITICAL_CSS_MAX_RATIO)
+        * len(full_css.encode())
+    )
+
+
+def extract_critical_css() -> dict[str, str]:
+    """
+    Render the template pages in each language and return their critical component styles.
+
+    The pages are requested via the Django test client, so that they are rendered by the full
+    request handler (including the middleware) as anonymous users. The critical styles of a given
+    ``component_head`` call are the styles that may match any element of any of the pages that use
+    it, keyed by :func:`~django_logikal.templates.components.style_key`. Note that the styles are
+    not limited to the elements above the fold, as the pages are not laid out.
+
+    The critical styles are left out when they exceed the ``CRITICAL_CSS_MAX_SIZE`` setting (in
+    bytes, see :data:`CRITICAL_CSS_MAX_SIZE`) or the ``CRITICAL_CSS_MAX_RATIO`` setting (relative
+    to all styles of the modules, see :data:`CRITICAL_CSS_MAX_RATIO`), as the style sheets are
+    loaded in full afterwards.
+    """
+    page_selectors_by_head: defaultdict[ComponentHead, set[str]] = defaultdict(set)
+    for language_code, _ in settings.LANGUAGES:
+        client = Client(SERVER_NAME=_server_name(), HTTP_ACCEPT_LANGUAGE=language_code)
+        with translation.override(language_code):
+            for path in template_pages():
+                response = client.get(path)
+                if response.status_code != 200:
+                    continue
+                selectors = page_selectors(response.content.decode(response.charset))
+                component_heads = response.wsgi_request.__dict__.get('_component_heads', [])
+                for component_head in component_heads:
+                    page_selectors_by_head[component_head].update(selectors)
+
+    styles = {}
+    for (modules, use_standard_theme), selectors in sorted(page_selectors_by_head.items()):
+        css = critical_css(modules, selectors=selectors, use_standard_theme=use_standard_theme)
+        if _within_budget(css, modules, use_standard_theme=use_standard_theme):
+            styles[style_key(modules, use_standard_theme=use_standard_theme)] = css
+    return styles
@@ -0,0 +1,92 @@
+from collections.abc import Callable, Iterable
+
+from jinja2 import TemplateNotFound, TemplateSyntaxError, meta
+from jinja2.environment import Environment
+
+
+def _closure(references: Callable[[str], set[str]], name: str) -> set[str]:
+    found: set[str] = set()
+
+    def visit(current: str) -> None:
+        for neighbour in references(current) - found:
+            found.add(neighbour)
+            visit(neighbour)
+
+    visit(name)
+    found.discard(name)
+    return found
+
+
+class DependencyGraph:
+    """
+    Track the templates referenced via ``extends``, ``include``, ``import`` and ``from`` tags.
+
+    Templates are only parsed when their dependencies are first requested. Templates that
+    reference other templates dynamically (for example, via a variable) or that cannot be parsed
+    are considered to depend on every template.
+
+    Args:
+        env: The environment to use for parsing the templates.
+        template_names: The names of the templates to consider when looking up dependents.
+
+    """
+    def __init__(self, env: Environment, template_names: Iterable[str]):
+        self._env = env
+        self._template_names = set(template_names)
+        self._dependencies: dict[str, set[str]] = {}
+        self._dynamic: set[str] = set()
+
+    def update(self, template_name: str) -> None:
+        """
+        Discard the dependencies of a given template so that they are parsed again when needed.
+        """
+        self._template_names.add(template_name)
+        self._dependencies.pop(template_name, None)
+        self._dynamic.discard(template_name)
+
+    def _references(self, template_name: str) -> set[str]:
+        if template_name in self._dependencies:
+            return self._dependencies[template_name]
+        references: set[str | None] = set()
+        try:
+            source, _, _ = self._env.loader.get_source(  # type: ignore[union-attr]
+                self._env, template_name,
+            )
+            references.update(meta.find_referenced_templates(self._env.parse(source)))
+        except TemplateNotFound:
+            pass
+        except TemplateSyntaxError:
+            self._dynamic.add(template_name)
+        if None in references:
+            self._dynamic.add(template_name)
+        self._dependencies[template_name] = {
+            reference for reference in references if reference is not None
+        }
+        return self._dependencies[template_name]
+
+    def dependencies(self, template_name: str, recursive: bool = True) -> set[str]:
+        """
+        Return the names of the templates that a given template references.
+        """
+        if not recursive:
+            return set(self._references(template_name))
+        return _closure(self._references, template_name)
+
+    def dependents(self, template_name: str, recursive: bool = True) -> set[str]:
+        """
+        Return the names of the templates that reference a given template.
+
+        Note that this parses every template of the graph.
+        """
+        dependents = {
+            name for name in self._template_names
+            if template_name in self.dependencies(name, recursive=recursive)
+            or name in self._dynamic
+        }
+        return dependents - {template_name}
+
+    def is_dynamic(self, template_name: str) -> bool:
+        """
+        Return whether a given template or its dependencies reference templates dynamically.
+        """
+        return bool({template_name, *self.dependencies(template_name)} & self._dynamic)
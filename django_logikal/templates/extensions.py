@@ -1,10 +1,17 @@
 import zoneinfo
+from collections.abc import Awaitable, Callable, Iterable
+from hashlib import md5
+from typing import Any
 
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.utils import timezone, translation
+from django.utils.csp import LazyNonce
 from jinja2 import nodes
 from jinja2.ext import Extension
 from jinja2.parser import Parser
-from jinja2.runtime import Macro
+from jinja2.runtime import Context, Macro
+from markupsafe import Markup
 
 
 class LanguageExtension(Extension):
@@ -41,3 +48,89 @@ class TimeZoneExtension(Extension):
             return caller()
         finally:
             timezone.activate(current_timezone)
+
+
+#: The placeholder of the content security policy nonce in the cached fragments.
+NONCE_PLACEHOLDER = '{{fragment-cache-csp-nonce}}'
+
+
+def fragment_cache_key(key: str, vary_on: Iterable[Any] = ()) -> str:
+    """
+    Return the cache key of a template fragment cached via the ``cache`` tag.
+
+    The key is namespaced by the currently active language and time zone.
+    """
+    vary_on_hash = md5(usedforsecurity=False)
+    for value in vary_on:
+        vary_on_hash.update(str(value).encode('utf-8'))
+        vary_on_hash.update(b':')
+    namespace = f'{translation.get_language()}:{timezone.get_current_timezone_name()}'
+    return f'jinja2.fragment:{namespace}:{key}:{vary_on_hash.hexdigest()}'
+
+
+def _insert_nonce(content: str, nonce: LazyNonce | None) -> str | None:
+    if NONCE_PLACEHOLDER not in content:
+        return content
+    return None if nonce is None else content.replace(NONCE_PLACEHOLDER, str(nonce))
+
+
+def _remove_nonce(content: str, nonce: LazyNonce | None) -> str:
+    if nonce:  # only true when the nonce has been used
+        return content.replace(str(nonce), NONCE_PLACEHOLDER)
+    return content
+
+
+class CacheExtension(Extension):
+    tags = {'cache'}
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if('comma') and not parser.stream.current.test('name:vary_on'):
+            args.append(parser.parse_expression())
+            parser.stream.skip_if('comma')
+        kwargs = [nodes.Keyword('context', nodes.ContextReference())]
+        if parser.stream.skip_if('name:vary_on'):
+            parser.stream.expect('assign')
+            kwargs.append(nodes.Keyword('vary_on', parser.parse_expression()))
+        body = parser.parse_statements(tuple(['name:endcache']), drop_needle=True)
+        block = nodes.CallBlock(self.call_method('_cache', args, kwargs), [], [], body)
+        return block.set_lineno(lineno)
+
+    def _cache(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        vary_on: Iterable[Any] = (),
+        *,
+        context: Context,
+        caller: Macro,
+    ) -> str | Awaitable[str]:
+        cache_key = fragment_cache_key(key=key, vary_on=vary_on)
+        nonce = context.get('csp_nonce')
+        if self.environment.is_async:
+            return self._cache_async(cache_key, timeout, nonce, caller)  # type: ignore[arg-type]
+        cache = caches[self.environment.policies.get('ext.cache.alias', 'default')]
+        if (cached := cache.get(cache_key)) is not None:
+            if (content := _insert_nonce(cached, nonce)) is not None:
+                return Markup(content)
+        content = caller()
+        if cached is None:
+            cache.set(cache_key, _remove_nonce(str(content), nonce), timeout)
+        return content
+
+    async def _cache_async(
+        self,
+        cache_key: str,
+        timeout: float | None,
+        nonce: LazyNonce | None,
+        caller: Callable[[], Awaitable[str]],
+    ) -> str:
+        cache = caches[self.environment.policies.get('ext.cache.alias', 'default')]
+        if (cached := await cache.aget(cache_key)) is not None:
+            if (content := _insert_nonce(cached, nonce)) is not None:
+                return Markup(content)
+        content = await caller()
+        if cached is None:
+            await cache.aset(cache_key, _remove_nonce(str(content), nonce), timeout)
+        return content
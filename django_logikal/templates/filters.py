@@ -1,15 +1,19 @@
 import re
+from collections.abc import Iterable
 from typing import Any
 
 from django.utils.html import escape
 from django.utils.safestring import SafeString, mark_safe
 from django.utils.text import slugify as django_slugify
 
+from django_logikal.templates import functions
+
 SLUGIFY_TRANSLATION = str.maketrans({
     '&': 'and',
     'ø': 'o',
     'æ': 'ae',
 })
+FORMAT_MANY_KINDS = {'decimal', 'currency', 'percent', 'datetime'}
 
 
 def upper_first(text: str) -> str:
@@ -63,6 +67,16 @@ def nowrap(text: str) -> SafeString:
     return mark_safe(escape(text).replace(' ', '&nbsp;'))  # nosec: text is escaped
 
 
+def icon(path: str) -> SafeString:
+    """
+    Insert a given icon into the template via a reference to the icon sprite.
+
+    Works like the :func:`~django_logikal.templates.functions.icon` function, which is useful when
+    the function is shadowed by a variable (for example, a macro argument called ``icon``).
+    """
+    return functions.icon(path)
+
+
 def exclude[T: list[Any] | dict[Any, Any]](iterable: T, *keys: Any) -> T:
     """
     Return the given list or dictionary without the specified keys.
@@ -74,3 +88,27 @@ def exclude[T: list[Any] | dict[Any, Any]](iterable: T, *keys: Any) -> T:
             key: value for key, value in iterable.items() if key not in keys
         }  # type: ignore[return-value]
     raise ValueError(f'Invalid iterable type "{type(iterable)}"')
+
+
+def format_many(values: Iterable[Any], kind: str, *args: Any, **kwargs: Any) -> list[str]:
+    """
+    Format a sequence of values with the current locale and time zone.
+
+    Useful for formatting entire table columns before looping over the rows:
+
+    .. code-block:: jinja
+
+        {% set prices = rows | map(attribute='price') | format_many('currency', 'EUR') %}
+        {% set dates = rows | map(attribute='created') | format_many('datetime', 'short') %}
+
+    Args:
+        values: The values to format, for example a list or a NumPy array.
+        kind: One of ``decimal``, ``currency``, ``percent`` or ``datetime``.
+        args: The positional arguments to pass to the formatter method.
+        kwargs: The keyword arguments to pass to the formatter method.
+
+    """
+    if kind not in FORMAT_MANY_KINDS:
+        raise ValueError(f'Invalid format kind "{kind}"')
+    formatter = getattr(functions.format(), f'{kind}_many')
+    return formatter(values, *args, **kwargs)  # type: ignore[no-any-return]
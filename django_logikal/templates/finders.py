@@ -0,0 +1,67 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import Any
+from weakref import finalize
+
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.files.storage import FileSystemStorage
+
+
+class GeneratedFileFinder(BaseFinder):
+    """
+    Provide generated files as static files.
+
+    The files are generated into a temporary directory whenever they are looked up or listed. The
+    directory is removed when the finder is garbage collected or when the process exits.
+
+    Subclasses must implement :meth:`content` and :meth:`paths`.
+    """
+    #: The prefix of the name of the temporary directory.
+    directory_prefix = 'django-logikal-'
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        location = mkdtemp(prefix=self.directory_prefix)
+        self._cleanup = finalize(self, rmtree, location, ignore_errors=True)
+        self.storage = FileSystemStorage(location=location)
+
+    def content(self, path: str) -> str | None:
+        """
+        Return the content of a file with a given static path (:data:`None` if it does not exist).
+        """
+        raise NotImplementedError
+
+    def paths(self) -> Iterable[str]:
+        """
+        Return the static paths of the files to collect.
+        """
+        raise NotImplementedError
+
+    def build(self, path: str) -> bool:
+        """
+        Generate the file with a given static path, returning whether the file exists.
+        """
+        if (content := self.content(path)) is None:
+            return False
+        file_path = Path(self.storage.path(path))
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding='utf-8')
+        return True
+
+    def check(self, **kwargs: Any) -> list[Any]:
+        return []
+
+    def find(  # type: ignore[override]
+        self, path: str, find_all: bool = False,
+    ) -> str | list[str]:
+        if not self.build(path):
+            return []
+        file_path = self.storage.path(path)
+        return [file_path] if find_all else file_path
+
+    def list(self, ignore_patterns: Any) -> Iterator[tuple[str, FileSystemStorage]]:
+        for path in self.paths():
+            if self.build(path):
+                yield path, self.storage
@@ -1,32 +1,49 @@
 import os
-import re
-from collections.abc import Callable
-from datetime import datetime, tzinfo as tzinfo_class
-from functools import cache
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, date, datetime, tzinfo as tzinfo_class
+from decimal import Decimal
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 from babel import Locale
+from babel.dates import DateTimePattern, parse_pattern as parse_datetime_pattern
+from babel.numbers import NumberPattern, parse_pattern
 from babel.support import Format
+from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.http import HttpRequest
 from django.templatetags.static import static as django_static
-from django.urls import reverse
+from django.urls import URLResolver, get_resolver, get_script_prefix, get_urlconf, reverse
 from django.utils import timezone
 from django.utils.safestring import SafeString, mark_safe
 from django.utils.translation import get_language
 from faker import Faker
 from jinja2.runtime import Context
 from jinja2.utils import pass_context
+from logikal_utils.operators import unique
 
 import django_logikal  # for type checking
-from django_logikal.templates.components import COMPONENTS_CSS_PATH, component_head_files
+from django_logikal.templates.catalogs import catalog_file, catalog_fragment_file, module_messages
+from django_logikal.templates.components import (
+    COMPONENTS_CSS_PATH, COMPONENTS_JS_PATH, FONT_TYPES, bundle_files, bundleable,
+    component_head_files, critical_styles, module_dependencies, style_key, subset_path,
+)
+from django_logikal.templates.icons import SPRITE_PATH, icon_id, minify_svg, svg_parts
 
 THEMES_CSS_PATH = COMPONENTS_CSS_PATH / 'themes'
 THEMES = {
     'standard-light': None,  # always loads (also as a fallback)
     'standard-dark': 'prefers-color-scheme: dark',
 }
+#: The maximum number of cached locales, formatters and number patterns.
+FORMAT_CACHE_SIZE = 128
+#: The maximum number of cached URL paths.
+URL_CACHE_SIZE = 1024
+#: The placeholder of the content security policy nonce in the cached component heads.
+CRITICAL_CSS_NONCE_PLACEHOLDER = '{{component-head-csp-nonce}}'
+
+_included_static: dict[tuple[str, Callable[[str], Path]], tuple[float, SafeString]] = {}
 
 
 @pass_context
@@ -65,17 +82,122 @@ def include_static(
 
     Useful for inlining CSS, SVG or JavaScript content.
 
+    SVG files are minified (see :func:`~django_logikal.templates.icons.minify_svg`). The
+    contents are cached in memory, and they are only reloaded in debug mode when the file
+    modification time changes.
+
     .. DANGER:: **Security risk: the contents of the referenced file are inserted unescaped.**
 
         Do not use this function to include non-trusted, user-generated or user-uploaded content,
         or content that can be in any way influenced by users.
 
     """
+    key = (path, static_path_function)
+    if not settings.DEBUG and (cached := _included_static.get(key)):
+        return cached[1]
     file_path = static_path_function(path)
+    mtime = file_path.stat().st_mtime
+    if (cached := _included_static.get(key)) and cached[0] == mtime:
+        return cached[1]
     content = file_path.read_text(encoding='utf-8').lstrip()
     if file_path.suffix == '.svg':
-        content = re.sub(r'^<\?xml [^>]*\?>', '', content).lstrip()
-    return mark_safe(content)  # nosec: danger is documented
+        content = minify_svg(content)
+    _included_static[key] = (mtime, mark_safe(content))  # nosec: danger is documented
+    return _included_static[key][1]
+
+
+def icon(
+    path: str,
+    static_path_function: Callable[[str], Path] = static_path,
+) -> SafeString:
+    """
+    Insert a given icon into the template.
+
+    The icon is inlined (see :func:`include_static`) unless the ``ICON_SPRITE`` setting is
+    ``True``, in which case it is referenced from the sprite generated by the
+    :class:`~django_logikal.templates.icons.IconSpriteFinder`, so that all icons on a page are
+    loaded with a single cacheable request. The attributes of the root element of the icon are
+    retained.
+
+    Args:
+        path: The static path of the icon, which must be in an ``icons`` folder.
+        static_path_function: The function to use for finding the icon.
+
+    .. note:: The sprite must be served from the same origin as the page, as external ``<use>``
+        references are not loaded across origins.
+
+    """
+    content = include_static(path, static_path_function=static_path_function)
+    if not getattr(settings, 'ICON_SPRITE', False):
+        return content
+    attributes, _ = svg_parts(content)
+    attributes.pop('id', None)
+    attributes_html = ''.join(f' {name}="{value}"' for name, value in attributes.items())
+    href = f'{static(str(SPRITE_PATH))}#{icon_id(path)}'
+    return mark_safe(  # nosec: the attributes come from a trusted static file
+        f'<svg{attributes_html}><use href="{href}"></use></svg>'
+    )
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _reverse(  # pylint: disable=too-many-arguments
+    viewname: Any,
+    *,
+    resolver: URLResolver,  # pylint: disable=unused-argument
+    urlconf: Any,
+    args: tuple[tuple[type, Any], ...],
+    kwargs: tuple[tuple[str, tuple[type, Any]], ...],
+    current_app: str | None,
+    language_code: str | None,  # pylint: disable=unused-argument
+    script_prefix: str,  # pylint: disable=unused-argument
+) -> str:
+    return reverse(
+        viewname,
+        urlconf=urlconf,
+        args=[arg for _, arg in args],
+        kwargs={key: value for key, (_, value) in kwargs},
+        current_app=current_app,
+    )
+
+
+def _cached_reverse(
+    viewname: Any,
+    urlconf: Any = None,
+    args: Sequence[Any] | None = None,
+    kwargs: dict[str, Any] | None = None,
+    current_app: str | None = None,
+    **options: Any,
+) -> str:
+    if options:  # query and fragment arguments
+        return reverse(viewname, urlconf, args, kwargs, current_app, **options)
+    urlconf = urlconf or get_urlconf()
+    # the arguments are keyed by their types, as equal values (for example, 1, 1.0 and True) may
+    # produce different URLs
+    cache_args = tuple((type(arg), arg) for arg in args or ())
+    cache_kwargs = tuple(sorted(
+        (key, (type(value), value)) for key, value in (kwargs or {}).items()
+    ))
+    try:
+        hash((viewname, urlconf, cache_args, cache_kwargs, current_app))
+    except TypeError:  # unhashable arguments
+        return reverse(viewname, urlconf, args, kwargs, current_app)
+    return _reverse(
+        viewname,
+        # the resolver changes whenever the URL configuration caches are cleared
+        resolver=get_resolver(urlconf),
+        urlconf=urlconf,
+        args=cache_args,
+        kwargs=cache_kwargs,
+        current_app=current_app,
+        language_code=get_language(),
+        script_prefix=get_script_prefix(),
+    )
+
+
+def _query_string(request: HttpRequest) -> str:
+    if '_url_query_string' not in request.__dict__:
+        request.__dict__['_url_query_string'] = request.GET.urlencode(safe='/')
+    return str(request.__dict__['_url_query_string'])
 
 
 def url(
@@ -88,16 +210,33 @@ def url(
     Return the absolute server URL path associated with the given view name.
 
     HTTP GET parameters are automatically appended when the request is provided.
+
+    .. note:: The URL paths are cached per URL configuration, language and script prefix. The
+        cache statistics are available via :func:`url_cache_info`.
+
     """
-    path = reverse(*args, **kwargs)
+    path = _cached_reverse(*args, **kwargs)
     if request:
-        request_get = request.GET.copy()
-        request_get.update(request_get_update or {})
-        if request_get:
-            path = '?'.join([path, request_get.urlencode(safe='/')])
+        if request_get_update:
+            request_get = request.GET.copy()
+            request_get.update(request_get_update)
+            query_string = request_get.urlencode(safe='/')
+        else:
+            query_string = _query_string(request)
+        if query_string:
+            path = '?'.join([path, query_string])
     return path
 
 
+def url_cache_info() -> dict[str, int]:
+    """
+    Return the hit, miss, maximum size and current size statistics of the URL path cache.
+
+    .. note:: This function is not available in templates.
+    """
+    return _reverse.cache_info()._asdict()  # pylint: disable=missing-kwoa
+
+
 def url_name(request: HttpRequest) -> str:
     """
     Return the view name associated with the current request.
@@ -114,11 +253,147 @@ def language() -> str:
     return get_language()
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _number_pattern(pattern: str) -> NumberPattern:
+    return parse_pattern(pattern)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _datetime_pattern(locale: Locale, pattern: str) -> DateTimePattern:
+    if pattern in {'full', 'long', 'medium', 'short'}:
+        pattern = (
+            locale.datetime_formats[pattern]
+            .replace('{0}', locale.time_formats[pattern].pattern)
+            .replace('{1}', locale.date_formats[pattern].pattern)
+        )
+    return parse_datetime_pattern(pattern)
+
+
+class LocaleFormat(Format):
+    """
+    A locale-aware and time zone-aware formatter that reuses parsed number patterns.
+    """
+    def decimal(
+        self,
+        number: float | Decimal | str,
+        format: str | None = None,  # pylint: disable=redefined-outer-name
+    ) -> str:
+        pattern = _number_pattern(format) if format else None
+        return super().decimal(number, pattern)  # type: ignore[arg-type]
+
+    def percent(
+        self,
+        number: float | Decimal | str,
+        format: str | None = None,  # pylint: disable=redefined-outer-name
+    ) -> str:
+        pattern = _number_pattern(format) if format else None
+        return super().percent(number, pattern)  # type: ignore[arg-type]
+
+    def decimal_many(
+        self,
+        numbers: Iterable[float | Decimal | str],
+        format: str | None = None,  # pylint: disable=redefined-outer-name
+    ) -> list[str]:
+        """
+        Return a list of decimal numbers formatted for the locale.
+
+        Args:
+            numbers: The numbers to format, for example a list or a NumPy array.
+            format: The number pattern to use. Defaults to the decimal pattern of the locale.
+
+        """
+        pattern = _number_pattern(format) if format else self.locale.decimal_formats[None]
+        return [
+            pattern.apply(number, self.locale, numbering_system=self.numbering_system)
+            for number in numbers
+        ]
+
+    def currency_many(
+        self,
+        numbers: Iterable[float | Decimal | str],
+        currency: str,
+    ) -> list[str]:
+        """
+        Return a list of numbers in the given currency formatted for the locale.
+
+        Args:
+            numbers: The numbers to format, for example a list or a NumPy array.
+            currency: The currency code to use.
+
+        """
+        pattern = self.locale.currency_formats['standard']
+        return [
+            pattern.apply(
+                number,
+                self.locale,
+                currency=currency,
+                currency_digits=True,
+                numbering_system=self.numbering_system,
+            )
+            for number in numbers
+        ]
+
+    def percent_many(
+        self,
+        numbers: Iterable[float | Decimal | str],
+        format: str | None = None,  # pylint: disable=redefined-outer-name
+    ) -> list[str]:
+        """
+        Return a list of numbers formatted as percentages for the locale.
+
+        Args:
+            numbers: The numbers to format, for example a list or a NumPy array.
+            format: The number pattern to use. Defaults to the percent pattern of the locale.
+
+        """
+        pattern = _number_pattern(format) if format else self.locale.percent_formats[None]
+        return [
+            pattern.apply(number, self.locale, numbering_system=self.numbering_system)
+            for number in numbers
+        ]
+
+    def datetime_many(
+        self,
+        datetimes: Iterable[date],
+        format: str = 'medium',  # pylint: disable=redefined-outer-name
+    ) -> list[str]:
+        """
+        Return a list of dates and times formatted for the locale and the time zone.
+
+        Args:
+            datetimes: The dates and times to format. Naive values are assumed to be in UTC.
+            format: One of ``full``, ``long``, ``medium`` or ``short``, or a date and time pattern.
+
+        """
+        pattern = _datetime_pattern(self.locale, format)
+        return [
+            pattern.apply(self._localize(value), self.locale)
+            for value in datetimes
+        ]
+
+    def _localize(self, value: date) -> datetime:
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, datetime.min.time())
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.astimezone(self.tzinfo) if self.tzinfo else value
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _locale(language_code: str) -> Locale:
+    return Locale.parse(language_code, sep='-')
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _formatter(locale: Locale, tzinfo: tzinfo_class) -> LocaleFormat:
+    return LocaleFormat(locale=locale, tzinfo=tzinfo)
+
+
 def format(  # pylint: disable=redefined-builtin
     locale: Locale | None = None,
     language_code: str | None = None,
     tzinfo: tzinfo_class | None = None,
-) -> Format:
+) -> 'LocaleFormat':
     """
     Return a locale-aware and time zone-aware formatter.
 
@@ -133,6 +408,15 @@ def format(  # pylint: disable=redefined-builtin
             ... {{ fmt.decimal(number) }} ...
             ... {{ fmt.datetime(timestamp) }} ...
 
+        Whole sequences can be formatted at once with the ``decimal_many``, ``currency_many``,
+        ``percent_many`` and ``datetime_many`` methods (or the
+        :func:`~django_logikal.templates.filters.format_many` filter), which reuse the same
+        pattern for every value:
+
+        .. code-block:: jinja
+
+            {% set prices = fmt.currency_many(rows | map(attribute='price'), 'EUR') %}
+
         Note that the current locale can be influenced with the ``language`` tag, while the current
         time zone can be influenced with the ``timezone`` tag:
 
@@ -148,9 +432,11 @@ def format(  # pylint: disable=redefined-builtin
             {% endtimezone %}
             {% endlanguage %}
 
+    .. note:: Locales and formatters are cached, so calling this function repeatedly is cheap.
+
     """
-    return Format(
-        locale=locale or Locale.parse(language_code or get_language(), sep='-'),
+    return _formatter(
+        locale=locale or _locale(language_code or get_language()),
         tzinfo=tzinfo or timezone.get_current_timezone(),
     )
 
@@ -217,59 +503,208 @@ def faker_factory(seed: int = 0) -> Faker:
     return faker
 
 
-@cache
-def component_head(
-    *modules: str, use_standard_theme: bool = True, static_site: bool = False,
-) -> SafeString:
-    """
-    Return the relevant ``<link>`` and ``<script>`` elements for a given set of component modules.
+def _style_link(
+    file: str,
+    media: str | None = None,
+    separator: str = ' ',
+    deferred: bool = False,
+) -> str:
+    media = f'({media})' if media else None
+    if deferred:
+        return (
+            f'<link rel="stylesheet" href="{file}"{separator}media="print"'
+            f' data-media="{media or 'all'}">'
+        )
+    return f'<link rel="stylesheet" href="{file}"' + (
+        f'{separator}media="{media}"' if media else ''
+    ) + '>'
 
-    Args:
-        *modules: The component modules to use.
-        use_standard_theme: Whether to use the standard light and dark theme.
-        static_site: Whether this is a static site.
 
-    """
+@cache
+def _component_head(  # pylint: disable=too-many-arguments, too-many-locals
+    modules: tuple[str, ...],
+    *,
+    use_standard_theme: bool,
+    static_site: bool,
+    preload_fonts: bool,
+    bundle: bool,
+    font_subset: str | None,
+    catalog_fragments: bool,
+    language_code: str | None,
+    script_prefix: str,  # pylint: disable=unused-argument
+) -> tuple[SafeString, tuple[str, ...]]:
     links = []
+    preload_links = []
+
+    head_files = component_head_files(modules)
+    js_modules = [COMPONENTS_JS_PATH / 'gettext.mjs'] if head_files['js'] else []
+    css_files = head_files['css']
+    js_files = [*js_modules, *head_files['js']]
+    module_files = [
+        static(str(dependency)) for dependency in unique(
+            dependency for module in js_files for dependency in module_dependencies(module)
+        )
+    ]
+    if bundle:
+        bundles = bundle_files(modules, use_standard_theme=use_standard_theme)
+        css_files = [bundles['css']]
+        if js_files and all(bundleable(file) for file in js_files):  # see bundle_js()
+            js_files = [bundles['js']]
+            module_files = [static(str(bundles['js']))]
+    font_files = {
+        static(subset_path(str(font), font_subset) if font_subset else str(font)):
+        FONT_TYPES[font.suffix]
+        for font in (head_files['fonts'] if preload_fonts else [])
+    }
+
+    # Add preload hints
+    if font_files or module_files:
+        font_links = [
+            f'<link rel="preload" href="{file}" as="font" type="{font_type}" crossorigin>'
+            for file, font_type in font_files.items()
+        ]
+        module_links = [f'<link rel="modulepreload" href="{file}">' for file in module_files]
+        links.extend([
+            '<!-- Preloads -->', *font_links, *module_links, '<!-- End of preloads -->', '',
+        ])
+        preload_links.extend([
+            f'<{file}>; rel=preload; as=font; type="{font_type}"; crossorigin'
+            for file, font_type in font_files.items()
+        ])
+        preload_links.extend([f'<{file}>; rel=modulepreload' for file in module_files])
+
+    # Add critical styles
+    critical_css = critical_styles().get(style_key(modules, use_standard_theme=use_standard_theme))
+    if critical_css:
+        links.extend([
+            '<!-- Critical styles -->',
+            f'<style nonce="{CRITICAL_CSS_NONCE_PLACEHOLDER}">{critical_css.strip()}</style>',
+            '<!-- End of critical styles -->',
+            '',
+        ])
 
     # Add style sheets
-    if use_standard_theme:
+    style_files: dict[str, str | None] = {}
+    if use_standard_theme and not bundle:
         theme_files = {
             static(str((THEMES_CSS_PATH / theme).with_suffix('.css'))): media
             for theme, media in THEMES.items()
         }
         theme_links = [
-            f'<link rel="stylesheet" href="{file}"'
-            + (f'\n      media="({media})"' if media else '')
-            + '>'
+            _style_link(file, media, separator='\n      ', deferred=bool(critical_css))
             for file, media in theme_files.items()
         ]
         links.extend(['<!-- Theme styles -->', *theme_links, '<!-- End of theme styles -->', ''])
+        preload_links.extend([
+            f'<{file}>; rel=preload; as=style' for file, media in theme_files.items() if not media
+        ])
+        style_files.update(theme_files)
 
-    head_files = component_head_files(modules)
-    style_links = [
-        f'<link rel="stylesheet" href="{static(str(file))}">'
-        for file in head_files['css']
-    ]
+    component_files = [static(str(file)) for file in css_files]
+    style_links = [_style_link(file, deferred=bool(critical_css)) for file in component_files]
     links.extend(['<!-- Component styles -->', *style_links, '<!-- End of component styles -->'])
+    preload_links.extend([f'<{file}>; rel=preload; as=style' for file in component_files])
+    style_files.update(dict.fromkeys(component_files))
 
-    # Add JavaScript modules
-    js_modules = ['django_logikal/js/gettext.mjs']
+    if critical_css:  # the style sheets are applied by a script once loaded
+        styles_module = static(str(COMPONENTS_JS_PATH / 'styles.mjs'))
+        fallback_links = [_style_link(file, media) for file, media in style_files.items()]
+        links.extend([
+            f'<script type="module" src="{styles_module}"></script>',
+            '<noscript>', *fallback_links, '</noscript>',
+        ])
 
+    # Add JavaScript modules
     if scripts := [
         f'<script type="module" src="{static(str(file))}"></script>'
-        for file in head_files['js']
+        for file in js_files
     ]:
-        js_modules = [
-            f'<script type="module" src="{static(str(module))}"></script>'
-            for module in js_modules
-        ]
-        scripts = js_modules + scripts
         if not static_site:
-            scripts = [f'<script defer src="{reverse('js-i18n-catalog')}"></script>', *scripts]
+            catalogs = [catalog_file(language_code, base=catalog_fragments)]
+            if catalog_fragments:
+                catalogs.extend(
+                    catalog_fragment_file(language_code, module) for module in unique(
+                        dependency for module in [*js_modules, *head_files['js']]
+                        for dependency in module_dependencies(module)
+                    ) if module_messages(module)
+                )
+            scripts = [
+                *(f'<script defer src="{static(str(file))}"></script>' for file in catalogs),
+                *scripts,
+            ]
 
         links.extend([
             '', '<!-- Component scripts -->', *scripts, '<!-- End of component scripts -->',
         ])
 
-    return mark_safe('\n'.join(links) + '\n')  # nosec: component links are safe
+    html = mark_safe('\n'.join(links) + '\n')  # nosec: component links are safe
+    return html, tuple(preload_links)
+
+
+@pass_context
+def component_head(  # pylint: disable=redefined-outer-name
+    context: Context,
+    *modules: str,
+    use_standard_theme: bool = True,
+    static_site: bool = False,
+    preload_fonts: bool = True,
+    bundle: bool = False,
+) -> SafeString:
+    # noqa: D400, D402, D415
+    """
+    component_head(*modules, use_standard_theme=True, static_site=False, preload_fonts=True, \
+bundle=False)
+
+    Return the relevant ``<link>`` and ``<script>`` elements for a given set of component modules.
+
+    The fonts of the component styles are preloaded (only their ``latin`` subset when the fonts are
+    split into subsets, see :mod:`django_logikal.fonts`), and JavaScript modules are preloaded
+    along with their dependencies. The JavaScript translation catalog of the current language is
+    loaded as a static file on dynamic sites (see
+    :class:`~django_logikal.templates.catalogs.JavaScriptCatalogFinder`), which only contains the
+    messages of the component scripts when the ``JS_I18N_CATALOG_FRAGMENTS`` setting is ``True``.
+    The result is cached for each language.
+
+    When critical styles are available for the given modules (see
+    :func:`~django_logikal.templates.critical.extract_critical_css`), they are inlined with the
+    content security policy nonce of the current request, and the style sheets are loaded
+    asynchronously instead.
+
+    Args:
+        context: The current template context (provided automatically).
+        *modules: The component modules to use.
+        use_standard_theme: Whether to use the standard light and dark theme.
+        static_site: Whether this is a static site.
+        preload_fonts: Whether to preload the fonts of the component styles.
+        bundle: Whether to use a single style sheet and JavaScript bundle for all modules (see
+            :class:`~django_logikal.templates.bundles.ComponentBundleFinder`). The scripts are
+            only bundled when none of them imports other modules.
+
+    .. tip:: The :class:`~django_logikal.templates.preload.PreloadMiddleware` can be used to
+        send the preloaded resources in the ``Link`` header as well.
+
+    """
+    html, preload_links = _component_head(
+        modules,
+        use_standard_theme=use_standard_theme,
+        static_site=static_site,
+        preload_fonts=preload_fonts,
+        bundle=bundle,
+        font_subset=(
+            'latin' if getattr(settings, 'FONT_SUBSETTING', False) and not settings.DEBUG else None
+        ),
+        catalog_fragments=getattr(settings, 'JS_I18N_CATALOG_FRAGMENTS', False),
+        language_code=get_language(),
+        script_prefix=get_script_prefix(),
+    )
+    if (request := context.get('request')) is not None:
+        request.__dict__.setdefault('_preload_links', []).extend(preload_links)
+        request.__dict__.setdefault('_component_heads', []).append(
+            (modules, use_standard_theme),
+        )
+    if CRITICAL_CSS_NONCE_PLACEHOLDER in html:
+        nonce = context.get('csp_nonce')
+        html = mark_safe(html.replace(  # nosec: the nonce is safe
+            f' nonce="{CRITICAL_CSS_NONCE_PLACEHOLDER}"', f' nonce="{nonce}"' if nonce else '',
+        ))
+    return html
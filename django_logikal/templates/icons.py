@@ -0,0 +1,120 @@
+import re
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
+
+from django.contrib.staticfiles import finders
+
+from django_logikal.templates.finders import GeneratedFileFinder
+
+SPRITE_PATH = Path('django_logikal/sprite.svg')
+SVG_PATTERN = re.compile(r'^<svg\b(?P<attributes>[^>]*)>(?P<content>.*)</svg>$', re.DOTALL)
+SVG_ATTRIBUTE_PATTERN = re.compile(r'\s+(?P<name>[\w:.-]+)="(?P<value>[^"]*)"')
+SVG_ID_PATTERN = re.compile(r'\bid="(?P<id>[^"]+)"')
+SVG_MINIFY_PATTERNS = [
+    (re.compile(r'^\s*<\?xml [^>]*\?>'), ''),  # XML prolog
+    (re.compile(r'<!DOCTYPE [^>]*>'), ''),  # document type declarations
+    (re.compile(r'<!--.*?-->', re.DOTALL), ''),  # comments
+    (re.compile(r'>\s*\n\s*<'), '><'),  # indentation between tags
+]
+
+
+def minify_svg(content: str) -> str:
+    """
+    Remove the XML prolog, document type declarations, comments and indentation from an SVG.
+    """
+    for pattern, replacement in SVG_MINIFY_PATTERNS:
+        content = pattern.sub(replacement, content)
+    return content.strip()
+
+
+def icon_id(path: str) -> str:
+    """
+    Return the identifier of the symbol of a given icon in the sprite.
+    """
+    return PurePosixPath(path).with_suffix('').as_posix().replace('/', '-')
+
+
+def svg_parts(svg: str) -> tuple[dict[str, str], str]:
+    """
+    Return the attributes of the root element and the content of a given SVG.
+    """
+    if not (match := SVG_PATTERN.match(minify_svg(svg))):
+        raise ValueError('Invalid SVG')
+    attributes = {
+        attribute.group('name'): attribute.group('value')
+        for attribute in SVG_ATTRIBUTE_PATTERN.finditer(match.group('attributes'))
+    }
+    return attributes, match.group('content')
+
+
+def icon_symbol(path: str, svg: str) -> str:
+    """
+    Return the sprite symbol of a given icon.
+
+    The identifiers of the icon elements are prefixed with the symbol identifier to avoid
+    conflicts between icons.
+    """
+    symbol_id = icon_id(path)
+    attributes, content = svg_parts(svg)
+    for element_id in SVG_ID_PATTERN.findall(content):
+        content = re.sub(
+            rf'(\bid="|url\(#|href="#){re.escape(element_id)}(?=["\)])',
+            rf'\g<1>{symbol_id}-{element_id}',
+            content,
+        )
+    view_box = f' viewBox="{attributes['viewBox']}"' if 'viewBox' in attributes else ''
+    return f'<symbol id="{symbol_id}"{view_box}>{content}</symbol>'
+
+
+def icon_files() -> dict[str, Path]:
+    """
+    Return the local paths of the icons found by the static file finders.
+
+    Icons are the SVG files in the ``icons`` folders of the static files. Icons that are found
+    earlier take precedence, just like with the ``collectstatic`` command.
+    """
+    icons: dict[str, Path] = {}
+    for finder in finders.get_finders():
+        if isinstance(finder, GeneratedFileFinder):
+            continue
+        for path, storage in finder.list(ignore_patterns=[]):
+            static_path = PurePosixPath(path.replace('\\', '/'))
+            if static_path.suffix == '.svg' and 'icons' in static_path.parts[:-1]:
+                if prefix := getattr(storage, 'prefix', None):
+                    static_path = PurePosixPath(prefix) / static_path
+                icons.setdefault(static_path.as_posix(), Path(storage.path(path)))
+    return dict(sorted(icons.items()))
+
+
+def icon_sprite(icons: Iterable[tuple[str, Path]]) -> str:
+    """
+    Return an SVG sprite that contains the symbols of the given icon paths.
+    """
+    symbols = [icon_symbol(path, file.read_text(encoding='utf-8')) for path, file in icons]
+    return ''.join([
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">',
+        *symbols,
+        '</svg>\n',
+    ])
+
+
+class IconSpriteFinder(GeneratedFileFinder):
+    """
+    Provide an SVG sprite that contains all icons of the installed apps as a static file.
+
+    The sprite is generated (and thus collected) by the ``collectstatic`` command, and it is
+    regenerated whenever it is looked up (for example, during development). Icons can be
+    referenced via the :func:`~django_logikal.templates.functions.icon` function.
+
+    .. note:: The finder must be added to the ``STATICFILES_FINDERS`` setting (which is done
+        automatically by the standard settings modules).
+    """
+    directory_prefix = 'django-logikal-sprite-'
+
+    def content(self, path: str) -> str | None:
+        if Path(path) != SPRITE_PATH:
+            return None
+        return icon_sprite(icon_files().items())
+
+    def paths(self) -> list[str]:
+        return [str(SPRITE_PATH)]
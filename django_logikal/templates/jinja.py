@@ -1,18 +1,31 @@
 # pylint: disable=import-outside-toplevel
+import asyncio
 import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import cached_property
+from itertools import chain
+from pathlib import Path
 from typing import Any
+from weakref import WeakKeyDictionary
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.http import HttpRequest
-from django.template import Origin, TemplateDoesNotExist
-from django.template.backends.jinja2 import Jinja2, Template
+from django.template import Origin, TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.backends.jinja2 import Jinja2, Template, get_exception_info
+from django.template.backends.utils import csrf_input_lazy, csrf_token_lazy
+from django.template.loader import get_template
 from django.utils import translation
+from django.utils.autoreload import BaseReloader
 from jinja2.environment import Environment, Template as EnvironmentTemplate
+from jinja2.exceptions import TemplateSyntaxError as EnvironmentTemplateSyntaxError
+from jinja2.loaders import FileSystemLoader, ModuleLoader
 from jinja2.runtime import StrictUndefined
 from logikal_utils.imports import installed
 
 from django_logikal.components import commons
-from django_logikal.templates import filters, functions, tests
+from django_logikal.templates import bytecode, dependencies, filters, functions, tests, timing
+from django_logikal.templates.loaders import IndexedFileSystemLoader
 
 DEFAULT_OPTIONS = {
     'undefined': StrictUndefined,
@@ -24,6 +37,7 @@ DEFAULT_OPTIONS = {
         'jinja2.ext.i18n',
         'django_logikal.templates.extensions.LanguageExtension',
         'django_logikal.templates.extensions.TimeZoneExtension',
+        'django_logikal.templates.extensions.CacheExtension',
     ],
 }
 
@@ -32,65 +46,318 @@ CONTEXT_PROCESSORS = [
     'django_logikal.templates.processors.add_csp_nonce',
 ]
 
+#: The minimum number of characters sent at once when streaming templates.
+STREAM_BUFFER_SIZE = 4096
+
+# The block lookups of the compiled templates (keyed by the block names) for the "#" syntax
+_block_lookups: WeakKeyDictionary[
+    EnvironmentTemplate, dict[tuple[str, ...], tuple[Callable[..., Any], ...]]
+] = WeakKeyDictionary()
+
+
+def _template_blocks(
+    template: EnvironmentTemplate,
+    block_names: tuple[str, ...],
+) -> tuple[Callable[..., Any], ...]:
+    lookups = _block_lookups.setdefault(template, {})
+    if (blocks := lookups.get(block_names)) is None:
+        for block_name in block_names:
+            if block_name not in template.blocks:
+                raise RuntimeError(f'Block "{block_name}" not found in "{template.name}"')
+        blocks = lookups[block_names] = tuple(template.blocks[name] for name in block_names)
+    return blocks
+
 
 class JinjaTemplate(Template):
     def __init__(
         self,
         template: EnvironmentTemplate,
-        backend: Jinja2,
-        block_name: str = '',
+        backend: 'JinjaTemplates',
+        block_names: Sequence[str] = (),
     ) -> None:
-        self._block_name = block_name
         super().__init__(template=template, backend=backend)
+        self._timer = backend.render_timer
+        self._block_names = tuple(block_names)
+        self._blocks = _template_blocks(template, self._block_names)
+
+    def _context(
+        self,
+        context: dict[str, Any] | None,
+        request: HttpRequest | None,
+    ) -> dict[str, Any]:
+        context = context if context is not None else {}
+        if request is not None:
+            context['request'] = request
+            context['csrf_input'] = csrf_input_lazy(request)
+            context['csrf_token'] = csrf_token_lazy(request)
+            for context_processor in self.backend.template_context_processors:
+                context.update(context_processor(request))
+        return context
+
+    def _generate_blocks(self, context: dict[str, Any]) -> Iterator[str]:
+        template_context = self.template.new_context(context)
+        return chain.from_iterable(block(template_context) for block in self._blocks)
+
+    async def _render_blocks_async(self, context: dict[str, Any]) -> str:
+        template_context = self.template.new_context(context)
+        return ''.join([
+            chunk for block in self._blocks
+            async for chunk in block(template_context)
+        ])
+
+    def _render(self, context: dict[str, Any] | None, request: HttpRequest | None) -> str:
+        if self.template.environment.is_async and _event_loop_running():
+            raise RuntimeError(
+                f'Cannot render "{self.template.name}" synchronously in a running event loop, '
+                'use render_async() instead'
+            )
+        if self._blocks:
+            context = self._context(context, request)
+            if self.template.environment.is_async:
+                return asyncio.run(self._render_blocks_async(context))
+            return ''.join(self._generate_blocks(context))
+
+        return super().render(context=context, request=request)
+
+    async def _render_async(
+        self,
+        context: dict[str, Any] | None,
+        request: HttpRequest | None,
+    ) -> str:
+        context = self._context(context, request)
+        if self._blocks:
+            return await self._render_blocks_async(context)
+        try:
+            return await self.template.render_async(context)
+        except EnvironmentTemplateSyntaxError as exc:
+            error = TemplateSyntaxError(exc.args)
+            error.template_debug = get_exception_info(exc)  # type: ignore[arg-type, attr-defined]
+            raise error from exc
+
+    def _stop_timer(self, start: float, size: int, request: HttpRequest | None) -> None:
+        self._timer.stop(
+            start,
+            template_name=str(self.template.name),
+            block_names=self._block_names,
+            size=size,
+            request=request,
+        )
+
+    def _measured(
+        self,
+        chunks: Iterator[str],
+        start: float,
+        request: HttpRequest | None,
+    ) -> Iterator[str]:
+        size = 0
+        for chunk in chunks:
+            size += len(chunk)
+            yield chunk
+        self._stop_timer(start, size=size, request=request)
 
     def render(
         self,
         context: dict[str, Any] | None = None,
         request: HttpRequest | None = None,
     ) -> str:
-        if self._block_name:
-            if self._block_name not in self.template.blocks:
-                error = f'Block "{self._block_name}" not found in "{self.template.name}"'
-                raise RuntimeError(error)
-            template_context = self.template.new_context(context)
-            blocks = self.template.blocks[self._block_name](template_context)
-            return ''.join(block for block in blocks)
+        if (start := self._timer.start()) is None:
+            return self._render(context, request)
+        content = self._render(context, request)
+        self._stop_timer(start, size=len(content), request=request)
+        return content
 
-        return super().render(context=context, request=request)
+    async def render_async(
+        self,
+        context: dict[str, Any] | None = None,
+        request: HttpRequest | None = None,
+    ) -> str:
+        """
+        Render the template asynchronously.
+
+        The template is rendered in a separate thread unless the ``enable_async`` template backend
+        option is used.
+        """
+        if not self.template.environment.is_async:
+            return await sync_to_async(self.render)(context=context, request=request)
+        if (start := self._timer.start()) is None:
+            return await self._render_async(context, request)
+        content = await self._render_async(context, request)
+        self._stop_timer(start, size=len(content), request=request)
+        return content
+
+    def stream(
+        self,
+        context: dict[str, Any] | None = None,
+        request: HttpRequest | None = None,
+    ) -> Iterator[str]:
+        """
+        Render the template and return an iterator over the rendered output chunks.
+
+        Small chunks are buffered until they reach :data:`STREAM_BUFFER_SIZE` characters. The
+        output is returned in a single chunk when the ``enable_async`` option is used.
+        """
+        context = self._context(context, request)
+        if self.template.environment.is_async:
+            chunks = iter([self._render(context, request=None)])
+        elif self._blocks:
+            chunks = self._generate_blocks(context)
+        else:
+            chunks = self.template.generate(context)
+        if (start := self._timer.start()) is not None:
+            chunks = self._measured(chunks, start, request)
+        return _buffered(chunks)
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _buffered(chunks: Iterator[str], size: int = STREAM_BUFFER_SIZE) -> Iterator[str]:
+    buffer: list[str] = []
+    buffer_size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffer_size += len(chunk)
+        if buffer_size >= size:
+            yield ''.join(buffer)
+            buffer, buffer_size = [], 0
+    if buffer:
+        yield ''.join(buffer)
 
 
 class JinjaTemplates(Jinja2):
     app_dirname = 'templates'
 
     def __init__(self, params: dict[str, Any]) -> None:
-        params = params.copy()
+        params = {**params, 'OPTIONS': params['OPTIONS'].copy()}
         self._extension = params['OPTIONS'].pop('match_extension', '.j')
+        compiled_templates = params['OPTIONS'].pop('compiled_templates', None)
+        self.compiled_templates = Path(compiled_templates) if compiled_templates else None
+        if self.compiled_templates:
+            params['OPTIONS']['loader'] = ModuleLoader(self.compiled_templates)
+        template_index = params['OPTIONS'].pop('template_index', None)
+        self.template_index = (
+            Path(template_index) if isinstance(template_index, str | Path) else None
+        )
+        index_templates = bool(template_index) and 'loader' not in params['OPTIONS']
         environment_path = f'{environment.__module__}.{environment.__qualname__}'
         params['OPTIONS'].setdefault('environment', environment_path)
         for option, value in DEFAULT_OPTIONS.items():
             params['OPTIONS'].setdefault(option, value)
         params['OPTIONS'].setdefault('context_processors', CONTEXT_PROCESSORS)
+        self.render_timer = timing.RenderTimer(**params['OPTIONS'].pop('render_timing', {}))
         super().__init__(params)
+        if index_templates:
+            self.env.loader = (
+                IndexedFileSystemLoader.from_file(self.template_index, self.template_dirs)
+                if self.template_index else IndexedFileSystemLoader(self.template_dirs)
+            )
 
     def get_template(self, template_name: str) -> Any:
-        template_name, _, block_name = template_name.partition('#')
-        if template_name.endswith(self._extension):
+        template_name, _, block_names = template_name.partition('#')
+        if self.matches_extension(template_name):
             django_template = super().get_template(template_name)
             return JinjaTemplate(
                 template=django_template.template,
-                backend=django_template.backend,
-                block_name=block_name,
+                backend=self,
+                block_names=block_names.split(',') if block_names else (),
             )
 
         origin = Origin(name=template_name, loader=self.env.loader)  # type: ignore[arg-type]
         error = f'Skipping template search as the template extension is not "{self._extension}"'
         raise TemplateDoesNotExist(template_name, tried=[(origin, error)], backend=self)
 
+    @cached_property
+    def source_env(self) -> Environment:
+        """
+        Return an environment that loads templates from their source files.
+        """
+        if not self.compiled_templates:
+            return self.env
+        return self.env.overlay(loader=FileSystemLoader(self.template_dirs))
+
+    def matches_extension(self, template_name: str) -> bool:
+        """
+        Return :data:`True` when the given template name matches the template extension.
+        """
+        return template_name.endswith(self._extension)
+
+    def template_names(self) -> list[str]:
+        """
+        Return the names of all available templates that match the template extension.
+        """
+        return self.source_env.list_templates(filter_func=self.matches_extension)
+
+    def template_path(self, template_name: str) -> str | None:
+        """
+        Return the path of a given template file without loading it.
+        """
+        if isinstance(loader := self.source_env.loader, IndexedFileSystemLoader):
+            return loader.index.get(template_name)
+        for directory in self.template_dirs:
+            if (path := Path(directory) / template_name).is_file():
+                return str(path)
+        return None
+
+    @cached_property
+    def dependency_graph(self) -> dependencies.DependencyGraph:
+        """
+        Return the dependency graph of the templates.
+        """
+        return dependencies.DependencyGraph(
+            env=self.source_env, template_names=self.template_names(),
+        )
+
+    def invalidate(self, template_names: Iterable[str]) -> None:
+        """
+        Remove the given templates from the template cache.
+        """
+        if self.env.cache is None:
+            return
+        template_names = set(template_names)
+        for key in self.env.cache.keys():
+            if key[1] in template_names:
+                del self.env.cache[key]
+
+    def template_changed(self, file_path: Path) -> bool:
+        """
+        Update the dependency graph and invalidate the affected templates after a file change.
+
+        Only the dependencies of the cached templates are parsed.
+
+        Returns :data:`True` when the file is a template of this backend.
+        """
+        file_path = file_path.resolve()
+        for template_dir in self.template_dirs:
+            if (directory := Path(template_dir).resolve()) in file_path.parents:
+                template_name = file_path.relative_to(directory).as_posix()
+                break
+        else:
+            return False
+        if isinstance(loader := self.env.loader, IndexedFileSystemLoader):
+            loader.index = loader.build_index()
+        if not self.matches_extension(template_name):
+            return False
+        graph = self.dependency_graph
+        graph.update(template_name)
+        if self.env.cache is not None:
+            self.invalidate({template_name} | {
+                name for _, name in list(self.env.cache.keys())
+                if template_name in graph.dependencies(name) or graph.is_dynamic(name)
+            })
+        return True
+
 
 def environment(**options: Any) -> Environment:
     options = {option: value for option, value in options.items() if option != 'autoescape'}
+    options['bytecode_cache'] = bytecode.bytecode_cache(options.get('bytecode_cache'))
+    cache_alias = options.pop('cache_alias', 'default')
     env = Environment(**options, autoescape=True)
-    env.policies.update({'ext.i18n.trimmed': True})
+    env.policies.update({'ext.i18n.trimmed': True, 'ext.cache.alias': cache_alias})
     # Note: we might need to use a different gettext
     # (see https://code.djangoproject.com/ticket/34602)
     env.install_gettext_callables(  # type: ignore[attr-defined] # pylint: disable=no-member
@@ -117,7 +384,9 @@ def environment(**options: Any) -> Environment:
         'unslugify': filters.unslugify,
         'wrap': filters.wrap,
         'nowrap': filters.nowrap,
+        'icon': filters.icon,
         'exclude': filters.exclude,
+        'format_many': filters.format_many,
     })
     env.tests.update({
         'startswith': tests.startswith,
@@ -134,6 +403,7 @@ def environment(**options: Any) -> Environment:
         'static': functions.static,
         'static_path': functions.static_path,
         'include_static': functions.include_static,
+        'icon': functions.icon,
         'url': functions.url,
         'url_name': functions.url_name,
         'language': functions.language,
@@ -156,3 +426,41 @@ def environment(**options: Any) -> Environment:
         })
 
     return env
+
+
+def watch_template_changes(sender: BaseReloader, **_kwargs: Any) -> None:
+    """
+    Watch the template directories of the Jinja template backends for changes.
+
+    The template backends stop checking the modification time of the used templates on each
+    render, as changed templates are invalidated via :func:`template_changed` instead.
+    """
+    for backend in engines.all():
+        if isinstance(backend, JinjaTemplates) and not backend.compiled_templates:
+            for directory in backend.template_dirs:
+                sender.watch_dir(Path(directory), '**/*')
+            backend.env.auto_reload = False
+
+
+def template_changed(file_path: Path, **_kwargs: Any) -> bool:
+    """
+    Invalidate a changed template and its dependents in the Jinja template backends.
+    """
+    changed = [
+        backend.template_changed(file_path) for backend in engines.all()
+        if isinstance(backend, JinjaTemplates) and not backend.compiled_templates
+    ]
+    return any(changed)
+
+
+def template_path(template_name: str) -> str:
+    """
+    Return the path of a given template file.
+
+    The path is looked up via the Jinja template backends first, which avoids loading the file.
+    """
+    for backend in engines.all():
+        if isinstance(backend, JinjaTemplates) and (path := backend.template_path(template_name)):
+            return path
+    # Note: both Django and Jinja2 templates have an origin attribute
+    return str(get_template(template_name).origin.name)  # type: ignore[attr-defined]
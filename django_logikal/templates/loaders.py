@@ -0,0 +1,90 @@
+import json
+import os
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from jinja2 import TemplateNotFound
+from jinja2.environment import Environment
+from jinja2.loaders import FileSystemLoader, split_template_path
+
+
+class IndexedFileSystemLoader(FileSystemLoader):
+    """
+    Load templates from the file system via an index that maps template names to file paths.
+
+    Template names are resolved with a single lookup instead of probing each search path. Templates
+    found in earlier search paths take precedence, just like with the standard file system loader.
+
+    Args:
+        searchpath: The search paths to use.
+        encoding: The encoding of the template files.
+        followlinks: Whether to follow symbolic links.
+        index: The index to use. Defaults to indexing the search paths.
+
+    """
+    def __init__(
+        self,
+        searchpath: str | os.PathLike[str] | Sequence[str | os.PathLike[str]],
+        encoding: str = 'utf-8',
+        followlinks: bool = False,
+        index: dict[str, str] | None = None,
+    ):
+        super().__init__(searchpath=searchpath, encoding=encoding, followlinks=followlinks)
+        self.index = index if index is not None else self.build_index()
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path,
+        searchpath: str | os.PathLike[str] | Sequence[str | os.PathLike[str]],
+    ) -> 'IndexedFileSystemLoader':
+        """
+        Create a loader with the index stored in a given file, if it exists.
+        """
+        index = json.loads(path.read_text(encoding='utf-8')) if path.exists() else None
+        return cls(searchpath=searchpath, index=index)
+
+    def build_index(self) -> dict[str, str]:
+        """
+        Return an index of the templates available in the search paths.
+        """
+        index: dict[str, str] = {}
+        for searchpath in self.searchpath:
+            for directory, _, file_names in os.walk(searchpath, followlinks=self.followlinks):
+                for file_name in file_names:
+                    file_path = os.path.join(directory, file_name)
+                    template_name = os.path.relpath(file_path, searchpath).replace(os.sep, '/')
+                    index.setdefault(template_name, os.path.abspath(file_path))
+        return dict(sorted(index.items()))
+
+    def save_index(self, path: Path) -> None:
+        """
+        Save the index into a given file.
+        """
+        path.write_text(json.dumps(self.index, indent=2) + '\n', encoding='utf-8')
+
+    def get_source(
+        self,
+        environment: Environment,
+        template: str,
+    ) -> tuple[str, str, Callable[[], bool]]:
+        if not (file_path := self.index.get('/'.join(split_template_path(template)))):
+            raise TemplateNotFound(template)
+        try:
+            with open(file_path, encoding=self.encoding) as file:
+                contents = file.read()
+        except FileNotFoundError as error:
+            raise TemplateNotFound(template) from error
+
+        mtime = os.path.getmtime(file_path)
+
+        def uptodate() -> bool:
+            try:
+                return os.path.getmtime(file_path) == mtime
+            except OSError:
+                return False
+
+        return contents, file_path, uptodate
+
+    def list_templates(self) -> list[str]:
+        return list(self.index)
@@ -0,0 +1,83 @@
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.template import engines
+from django.utils import translation
+from jinja2 import TemplateNotFound, TemplateSyntaxError, nodes
+from logikal_utils.operators import unique
+
+from django_logikal.middleware import Middleware
+from django_logikal.templates.jinja import JinjaTemplates
+
+ComponentHeadCall = tuple[tuple[Any, ...], tuple[tuple[str, Any], ...]]
+
+
+def component_head_calls(backend: JinjaTemplates) -> set[ComponentHeadCall]:
+    """
+    Return the arguments of the ``component_head`` calls with literal arguments in the templates.
+    """
+    calls = set()
+    env = backend.source_env
+    for template_name in backend.template_names():
+        try:
+            source, _, _ = env.loader.get_source(env, template_name)  # type: ignore[union-attr]
+            template = env.parse(source)
+        except (TemplateNotFound, TemplateSyntaxError):
+            continue
+        for call in template.find_all(nodes.Call):
+            if not (isinstance(call.node, nodes.Name) and call.node.name == 'component_head'):
+                continue
+            arguments = [*call.args, *(kwarg.value for kwarg in call.kwargs)]
+            if call.dyn_args or call.dyn_kwargs or not all(
+                isinstance(argument, nodes.Const) for argument in arguments
+            ):
+                continue
+            calls.add((
+                tuple(arg.as_const() for arg in call.args),
+                tuple(sorted((kwarg.key, kwarg.value.as_const()) for kwarg in call.kwargs)),
+            ))
+    return calls
+
+
+def precompute_component_heads() -> int:
+    """
+    Precompute the component heads used in the Jinja templates for each language.
+
+    Only the ``component_head`` calls with literal arguments are precomputed, others are computed
+    (and cached) on first use. Returns the number of precomputed component heads.
+    """
+    count = 0
+    for backend in engines.all():
+        if not isinstance(backend, JinjaTemplates):
+            continue
+        template = backend.env.from_string('{{ component_head(*args, **kwargs) }}')
+        for args, kwargs in component_head_calls(backend):
+            for language_code, _ in settings.LANGUAGES:
+                with translation.override(language_code):
+                    template.render(args=args, kwargs=dict(kwargs))
+                count += 1
+    return count
+
+
+class PreloadMiddleware(Middleware):
+    """
+    Send the resources preloaded by the component heads in the ``Link`` response header.
+
+    Reverse proxies and content delivery networks can turn the header into ``103 Early Hints``
+    responses, so that browsers start fetching the resources before the page arrives. The component
+    heads used in the Jinja templates are precomputed for each language when the middleware is
+    loaded (see :func:`precompute_component_heads`).
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        precompute_component_heads()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if links := request.__dict__.get('_preload_links'):
+            links = list(unique(links))
+            if existing := response.headers.get('Link'):
+                links.insert(0, existing)
+            response.headers['Link'] = ', '.join(links)
+        return response
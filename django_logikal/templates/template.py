@@ -11,6 +11,12 @@ from django_logikal.urls import URLType
 from django_logikal.views.generic import public as mark_public
 
 
+class TemplatePageView(TemplateView):
+    """
+    The base class of the views created via the ``Template`` paths.
+    """
+
+
 class Template:
     def __init__(
         self,
@@ -32,7 +38,7 @@ class Template:
         context = {**(self.extra_context or {}), **(extra_context or {})}
         template_get_context_data = self.__class__.get_context_data
 
-        class TemplateViewWithContext(TemplateView):
+        class TemplateViewWithContext(TemplatePageView):
             def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
                 return {
                     **context,
@@ -0,0 +1,131 @@
+import random
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from logging import getLogger
+from time import perf_counter
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.module_loading import import_string
+
+from django_logikal.middleware import Middleware
+
+logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenderMeasurement:
+    """
+    A template rendering measurement.
+    """
+    #: The name of the template.
+    template_name: str
+    #: The names of the rendered blocks (empty when the entire template was rendered).
+    block_names: tuple[str, ...]
+    #: The rendering duration in seconds.
+    duration: float
+    #: The number of rendered characters.
+    size: int
+    #: The request the template was rendered for.
+    request: HttpRequest | None = None
+
+    @property
+    def name(self) -> str:
+        """
+        Return the template name including the rendered block names.
+        """
+        if not self.block_names:
+            return self.template_name
+        return f'{self.template_name}#{','.join(self.block_names)}'
+
+
+RenderHook = Callable[[RenderMeasurement], None]
+
+
+class RenderTimer:
+    """
+    Measure the rendering of a sample of templates and report the measurements to hooks.
+
+    Args:
+        hooks: The hooks or hook import paths to call with each :class:`RenderMeasurement`.
+        sample_rate: The fraction of template renderings to measure.
+
+    """
+    def __init__(self, hooks: Sequence[str | RenderHook] = (), sample_rate: float = 1):
+        self.hooks: list[RenderHook] = [
+            import_string(hook) if isinstance(hook, str) else hook for hook in hooks
+        ]
+        self.sample_rate = sample_rate
+
+    def start(self) -> float | None:
+        """
+        Return the start time of a measurement or :data:`None` when it should be skipped.
+        """
+        if not self.hooks or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return None
+        return perf_counter()
+
+    def stop(  # pylint: disable=too-many-arguments
+        self,
+        start: float,
+        *,
+        template_name: str,
+        block_names: Sequence[str],
+        size: int,
+        request: HttpRequest | None = None,
+    ) -> None:
+        """
+        Report a measurement started at the given time to the hooks.
+        """
+        measurement = RenderMeasurement(
+            template_name=template_name,
+            block_names=tuple(block_names),
+            duration=perf_counter() - start,
+            size=size,
+            request=request,
+        )
+        for hook in self.hooks:
+            hook(measurement)
+
+
+def log_measurement(measurement: RenderMeasurement) -> None:
+    """
+    Log a template rendering measurement.
+    """
+    logger.info(
+        f'Rendered "{measurement.name}" in {measurement.duration * 1000:.2f} ms '
+        f'({measurement.size} characters)',
+        extra={
+            'template_name': measurement.template_name,
+            'block_names': measurement.block_names,
+            'duration': measurement.duration,
+            'size': measurement.size,
+        },
+    )
+
+
+def add_server_timing(measurement: RenderMeasurement) -> None:
+    """
+    Add a template rendering measurement to the ``Server-Timing`` header of the response.
+
+    .. note:: Requires the :class:`ServerTimingMiddleware`.
+    """
+    if measurement.request is not None:
+        measurements = measurement.request.__dict__.setdefault('_render_measurements', [])
+        measurements.append(measurement)
+
+
+class ServerTimingMiddleware(Middleware):
+    """
+    Add the template rendering measurements to the ``Server-Timing`` response header.
+    """
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if measurements := request.__dict__.get('_render_measurements'):
+            metrics = [
+                f'template;desc="{measurement.name}";dur={measurement.duration * 1000:.2f}'
+                for measurement in measurements
+            ]
+            if existing := response.headers.get('Server-Timing'):
+                metrics.insert(0, existing)
+            response.headers['Server-Timing'] = ', '.join(metrics)
+        return response
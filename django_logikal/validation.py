@@ -50,6 +50,7 @@ class ValidationMiddleware(Middleware):
         )
         if (  # pylint: disable=too-many-boolean-expressions
             not response.headers['Content-Type'].startswith('text/html')
+            or response.streaming
             or getattr(request, 'htmx', None)
             or (response.status_code != 200 and app_name != 'error')
             or app_name in self._skipped_apps
@@ -1,13 +1,17 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import wraps
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.forms.forms import BaseForm
 from django.http import (
-    HttpRequest, HttpResponse, HttpResponseBase, HttpResponseNotFound, HttpResponseServerError,
+    HttpRequest, HttpResponse, HttpResponseBase, HttpResponseNotFound,
+    HttpResponseServerError, StreamingHttpResponse,
 )
 from django.shortcuts import render
+from django.template import loader
 from django.template.backends.utils import csrf_input
+from django.utils.cache import patch_vary_headers
 from django.views import View, defaults, generic
 
 ViewFunction = Callable[..., HttpResponseBase]
@@ -36,6 +40,16 @@ def public(view: ViewFunction) -> ViewFunction:
     return view_wrapper
 
 
+def is_public(view: Callable[..., Any]) -> bool:
+    """
+    Check whether a given view has been marked public.
+    """
+    return (
+        getattr(view, 'public_view', False)
+        or issubclass(getattr(view, 'view_class', type(None)), PublicViewMixin)
+    )
+
+
 class FormView[Form: BaseForm](generic.FormView[Form]):
     """
     Display an improved form and render a template response.
@@ -52,17 +66,173 @@ class FormView[Form: BaseForm](generic.FormView[Form]):
         return kwargs
 
 
-class HTMXTemplateView(generic.TemplateView):
+async def render_async(  # pylint: disable=too-many-arguments
+    request: HttpRequest,
+    template_name: str | Sequence[str],
+    *,
+    context: dict[str, Any] | None = None,
+    content_type: str | None = None,
+    status: int | None = None,
+    using: str | None = None,
+) -> HttpResponse:
+    """
+    Render a template asynchronously and return a response.
+
+    Templates that do not support asynchronous rendering are rendered in a separate thread.
+    """
+    if isinstance(template_name, str):
+        template_name = [template_name]
+    template = loader.select_template(template_name, using=using)
+    template_render_async = (
+        getattr(template, 'render_async', None) or sync_to_async(template.render)
+    )
+    content = await template_render_async(context=context, request=request)
+    return HttpResponse(content, content_type=content_type, status=status)
+
+
+class StreamingTemplateResponse(StreamingHttpResponse):
+    """
+    Render a template into a streaming response.
+
+    The template output is sent in chunks while it is being rendered, which reduces the memory use
+    and the time to first byte for large pages. Falls back to sending the entire rendered output at
+    once for templates that do not support streaming.
+
+    .. note:: The response content is rendered after the response has left the middleware chain,
+        therefore middleware cannot inspect or modify the rendered content.
+    """
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        request: HttpRequest,
+        template: str | Sequence[str],
+        *,
+        context: dict[str, Any] | None = None,
+        content_type: str | None = None,
+        status: int | None = None,
+        charset: str | None = None,
+        using: str | None = None,
+        headers: dict[str, str] | None = None,
+    ):
+        if isinstance(template, str):
+            template = [template]
+        loaded_template = loader.select_template(template, using=using)
+        content = (
+            stream(context=context, request=request)
+            if (stream := getattr(loaded_template, 'stream', None))
+            else iter([loaded_template.render(context=context, request=request)])
+        )
+        super().__init__(
+            streaming_content=content, content_type=content_type, status=status,
+            charset=charset, headers=headers,
+        )
+
+
+class TemplateView(generic.TemplateView):
+    """
+    Render a template, optionally as a streaming response.
+    """
+    #: Whether to stream the rendered template via a :class:`StreamingTemplateResponse`.
+    stream = False
+
+    def render_to_response(  # type: ignore[override]
+        self, context: dict[str, Any], **response_kwargs: Any,
+    ) -> HttpResponseBase:
+        """
+        Return a template response or a streaming template response.
+        """
+        if not self.stream:
+            return super().render_to_response(context, **response_kwargs)
+        response_kwargs.setdefault('content_type', self.content_type)
+        return StreamingTemplateResponse(
+            request=self.request,
+            template=self.get_template_names(),
+            context=context,
+            using=self.template_engine,
+            **response_kwargs,
+        )
+
+    async def render_to_response_async(
+        self, context: dict[str, Any], **response_kwargs: Any,
+    ) -> HttpResponse:
+        """
+        Render the template asynchronously and return a response.
+        """
+        response_kwargs.setdefault('content_type', self.content_type)
+        return await render_async(
+            request=self.request,
+            template_name=self.get_template_names(),
+            context=context,
+            using=self.template_engine,
+            **response_kwargs,
+        )
+
+
+class HTMXTemplateView(TemplateView):
     """
     Render a htmx-enabled template.
     """
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """
+        Dispatch the request and add ``HX-Request`` to the ``Vary`` header of the response.
+
+        Full pages and htmx partials share the same URL, therefore caches must tell them apart.
+        """
+        response: Any = super().dispatch(request, *args, **kwargs)
+        if not self.view_is_async:
+            patch_vary_headers(response, ['HX-Request'])
+            return response
+
+        async def vary_on_htmx() -> Any:
+            async_response = await response
+            patch_vary_headers(async_response, ['HX-Request'])
+            return async_response
+
+        return vary_on_htmx()
+
     def render_block(self, name: str, context: dict[str, Any] | None = None) -> HttpResponse:
         """
         Render a given block of the template.
         """
+        return self.render_blocks([name], context=context)
+
+    def render_blocks(
+        self,
+        names: Sequence[str],
+        context: dict[str, Any] | None = None,
+    ) -> HttpResponse:
+        """
+        Render the given blocks of the template in a single pass.
+
+        The blocks share the same template context and are concatenated in the given order, which
+        is useful for updating multiple elements via out-of-band swaps.
+        """
         return render(
             request=self.request,
-            template_name=f'{self.get_template_names()[0]}#{name}',
+            template_name=f'{self.get_template_names()[0]}#{','.join(names)}',
+            context=context,
+        )
+
+    async def render_block_async(
+        self,
+        name: str,
+        context: dict[str, Any] | None = None,
+    ) -> HttpResponse:
+        """
+        Render a given block of the template asynchronously.
+        """
+        return await self.render_blocks_async([name], context=context)
+
+    async def render_blocks_async(
+        self,
+        names: Sequence[str],
+        context: dict[str, Any] | None = None,
+    ) -> HttpResponse:
+        """
+        Render the given blocks of the template asynchronously in a single pass.
+        """
+        return await render_async(
+            request=self.request,
+            template_name=f'{self.get_template_names()[0]}#{','.join(names)}',
             context=context,
         )
 
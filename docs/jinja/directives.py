@@ -129,6 +129,10 @@ class JinjaSphinxDirective(ABC, SphinxDirective):
                 functions.include_static,
                 static_path_function=self._include_static_path,
             ),
+            'icon': partial(  # the icons are inlined, as there is no sprite in the documentation
+                functions.include_static,
+                static_path_function=self._include_static_path,
+            ),
             'url': self._url,
             # Forms
             'auth_form': account.AuthForm(render_context=render_context),
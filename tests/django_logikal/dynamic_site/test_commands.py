@@ -1,7 +1,10 @@
 import re
 from pathlib import Path
 
+from django.core import management
 from django.core.management.base import CommandError
+from django.template.loader import get_template
+from django.test import override_settings
 from pytest import raises
 from pytest_mock import MockerFixture
 
@@ -112,3 +115,62 @@ def test_translate_init_overwrite(tmp_path: Path, mocker: MockerFixture) -> None
 def test_translate_init_missing_locale() -> None:
     with raises(CommandError, match='locale must be provided'):
         translate.Command().handle(init=True)
+
+
+def test_compiletemplates(tmp_path: Path) -> None:
+    templates = [{
+        'BACKEND': 'django_logikal.templates.jinja.JinjaTemplates',
+        'APP_DIRS': True,
+        'OPTIONS': {'compiled_templates': tmp_path / 'templates.zip'},
+    }]
+    with override_settings(TEMPLATES=templates):
+        management.call_command('compiletemplates')
+        template = get_template('dynamic_site/home.html.j')
+        origin = template.origin  # type: ignore[attr-defined]
+        assert origin.name.startswith(str(tmp_path / 'templates.zip'))
+
+    management.call_command('compiletemplates', str(tmp_path / 'templates'))
+    assert list((tmp_path / 'templates').glob('tmpl_*.py'))
+
+
+def test_compiletemplates_missing_output() -> None:
+    with raises(CommandError, match='output path must be provided'):
+        management.call_command('compiletemplates')
+
+
+def test_indextemplates(tmp_path: Path) -> None:
+    templates = [{
+        'BACKEND': 'django_logikal.templates.jinja.JinjaTemplates',
+        'APP_DIRS': True,
+        'OPTIONS': {'template_index': tmp_path / 'templates.json'},
+    }]
+    with override_settings(TEMPLATES=templates):
+        management.call_command('indextemplates')
+        template = get_template('dynamic_site/home.html.j')
+        origin = template.origin  # type: ignore[attr-defined]
+        assert origin.name.endswith('dynamic_site/home.html.j')
+    assert 'dynamic_site/home.html.j' in (tmp_path / 'templates.json').read_text()
+
+
+def test_indextemplates_missing_output() -> None:
+    with raises(CommandError, match='output path must be provided'):
+        management.call_command('indextemplates')
+
+
+def test_warmtemplates(tmp_path: Path) -> None:
+    templates = [{
+        'BACKEND': 'django_logikal.templates.jinja.JinjaTemplates',
+        'APP_DIRS': True,
+        'OPTIONS': {'bytecode_cache': {
+            'BACKEND': 'django_logikal.templates.bytecode.FileSystemBytecodeCache',
+            'OPTIONS': {'directory': tmp_path},
+        }},
+    }]
+    with override_settings(TEMPLATES=templates):
+        management.call_command('warmtemplates')
+    assert list(tmp_path.glob('__jinja2_*.cache'))
+
+
+def test_warmtemplates_missing_cache() -> None:
+    with raises(CommandError, match='No template backend with a bytecode cache'):
+        management.call_command('warmtemplates')
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from django.template import engines
+from pytest import raises
+from pytest_mock import MockerFixture
+
+from django_logikal.templates import bundles
+from django_logikal.templates.bundles import (
+    ComponentBundleFinder, bundle_css, bundle_js, minify_css,
+)
+from django_logikal.templates.components import COMPONENTS_JS_PATH
+
+
+def test_minify_css() -> None:
+    css = """
+    @import url('base.css');
+    /* Comment */
+    @media (min-width: 10px) {
+      a:hover, b > c { content: 'a ; b'; background: url('image.png'); }
+    }
+    """
+    assert minify_css(css, base='../css') == (
+        '@media (min-width:10px){a:hover,b>c{content:"a ; b";background:url("../css/image.png");}}'
+    )
+
+
+def test_minify_css_selectors() -> None:
+    css = """
+    :root { --color: red; }
+    a:hover, p.missing { color: var(--color); }
+    div > .b:not(.c)::before { content: ''; }
+    #other { color: blue; }
+    [hidden] { display: none; }
+    @media (min-width: 10px) { .a { color: red; } .missing { color: blue; } }
+    @media print { .missing { color: blue; } }
+    """
+    assert minify_css(css, selectors={'a', 'div', '.b', '[hidden]', '.a'}) == '\n'.join([
+        ':root{--color:red;}',
+        'a:hover,p.missing{color:var(--color);}',
+        'div>.b:not(.c)::before{content:"";}',
+        '[hidden]{display:none;}',
+        '@media (min-width:10px){.a{color:red;}}',
+    ])
+
+
+def test_bundle_css() -> None:
+    css = bundle_css(('validation',))
+    assert '@import' not in css
+    assert '@media (prefers-color-scheme: dark){' in css
+    assert 'url("../../fonts/Lato-Regular.woff2")' in css
+    assert '@media' not in bundle_css(('baseline',), use_standard_theme=False)
+
+
+def test_bundle_js(mocker: MockerFixture) -> None:
+    js = bundle_js(('layout',))
+    assert js.index('django_logikal/js/gettext.mjs') < js.index('django_logikal/js/commons.mjs')
+    assert js.count('// django_logikal/js/gettext.mjs') == 1
+    assert 'export const _ = window.gettext;' in js
+    assert 'import' not in js
+    mocker.patch.object(bundles, 'component_head_files', return_value={
+        'js': [COMPONENTS_JS_PATH / 'styles.mjs'],
+    })
+    js = bundle_js(('styles',))
+    assert js.index('django_logikal/js/gettext.mjs') < js.index('django_logikal/js/styles.mjs')
+    mocker.patch.object(bundles, 'bundleable', return_value=False)
+    with raises(ValueError, match='imports other modules'):
+        bundle_js(('styles',))
+
+
+def test_component_bundle_finder() -> None:
+    finder = ComponentBundleFinder()
+    file_path = finder.find('django_logikal/bundles/themed/layout.text.css')
+    assert isinstance(file_path, str)
+    assert Path(file_path).read_text(encoding='utf-8') == bundle_css(('layout', 'text'))
+    assert finder.find('django_logikal/bundles/plain/layout.css', find_all=True)
+    file_path = finder.find('django_logikal/bundles/layout.mjs')
+    assert isinstance(file_path, str)
+    assert Path(file_path).read_text(encoding='utf-8') == bundle_js(('layout',))
+    assert not finder.find('django_logikal/bundles/baseline.mjs')  # no scripts
+    assert not finder.find('django_logikal/bundles/themed/non-existent.css')
+    assert not finder.find('django_logikal/css/layout.css')
+
+    location = Path(finder.storage.location)
+    assert location.is_dir()
+    del finder
+    assert not location.exists()
+
+
+def test_component_head_bundle() -> None:
+    template = engines['jinja'].from_string("{{ component_head('layout', bundle=true) }}")
+    content = template.render()
+    assert 'href="/static/django_logikal/bundles/themed/layout.css"' in content
+    assert 'src="/static/django_logikal/bundles/layout.mjs"' in content
+    assert 'rel="modulepreload" href="/static/django_logikal/bundles/layout.mjs"' in content
+    assert 'django_logikal/js/' not in content
+    assert 'django_logikal/css/' not in content
+    with raises(ValueError, match='Invalid module'):
+        engines['jinja'].from_string("{{ component_head('spam', bundle=true) }}").render()
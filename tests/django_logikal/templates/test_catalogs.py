@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from django.template import engines
+from django.test import override_settings
+from django.utils import translation
+
+from django_logikal.templates.catalogs import (
+    JavaScriptCatalogFinder, catalog_file, catalog_fragment,
+    catalog_fragment_file, javascript_catalog, module_messages,
+)
+
+LANGUAGES = [('en-us', 'English'), ('de', 'German')]
+
+
+@override_settings(LANGUAGES=LANGUAGES, LANGUAGE_CODE='en-us')
+def test_catalog_file() -> None:
+    assert catalog_file('de') == Path('django_logikal/i18n/djangojs.de.js')
+    assert catalog_file('de-at') == Path('django_logikal/i18n/djangojs.de.js')
+    assert catalog_file(None) == Path('django_logikal/i18n/djangojs.en-us.js')
+    assert catalog_file('de', base=True) == Path('django_logikal/i18n/djangojs.de.base.js')
+    assert catalog_fragment_file('de', Path('django_logikal/js/commons.mjs')) == Path(
+        'django_logikal/i18n/de/django_logikal/js/commons.js'
+    )
+
+
+def test_module_messages() -> None:
+    assert module_messages(Path('django_logikal/js/commons.mjs')) == (
+        'Hide password', 'Show password',
+    )
+    assert not module_messages(Path('django_logikal/js/gettext.mjs'))
+
+
+def test_javascript_catalog() -> None:
+    assert 'django.gettext' in javascript_catalog('en-us')
+    assert 'django.gettext' in javascript_catalog('en-us', messages=())
+
+
+def test_catalog_fragment() -> None:
+    fragment = catalog_fragment('en-us', messages=['Show password'])
+    assert 'django.catalog = Object.assign(django.catalog || {}, {});' in fragment
+    assert 'django.gettext' not in fragment
+
+
+@override_settings(LANGUAGES=LANGUAGES)
+def test_javascript_catalog_finder() -> None:
+    finder = JavaScriptCatalogFinder()
+    file_path = finder.find('django_logikal/i18n/djangojs.de.js')
+    assert isinstance(file_path, str)
+    assert Path(file_path).read_text(encoding='utf-8') == javascript_catalog('de')
+    assert finder.find('django_logikal/i18n/djangojs.de.js', find_all=True) == [file_path]
+    assert not finder.find('django_logikal/i18n/djangojs.fr.js')
+    assert finder.find('django_logikal/i18n/de/django_logikal/js/commons.js')
+    assert not finder.find('django_logikal/i18n/de/django_logikal/js/gettext.js')
+    assert [path for path, _ in finder.list(ignore_patterns=[])] == [
+        'django_logikal/i18n/djangojs.en-us.js',
+        'django_logikal/i18n/djangojs.en-us.base.js',
+        'django_logikal/i18n/en-us/django_logikal/js/commons.js',
+        'django_logikal/i18n/djangojs.de.js',
+        'django_logikal/i18n/djangojs.de.base.js',
+        'django_logikal/i18n/de/django_logikal/js/commons.js',
+    ]
+
+    location = Path(finder.storage.location)
+    del finder
+    assert not location.exists()
+
+
+@override_settings(LANGUAGES=LANGUAGES)
+def test_component_head_catalog() -> None:
+    template = engines['jinja'].from_string("{{ component_head('commons') }}")
+    with translation.override('de'):
+        content = template.render()
+    assert '<script defer src="/static/django_logikal/i18n/djangojs.de.js"></script>' in content
+
+
+@override_settings(LANGUAGES=LANGUAGES, JS_I18N_CATALOG_FRAGMENTS=True)
+def test_component_head_catalog_fragments() -> None:
+    template = engines['jinja'].from_string("{{ component_head('commons', 'layout') }}")
+    with translation.override('de'):
+        content = template.render()
+    assert 'src="/static/django_logikal/i18n/djangojs.de.base.js"' in content
+    assert 'src="/static/django_logikal/i18n/de/django_logikal/js/commons.js"' in content
+    assert 'djangojs.de.js' not in content
@@ -1,8 +1,60 @@
-from pytest import raises
+from collections.abc import Iterator
+from pathlib import Path
 
-from django_logikal.templates.components import component_head_files
+from pytest import MonkeyPatch, fixture, raises
+
+from django_logikal.templates import components
+from django_logikal.templates.components import (
+    bundleable, component_head_files, import_names, module_dependencies,
+)
+
+
+@fixture
+def scripts(tmp_path: Path, monkeypatch: MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(components, 'STATIC_PATH', tmp_path)
+    bundleable.cache_clear()
+    module_dependencies.cache_clear()
+    yield tmp_path
+    bundleable.cache_clear()
+    module_dependencies.cache_clear()
 
 
 def test_component_head_files_error() -> None:
     with raises(ValueError, match='Invalid module'):
         component_head_files('non-existent')
+
+
+def test_component_head_files_fonts() -> None:
+    fonts = component_head_files(('validation',))['fonts']
+    assert Path('django_logikal/fonts/Lato-Regular.woff2') in fonts
+    assert not component_head_files(('layout',))['fonts']
+
+
+def test_module_dependencies() -> None:
+    assert module_dependencies(Path('django_logikal/js/commons.mjs')) == [
+        Path('django_logikal/js/gettext.mjs'), Path('django_logikal/js/commons.mjs'),
+    ]
+
+
+def test_import_names() -> None:
+    assert import_names(' _, gettext as translate, ') == [('_', '_'), ('gettext', 'translate')]
+
+
+def test_bundleable(scripts: Path) -> None:  # pylint: disable=redefined-outer-name
+    (scripts / 'base.mjs').write_text('export const a = 1;\n')
+    modules = {
+        'named.mjs': "import {a, a as b} from './base.mjs';\n",
+        'default.mjs': "import {default as a} from './base.mjs';\n",
+        'namespace.mjs': "import * as base from './base.mjs';\n",
+        'dynamic.mjs': "const base = await import('./base.mjs');\n",
+        'package.mjs': "import {a} from 'package';\n",
+        'export.mjs': "export {a} from './base.mjs';\n",
+        'dependency.mjs': "import {a} from './dynamic.mjs';\n",
+    }
+    for name, content in modules.items():
+        (scripts / name).write_text(content)
+    assert bundleable(Path('base.mjs'))
+    assert bundleable(Path('named.mjs'))
+    assert not any(
+        bundleable(Path(name)) for name in modules if name != 'named.mjs'
+    )
@@ -0,0 +1,85 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+from django.template import engines
+from django.test import override_settings
+from django.utils import translation
+from pytest import fixture, mark
+
+from django_logikal.templates import functions
+from django_logikal.templates.components import critical_styles
+from django_logikal.templates.critical import (
+    critical_css, extract_critical_css, page_selectors, template_pages,
+)
+
+
+@fixture
+def clear_component_heads() -> Iterator[None]:
+    critical_styles.cache_clear()
+    functions._component_head.cache_clear()  # pylint: disable=protected-access
+    yield
+    critical_styles.cache_clear()
+    functions._component_head.cache_clear()  # pylint: disable=protected-access
+
+
+def test_page_selectors() -> None:
+    assert page_selectors('<div id="main" class="a b" hidden><p>Text</p><br/></div>') == {
+        'div', 'p', 'br', '#main', '.a', '.b', '[id]', '[class]', '[hidden]',
+    }
+
+
+def test_critical_css() -> None:
+    css = critical_css(('validation',), selectors={'html', 'body'})
+    assert '@font-face{' in css
+    assert 'url("/static/django_logikal/fonts/Lato-Regular.woff2")' in css
+    assert '@media (prefers-color-scheme: dark){' in css
+    assert '.validation-errors' not in css
+    assert '.validation-errors .code{' in critical_css(
+        ('validation',), selectors={'html', 'body', '.validation-errors', '.code'},
+    )
+    assert '.validation-errors' in critical_css(('validation',), selectors=None)
+
+
+@override_settings(ROOT_URLCONF='tests.dynamic_site.urls')
+def test_template_pages() -> None:
+    with translation.override('en-us'):
+        pages = list(template_pages())
+    assert '/' in pages
+    assert '/en-us/localization/' in pages
+    assert '/partials/' not in pages  # not a template page
+    assert not any(page.startswith('/templates/') for page in pages)  # has URL parameters
+
+
+@mark.django_db
+@override_settings(ROOT_URLCONF='tests.dynamic_site.urls')
+def test_extract_critical_css() -> None:
+    with override_settings(CRITICAL_CSS_MAX_SIZE=1024 * 1024, CRITICAL_CSS_MAX_RATIO=1):
+        styles = extract_critical_css()
+    assert 'themed/layout.text' in styles
+    assert '.group' in styles['themed/layout.text']
+    assert '.action-tree' not in styles['themed/layout.text']  # only on the account page
+    with override_settings(CRITICAL_CSS_MAX_SIZE=1024 * 1024, CRITICAL_CSS_MAX_RATIO=0.1):
+        assert not extract_critical_css()  # over the size ratio budget
+    with override_settings(CRITICAL_CSS_MAX_SIZE=1024, CRITICAL_CSS_MAX_RATIO=1):
+        assert not extract_critical_css()  # over the size budget
+
+
+def test_component_head_critical_css(
+    tmp_path: Path,
+    clear_component_heads: None,  # pylint: disable=redefined-outer-name, unused-argument
+) -> None:
+    critical_styles_path = tmp_path / 'critical.json'
+    critical_styles_path.write_text(json.dumps({'themed/validation': 'p{color:red;}'}))
+    template = engines['jinja'].from_string("{{ component_head('validation') }}")
+    with override_settings(CRITICAL_CSS=critical_styles_path):
+        content = template.render({'csp_nonce': 'nonce'})
+        assert '<style nonce="nonce">p{color:red;}</style>' in content
+        assert 'media="print" data-media="all">' in content
+        assert 'media="print" data-media="(prefers-color-scheme: dark)">' in content
+        assert '<script type="module" src="/static/django_logikal/js/styles.mjs">' in content
+        assert '<noscript>' in content
+        assert '<style>p{color:red;}</style>' in template.render()
+        assert '<style' not in engines['jinja'].from_string(
+            "{{ component_head('validation', use_standard_theme=false) }}"
+        ).render()
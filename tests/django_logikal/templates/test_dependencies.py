@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from django.template import TemplateSyntaxError
+from pytest import raises
+
+from django_logikal.templates.jinja import JinjaTemplates
+
+
+def test_dependency_graph(tmp_path: Path) -> None:
+    (tmp_path / 'base.html.j').write_text('{% block body %}{% endblock %}')
+    (tmp_path / 'macros.html.j').write_text('{% macro hello() %}Hello{% endmacro %}')
+    (tmp_path / 'page.html.j').write_text(
+        "{% extends 'base.html.j' %}{% from 'macros.html.j' import hello %}"
+        '{% block body %}{{ hello() }}{% endblock %}'
+    )
+    (tmp_path / 'home.html.j').write_text("{% include 'page.html.j' %}")
+    backend = JinjaTemplates({
+        'NAME': 'jinja', 'DIRS': [tmp_path], 'APP_DIRS': False, 'OPTIONS': {},
+    })
+    graph = backend.dependency_graph
+    assert graph.dependencies('page.html.j') == {'base.html.j', 'macros.html.j'}
+    assert graph.dependencies('home.html.j', recursive=False) == {'page.html.j'}
+    assert graph.dependents('base.html.j') == {'page.html.j', 'home.html.j'}
+    assert graph.dependents('base.html.j', recursive=False) == {'page.html.j'}
+
+    assert backend.get_template('home.html.j').render() == 'Hello'
+    backend.env.auto_reload = False
+    (tmp_path / 'macros.html.j').write_text('{% macro hello() %}Hi{% endmacro %}')
+    assert backend.template_changed(tmp_path / 'macros.html.j')
+    assert backend.get_template('home.html.j').render() == 'Hi'
+    assert not backend.template_changed(tmp_path.parent / 'other.html.j')
+
+
+def test_dependency_graph_dynamic(tmp_path: Path) -> None:
+    (tmp_path / 'base.html.j').write_text('{% include name %}')
+    (tmp_path / 'page.html.j').write_text("{% extends 'base.html.j' %}")
+    (tmp_path / 'other.html.j').write_text('Other')
+    backend = JinjaTemplates({
+        'NAME': 'jinja', 'DIRS': [tmp_path], 'APP_DIRS': False, 'OPTIONS': {},
+    })
+    graph = backend.dependency_graph
+    assert graph.is_dynamic('base.html.j')
+    assert graph.is_dynamic('page.html.j')
+    assert not graph.is_dynamic('other.html.j')
+
+
+def test_dependency_graph_syntax_error(tmp_path: Path) -> None:
+    (tmp_path / 'base.html.j').write_text('{% block body %}{% endblock %}')
+    (tmp_path / 'page.html.j').write_text("{% extends 'base.html.j' %}")
+    (tmp_path / 'broken.html.j').write_text('{% if %}')
+    backend = JinjaTemplates({
+        'NAME': 'jinja', 'DIRS': [tmp_path], 'APP_DIRS': False, 'OPTIONS': {},
+    })
+    graph = backend.dependency_graph
+    assert graph.dependencies('page.html.j') == {'base.html.j'}
+    assert graph.is_dynamic('broken.html.j')
+
+    assert backend.get_template('page.html.j').render() == ''
+    backend.env.auto_reload = False
+    (tmp_path / 'base.html.j').write_text('{% block body %}')
+    assert backend.template_changed(tmp_path / 'base.html.j')
+    with raises(TemplateSyntaxError):
+        backend.get_template('page.html.j').render()
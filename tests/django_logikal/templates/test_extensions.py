@@ -0,0 +1,52 @@
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.template import engines
+from django.utils import translation
+from django.utils.csp import LazyNonce
+
+from django_logikal.templates.extensions import NONCE_PLACEHOLDER, fragment_cache_key
+from django_logikal.templates.jinja import JinjaTemplates
+
+
+def test_cache() -> None:
+    env = engines['jinja'].env  # type: ignore[attr-defined]
+    template = env.from_string(
+        "{% cache 'test', 60, vary_on=[user] %}<p>{{ content }}</p>{% endcache %}",
+    )
+    assert template.render(content='First', user=1) == '<p>First</p>'
+    assert template.render(content='Second', user=1) == '<p>First</p>'
+    assert template.render(content='Second', user=2) == '<p>Second</p>'
+    with translation.override('de'):
+        assert template.render(content='Third', user=1) == '<p>Third</p>'
+
+    caches['default'].delete(fragment_cache_key('test', vary_on=[1]))
+    assert template.render(content='Fourth', user=1) == '<p>Fourth</p>'
+
+
+def test_cache_nonce() -> None:
+    env = engines['jinja'].env  # type: ignore[attr-defined]
+    template = env.from_string(
+        "{% cache 'nonce' %}<script nonce=\"{{ csp_nonce }}\"></script>{% endcache %}",
+    )
+    first_nonce, second_nonce = LazyNonce(), LazyNonce()
+    assert template.render(csp_nonce=first_nonce) == f'<script nonce="{first_nonce}"></script>'
+    assert template.render(csp_nonce=second_nonce) == f'<script nonce="{second_nonce}"></script>'
+    assert NONCE_PLACEHOLDER in caches['default'].get(fragment_cache_key('nonce'))
+
+    assert template.render(csp_nonce=None) == '<script nonce="None"></script>'
+    assert NONCE_PLACEHOLDER in caches['default'].get(fragment_cache_key('nonce'))
+
+
+def test_cache_async() -> None:
+    backend = JinjaTemplates({
+        'NAME': 'jinja', 'DIRS': [], 'APP_DIRS': True,
+        'OPTIONS': {'enable_async': True},
+    })
+    template = backend.env.from_string(
+        "{% cache 'async' %}<p nonce=\"{{ csp_nonce }}\">{{ content }}</p>{% endcache %}",
+    )
+    first_nonce, second_nonce = LazyNonce(), LazyNonce()
+    content = async_to_sync(template.render_async)(content='First', csp_nonce=first_nonce)
+    assert content == f'<p nonce="{first_nonce}">First</p>'
+    content = async_to_sync(template.render_async)(content='Second', csp_nonce=second_nonce)
+    assert content == f'<p nonce="{second_nonce}">First</p>'
@@ -1,6 +1,7 @@
 import pytest
+from django.utils import translation
 
-from django_logikal.templates import filters as f
+from django_logikal.templates import filters as f, functions
 
 
 def test_upper_first() -> None:
@@ -40,6 +41,12 @@ def test_nowrap() -> None:
     assert f.nowrap('hello world') == 'hello&nbsp;world'
 
 
+def test_icon() -> None:
+    assert f.icon('django_logikal/icons/arrow.svg') == functions.icon(
+        'django_logikal/icons/arrow.svg'
+    )
+
+
 def test_exclude() -> None:
     # Lists
     assert f.exclude([], 'spam') == []
@@ -54,3 +61,12 @@ def test_exclude() -> None:
     # Errors
     with pytest.raises(ValueError):
         f.exclude('invalid type')  # type: ignore[type-var]
+
+
+def test_format_many() -> None:
+    assert f.format_many([1234.5, 3], 'decimal') == ['1,234.5', '3']
+    assert f.format_many([1234.5], 'decimal', format='#,##0.00') == ['1,234.50']
+    with translation.override('de'):
+        assert f.format_many([1234.5], 'decimal') == ['1.234,5']
+    with pytest.raises(ValueError, match='Invalid format kind'):
+        f.format_many([1], 'spam')
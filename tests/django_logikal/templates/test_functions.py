@@ -1,9 +1,12 @@
+import os
 from datetime import UTC, datetime
+from decimal import Decimal
 from pathlib import Path
 
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 from django.urls import ResolverMatch
 from django.urls.exceptions import NoReverseMatch
+from django.utils import translation
 from pytest import mark, raises
 from pytest_mock import MockerFixture
 from time_machine import Traveller
@@ -25,6 +28,38 @@ def test_include_static() -> None:
     assert f.include_static('logikal_logo_xml.svg').startswith('<svg')
 
 
+def test_include_static_cache(tmp_path: Path) -> None:
+    file_path = tmp_path / 'script.js'
+    file_path.write_text('first')
+    calls = []
+
+    def static_path_function(path: str) -> Path:
+        calls.append(path)
+        return file_path
+
+    assert f.include_static('script.js', static_path_function) == 'first'
+    file_path.write_text('second')
+    assert f.include_static('script.js', static_path_function) == 'first'
+    assert len(calls) == 1
+    with override_settings(DEBUG=True):
+        os.utime(file_path, (0, 0))
+        assert f.include_static('script.js', static_path_function) == 'second'
+
+
+def test_icon() -> None:
+    path = 'django_logikal/icons/arrow.svg'
+    assert f.icon(path) == f.include_static(path)
+
+
+@override_settings(ICON_SPRITE=True)
+def test_icon_sprite() -> None:
+    content = f.icon('django_logikal/icons/arrow.svg')
+    assert content.startswith('<svg xmlns="http://www.w3.org/2000/svg" viewBox=')
+    assert content.endswith(
+        '><use href="/static/django_logikal/sprite.svg#django_logikal-icons-arrow"></use></svg>'
+    )
+
+
 def test_url(rf: RequestFactory) -> None:
     name = 'dynamic_site:home'
     params = '?next=test'
@@ -38,6 +73,37 @@ def test_url(rf: RequestFactory) -> None:
         assert f.url('non-existent')
 
 
+def test_url_cache() -> None:
+    name = 'dynamic_site:home'
+    f.url(name)
+    hits = f.url_cache_info()['hits']
+    assert f.url(name) == '/'
+    assert f.url_cache_info()['hits'] == hits + 1
+    assert f.url(name, query={'key': 'value'}) == '/?key=value'  # not cached
+    assert f.url_cache_info()['hits'] == hits + 1
+    with override_settings(ROOT_URLCONF='tests.dynamic_site.urls'):  # clears the cache
+        misses = f.url_cache_info()['misses']
+        assert f.url(name) == '/'
+        assert f.url_cache_info()['misses'] == misses + 1
+
+
+def test_url_cache_equal_arguments() -> None:
+    name = 'dynamic_site:templates'
+    for arg in [1, True, 1.0, Decimal('1')]:
+        assert f.url(name, args=[arg]) == f'/templates/{arg}/'
+        assert f.url(name, kwargs={'arg': arg}) == f'/templates/{arg}/'
+
+
+def test_url_cache_error(mocker: MockerFixture) -> None:
+    reverse = mocker.patch.object(f, 'reverse', side_effect=TypeError('error'))
+    with raises(TypeError, match='error'):
+        f.url('dynamic_site:home', kwargs={'page': 'cache-error'})
+    assert reverse.call_count == 1
+    with raises(TypeError, match='error'):
+        f.url('dynamic_site:home', kwargs={'page': ['unhashable']})
+    assert reverse.call_count == 2
+
+
 def test_url_name(rf: RequestFactory) -> None:
     request = rf.get('/')
     with raises(RuntimeError, match='URL resolving has not taken place'):
@@ -54,6 +120,35 @@ def test_language() -> None:
     assert f.language() == 'en-us'
 
 
+def test_format() -> None:
+    formatter = f.format()
+    assert f.format() is formatter
+    assert f.format(language_code='de') is not formatter
+    assert formatter.decimal(1234.5) == '1,234.5'
+    assert formatter.decimal(1234.5, format='#,##0.00') == '1,234.50'
+    assert formatter.percent(0.25, format='#0.0%') == '25.0%'
+    with translation.override('de'):
+        assert f.format().decimal(1234.5, format='#,##0.00') == '1.234,50'
+
+
+def test_format_many() -> None:
+    formatter = f.format()
+    numbers = (1234.5, 0.25, 3)
+    assert formatter.decimal_many(numbers) == ['1,234.5', '0.25', '3']
+    assert formatter.decimal_many(iter(numbers), format='#,##0.00') == [
+        '1,234.50', '0.25', '3.00',
+    ]
+    assert formatter.percent_many(numbers) == [formatter.percent(number) for number in numbers]
+    assert formatter.currency_many(numbers, 'EUR') == [
+        formatter.currency(number, 'EUR') for number in numbers
+    ]
+    datetimes = [datetime(2023, 7, 1, 14, 34, 56, tzinfo=UTC), datetime(2023, 1, 1, 3, 4, 5)]
+    for datetime_format in ['full', 'long', 'medium', 'short', 'yyyy-MM-dd HH:mm']:
+        assert formatter.datetime_many(datetimes, format=datetime_format) == [
+            formatter.datetime(value, format=datetime_format) for value in datetimes
+        ]
+
+
 def test_cwd(mocker: MockerFixture) -> None:
     cwd = '/test_dir'
     mocker.patch('django_logikal.templates.functions.os.getcwd', return_value=cwd)
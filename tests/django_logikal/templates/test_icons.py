@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from pytest import raises
+
+from django_logikal.templates.icons import SPRITE_PATH, IconSpriteFinder, icon_symbol, svg_parts
+
+
+def test_svg_parts() -> None:
+    svg = '<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg" id="a"><g/></svg>'
+    assert svg_parts(svg) == (
+        {'xmlns': 'http://www.w3.org/2000/svg', 'id': 'a'}, '<g/>',
+    )
+    with raises(ValueError, match='Invalid SVG'):
+        svg_parts('<div></div>')
+
+
+def test_icon_symbol() -> None:
+    svg = (
+        '<svg viewBox="0 0 1 1"><defs><linearGradient id="a"/></defs>'
+        '<path fill="url(#a)"/><use href="#a"/></svg>'
+    )
+    assert icon_symbol('app/icons/arrow.svg', svg) == (
+        '<symbol id="app-icons-arrow" viewBox="0 0 1 1">'
+        '<defs><linearGradient id="app-icons-arrow-a"/></defs>'
+        '<path fill="url(#app-icons-arrow-a)"/><use href="#app-icons-arrow-a"/></symbol>'
+    )
+
+
+def test_icon_sprite_finder() -> None:
+    finder = IconSpriteFinder()
+    file_path = finder.find(str(SPRITE_PATH))
+    assert isinstance(file_path, str)
+    sprite = Path(file_path).read_text(encoding='utf-8')
+    assert '<symbol id="django_logikal-icons-arrow" viewBox=' in sprite
+    assert finder.find(str(SPRITE_PATH), find_all=True) == [file_path]
+    assert not finder.find('django_logikal/icons/arrow.svg')
+    assert [path for path, _ in finder.list(ignore_patterns=[])] == [str(SPRITE_PATH)]
+
+    location = Path(finder.storage.location)
+    del finder
+    assert not location.exists()
@@ -1,7 +1,119 @@
+from pathlib import Path
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.http import HttpRequest
 from django.shortcuts import render
+from django.template.loader import get_template
+from django.test import RequestFactory
+from django.urls import resolve
 from pytest import raises
 
+from django_logikal.templates.bytecode import CacheBytecodeCache, template_cache_key
+from django_logikal.templates.jinja import (
+    DEFAULT_OPTIONS, JinjaTemplate, JinjaTemplates, environment, template_path,
+)
+from django_logikal.views.generic import StreamingTemplateResponse, render_async
+
+
+def page_request(rf: RequestFactory) -> HttpRequest:
+    request = rf.get('/')
+    request.resolver_match = resolve(request.path)
+    request.user = AnonymousUser()
+    return request
+
 
 def test_invalid_block() -> None:
     with raises(RuntimeError, match='Block .* not found'):
         render(request=None, template_name='dynamic_site/home.html.j#non-existent-block')
+
+
+def test_multiple_blocks() -> None:
+    content = render(
+        request=None,
+        template_name='dynamic_site/partials.html.j#subtitle,container',
+        context={'content': 'Test'},
+    ).content.decode()
+    assert content.startswith('Partials')
+    assert content.strip().endswith('<p id="container">Test</p>')
+
+    name = 'dynamic_site/partials.html.j#subtitle,container'
+    first, second = get_template(name), get_template(name)
+    assert isinstance(first, JinjaTemplate) and isinstance(second, JinjaTemplate)
+    assert first._blocks is second._blocks  # pylint: disable=protected-access
+
+
+def test_bytecode_cache(tmp_path: Path) -> None:
+    config = {'BACKEND': 'django_logikal.templates.bytecode.CacheBytecodeCache'}
+    env = environment(bytecode_cache=config, extensions=DEFAULT_OPTIONS['extensions'])
+    assert isinstance(bytecode_cache := env.bytecode_cache, CacheBytecodeCache)
+
+    template = 'dynamic_site/home.html.j'
+    backend = JinjaTemplates({
+        'NAME': 'jinja', 'DIRS': [], 'APP_DIRS': True,
+        'OPTIONS': {'bytecode_cache': bytecode_cache},
+    })
+    source = Path(template_path(template)).read_text(encoding='utf-8')
+    key = f'{bytecode_cache.prefix}:{template_cache_key(backend.env, template, source)}'
+    backend.get_template(template)
+    assert caches['default'].get(key)
+
+    keys = set()
+    for name in ['first', 'second']:
+        (directory := tmp_path / name).mkdir()
+        (directory / 'page.html.j').write_text(name)
+        backend = JinjaTemplates({
+            'NAME': name, 'DIRS': [directory], 'APP_DIRS': False,
+            'OPTIONS': {'bytecode_cache': bytecode_cache},
+        })
+        assert backend.get_template('page.html.j').render() == name
+        keys.add(template_cache_key(backend.env, 'page.html.j', name))
+    assert all(caches['default'].get(f'{bytecode_cache.prefix}:{key}') for key in keys)
+    assert len(keys) == 2
+
+
+def test_stream(rf: RequestFactory) -> None:
+    request = page_request(rf)
+    for name in ['dynamic_site/home.html.j', 'dynamic_site/partials.html.j#container']:
+        template = get_template(name)
+        assert isinstance(template, JinjaTemplate)
+        chunks = template.stream(context={'content': 'Test'}, request=request)
+        assert ''.join(chunks) == template.render(context={'content': 'Test'}, request=request)
+
+
+def test_streaming_template_response(rf: RequestFactory) -> None:
+    response = StreamingTemplateResponse(
+        request=rf.get('/'),
+        template='dynamic_site/partials.html.j#container',
+        context={'content': 'Test'},
+    )
+    content = b''.join(response.streaming_content)  # type: ignore[arg-type]
+    assert content.decode().strip() == '<p id="container">Test</p>'
+
+
+def test_render_async(rf: RequestFactory) -> None:
+    backend = JinjaTemplates({
+        'NAME': 'jinja', 'DIRS': [], 'APP_DIRS': True,
+        'OPTIONS': {'enable_async': True},
+    })
+    request = page_request(rf)
+
+    async def render_in_event_loop(template: JinjaTemplate) -> str:
+        return template.render(context={'content': 'Test'}, request=request)
+
+    for name in ['dynamic_site/home.html.j', 'dynamic_site/partials.html.j#subtitle,container']:
+        template = backend.get_template(name)
+        content = async_to_sync(template.render_async)(
+            context={'content': 'Test'}, request=request,
+        )
+        assert content == template.render(context={'content': 'Test'}, request=request)
+        with raises(RuntimeError, match=r'use render_async\(\) instead'):
+            async_to_sync(render_in_event_loop)(template)
+
+    response = async_to_sync(render_async)(
+        request=rf.get('/'),
+        template_name='dynamic_site/partials.html.j#container',
+        context={'content': 'Test'},
+    )
+    assert response.content.decode().strip() == '<p id="container">Test</p>'
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from jinja2 import Environment, TemplateNotFound
+from pytest import raises
+
+from django_logikal.templates.jinja import template_path
+from django_logikal.templates.loaders import IndexedFileSystemLoader
+
+
+def test_indexed_file_system_loader(tmp_path: Path) -> None:
+    for directory, content in [('first', 'First'), ('second', 'Second')]:
+        (tmp_path / directory / 'nested').mkdir(parents=True)
+        (tmp_path / directory / 'nested' / 'template.html.j').write_text(content)
+    (tmp_path / 'second' / 'other.html.j').write_text('Other')
+
+    loader = IndexedFileSystemLoader([tmp_path / 'first', tmp_path / 'second'])
+    assert loader.list_templates() == ['nested/template.html.j', 'other.html.j']
+    env = Environment(loader=loader, autoescape=True)
+    assert env.get_template('nested/template.html.j').render() == 'First'
+    assert env.get_template('other.html.j').render() == 'Other'
+    with raises(TemplateNotFound):
+        env.get_template('missing.html.j')
+
+    loader.save_index(tmp_path / 'index.json')
+    loader = IndexedFileSystemLoader.from_file(tmp_path / 'index.json', searchpath=[])
+    env = Environment(loader=loader, autoescape=True)
+    assert env.get_template('other.html.j').render() == 'Other'
+
+
+def test_template_path() -> None:
+    assert template_path('dynamic_site/home.html.j').endswith('dynamic_site/home.html.j')
+    assert template_path('dynamic_site/references.bib').endswith('dynamic_site/references.bib')
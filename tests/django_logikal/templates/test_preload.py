@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from django.core import management
+from django.http import HttpRequest, HttpResponse
+from django.template import engines
+from django.test import RequestFactory, override_settings
+from django.utils import translation
+
+from django_logikal.templates.jinja import JinjaTemplates
+from django_logikal.templates.preload import (
+    PreloadMiddleware, component_head_calls, precompute_component_heads,
+)
+
+
+def test_component_head_preloads() -> None:
+    template = engines['jinja'].from_string("{{ component_head('validation') }}")
+    content = template.render()
+    assert '<link rel="preload" href="/static/django_logikal/fonts/Lato-Regular.woff2"' in content
+    assert '<link rel="modulepreload" href="/static/django_logikal/js/gettext.mjs">' in content
+    assert 'rel="preload"' not in engines['jinja'].from_string(
+        "{{ component_head('validation', preload_fonts=false) }}"
+    ).render()
+
+
+def test_preload_middleware(rf: RequestFactory) -> None:
+    assert precompute_component_heads() > 0
+
+    def view(request: HttpRequest) -> HttpResponse:
+        template = engines['jinja'].from_string("{{ component_head('layout', 'layout') }}")
+        response = HttpResponse(template.render(request=request))
+        response.headers['Link'] = '</existing>; rel=preconnect'
+        return response
+
+    with translation.override('en-us'):
+        response = PreloadMiddleware(get_response=view)(rf.get('/'))
+    links = response.headers['Link'].split(', ')
+    assert links[0] == '</existing>; rel=preconnect'
+    assert '</static/django_logikal/js/commons.mjs>; rel=modulepreload' in links
+    assert '</static/django_logikal/css/layout.css>; rel=preload; as=style' in links
+    assert len(links) == len(set(links))
+
+
+def test_component_head_calls_compiled_templates(tmp_path: Path) -> None:
+    calls = component_head_calls(engines['jinja'])  # type: ignore[arg-type]
+    templates = [{
+        'BACKEND': 'django_logikal.templates.jinja.JinjaTemplates',
+        'NAME': 'jinja',
+        'APP_DIRS': True,
+        'OPTIONS': {'compiled_templates': tmp_path / 'templates.zip'},
+    }]
+    with override_settings(TEMPLATES=templates):
+        management.call_command('compiletemplates')
+        backend = engines['jinja']
+        assert isinstance(backend, JinjaTemplates)
+        assert component_head_calls(backend) == calls
+        assert precompute_component_heads() > 0
@@ -0,0 +1,43 @@
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import get_template
+from django.test import RequestFactory, override_settings
+from pytest_mock import MockerFixture
+
+from django_logikal.templates.timing import RenderMeasurement, ServerTimingMiddleware
+
+
+def templates(**render_timing: object) -> list[dict[str, object]]:
+    return [{
+        'BACKEND': 'django_logikal.templates.jinja.JinjaTemplates',
+        'APP_DIRS': True,
+        'OPTIONS': {'render_timing': render_timing},
+    }]
+
+
+def test_render_timing(mocker: MockerFixture) -> None:
+    hook = mocker.Mock()
+    with override_settings(TEMPLATES=templates(hooks=[hook])):
+        template = get_template('dynamic_site/partials.html.j#container')
+        content = template.render({'content': 'Test'})
+    measurement: RenderMeasurement = hook.call_args.args[0]
+    assert measurement.name == 'dynamic_site/partials.html.j#container'
+    assert measurement.size == len(content)
+    assert measurement.duration > 0
+
+    hook.reset_mock()
+    with override_settings(TEMPLATES=templates(hooks=[hook], sample_rate=0)):
+        get_template('dynamic_site/partials.html.j#container').render({'content': 'Test'})
+    hook.assert_not_called()
+
+
+def test_server_timing(rf: RequestFactory) -> None:
+    def view(request: HttpRequest) -> HttpResponse:
+        template = get_template('dynamic_site/partials.html.j#container')
+        return HttpResponse(template.render(context={'content': 'Test'}, request=request))
+
+    hooks = ['django_logikal.templates.timing.add_server_timing']
+    with override_settings(TEMPLATES=templates(hooks=hooks)):
+        response = ServerTimingMiddleware(get_response=view)(rf.get('/'))
+    assert response['Server-Timing'].startswith(
+        'template;desc="dynamic_site/partials.html.j#container";dur=',
+    )
@@ -0,0 +1,83 @@
+from typing import Any
+
+from django.http import HttpRequest, HttpResponse
+from django.middleware.csp import ContentSecurityPolicyMiddleware, get_nonce
+from django.test import RequestFactory
+
+from django_logikal.cache import PageCacheMiddleware, cache_page, deployment_version
+from django_logikal.views.generic import HTMXTemplateView, public
+
+
+def test_page_cache_middleware(rf: RequestFactory) -> None:
+    renders = []
+
+    @public
+    def view(request: HttpRequest) -> HttpResponse:
+        renders.append(request)
+        return HttpResponse(f'<script nonce="{get_nonce(request)}"></script>')
+
+    middleware = PageCacheMiddleware(get_response=view)
+
+    def get(path: str) -> HttpResponse:
+        request = rf.get(path)
+        ContentSecurityPolicyMiddleware(get_response=HttpResponse).process_request(request)
+        response = middleware.process_view(request, view, [], {}) or middleware(request)
+        assert response.content.decode() == f'<script nonce="{get_nonce(request)}"></script>'
+        return response
+
+    get('/page-cache/')
+    get('/page-cache/')
+    assert len(renders) == 1
+    get('/page-cache/?page=2')
+    assert len(renders) == 2
+
+
+def test_cache_page(rf: RequestFactory) -> None:
+    renders = []
+
+    @cache_page(timeout=60)
+    def view(request: HttpRequest) -> HttpResponse:
+        renders.append(request)
+        return HttpResponse('<p>Content</p>')
+
+    for _ in range(2):
+        response = view(rf.get('/cache-page/'))
+        assert isinstance(response, HttpResponse)
+        assert response.content == b'<p>Content</p>'
+    assert len(renders) == 1
+
+    request = rf.get('/cache-page/')
+    request.COOKIES['sessionid'] = 'session'
+    view(request)
+    assert len(renders) == 2
+
+
+def test_cache_page_vary(rf: RequestFactory) -> None:
+    class View(HTMXTemplateView):
+        def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            request.__dict__.setdefault('_preload_links', []).append('</style.css>; rel=preload')
+            partial = 'HX-Request' in request.headers
+            return HttpResponse('<p>Partial</p>' if partial else '<p>Page</p>')
+
+    renders = []
+
+    @cache_page(timeout=60)
+    def view(request: HttpRequest) -> HttpResponse:
+        renders.append(request)
+        return View.as_view()(request)
+
+    for _ in range(2):
+        request = rf.get('/cache-page-vary/')
+        response = view(request)
+        assert isinstance(response, HttpResponse)
+        assert response.content == b'<p>Page</p>'
+        assert response.headers['Vary'] == 'HX-Request'
+        assert request.__dict__['_preload_links'] == ['</style.css>; rel=preload']
+        response = view(rf.get('/cache-page-vary/', headers={'HX-Request': 'true'}))
+        assert isinstance(response, HttpResponse)
+        assert response.content == b'<p>Partial</p>'
+    assert len(renders) == 2
+
+
+def test_deployment_version() -> None:
+    assert len(deployment_version()) == 16
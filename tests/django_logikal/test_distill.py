@@ -0,0 +1,171 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.test import override_settings
+from django.urls import URLPattern, path
+from django.views.generic import TemplateView
+from django_distill.errors import DistillError
+from django_distill.renderer import get_renderer
+from pytest import MonkeyPatch, raises
+
+from django_logikal import distill
+from django_logikal.distill import (
+    BUILD_MANIFEST, ProcessDistillRender, RenderedPage,
+    build_incremental, files_digest, template_files,
+)
+from django_logikal.settings.static_site.base import BaseSettings
+from django_logikal.templates.jinja import template_path
+
+urlpatterns = [
+    path('first/', TemplateView.as_view(template_name='first.html.j'), name='first'),
+    path('second/', TemplateView.as_view(template_name='second.html.j'), name='second'),
+]
+
+
+def distill_urls(patterns: list[URLPattern]) -> list[tuple[Any, ...]]:
+    return [
+        (pattern, lambda: None, None, (200,), pattern.name,
+         (str(pattern.pattern), pattern.callback), {'name': pattern.name})
+        for pattern in patterns
+    ]
+
+
+def thread_pool(max_workers: int, **_kwargs: Any) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def render_pattern(index: int) -> list[RenderedPage] | str:
+    time.sleep(0.01 * (3 - index))  # later patterns finish first
+    if index in {1, 2}:
+        return f'pattern_{index}: failed'
+    return [(f'/{index}/{page}/', None, b'content', 'text/html') for page in range(2)]
+
+
+def test_files_digest(tmp_path: Path) -> None:
+    (first := tmp_path / 'first.txt').write_text('first')
+    (second := tmp_path / 'second.txt').write_text('second')
+    digest = files_digest([first, second])
+    assert files_digest([second, first]) == digest
+    assert files_digest([first, tmp_path / 'missing.txt']) != files_digest([first])
+    second.write_text('changed')
+    assert files_digest([first, second]) != digest
+
+
+def test_template_files() -> None:
+    files = template_files('account/login.html.j')
+    assert Path(template_path('account/login.html.j')) in files
+    assert Path(template_path('django_logikal/components/auth.html.j')) in files
+    assert Path(template_path('account/password_reset.html.j')) not in files
+    assert template_files('missing.html.j') == template_files(None)
+    assert set(files) < set(template_files(None))
+
+
+@override_settings(DISTILL_RENDERER=BaseSettings.DISTILL_RENDERER)
+def test_process_distill_render(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(distill, 'ProcessPoolExecutor', thread_pool)
+    monkeypatch.setattr(distill, '_render_pattern', render_pattern)
+    urls: list[tuple[Any, ...]] = [
+        (f'{index}/', None, None, (200,), f'pattern_{index}', (), {}) for index in range(4)
+    ]
+    renderer = get_renderer(urls, parallel_render=2)
+    assert isinstance(renderer, ProcessDistillRender)
+    rendered = []
+    with raises(DistillError, match='\n'.join([
+        'Failed to render the following URLs:', 'pattern_1: failed', 'pattern_2: failed',
+    ])):
+        for uri, _, response in renderer.render_all_urls():
+            rendered.append(uri)
+            assert response.content == b'content'
+    assert rendered == ['/0/0/', '/0/1/', '/3/0/', '/3/1/']
+
+
+def test_build_incremental(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'base.html.j').write_text('<p>{% block content %}{% endblock %}</p>')
+    (templates / 'first.html.j').write_text(
+        "{% extends 'base.html.j' %}{% block content %}First{% endblock %}"
+    )
+    (templates / 'second.html.j').write_text('<p>Second</p>')
+    (static := tmp_path / 'static').mkdir()
+    (static / 'style.css').write_text('p { color: red; }')
+    output = tmp_path / 'output'
+    output.mkdir()
+    monkeypatch.setattr(distill, 'urls_to_distill', distill_urls(urlpatterns))
+
+    def build() -> list[str]:
+        messages: list[str] = []
+        build_incremental(output_dir=output, stdout=messages.append)
+        return [message.split(' [')[0] for message in messages[:-1]]
+
+    with override_settings(
+        ROOT_URLCONF=__name__, MIDDLEWARE=[], STATIC_ROOT=static, MEDIA_ROOT='',
+        LANGUAGES=[('en-us', 'English')], LANGUAGE_CODE='en-us',
+        TEMPLATES=[{
+            'BACKEND': 'django_logikal.templates.jinja.JinjaTemplates',
+            'DIRS': [templates],
+            'OPTIONS': {'auto_reload': True},
+        }],
+    ):
+        assert build() == [
+            'Rendering page: first/index.html',
+            'Rendering page: second/index.html',
+            'Copying file: static/style.css',
+        ]
+        assert (output / 'first/index.html').read_text() == '<p>First</p>'
+        assert not build()  # nothing changed
+
+        # Changing a template only renders the pages that depend on it
+        (templates / 'base.html.j').write_text('<div>{% block content %}{% endblock %}</div>')
+        assert build() == ['Rendering page: first/index.html']
+        assert (output / 'first/index.html').read_text() == '<div>First</div>'
+
+        # The pages that fail are reported and left out of the manifest
+        (templates / 'first.html.j').write_text('{{ missing }}')
+        with raises(DistillError, match='first: '):
+            build()
+        manifest = json.loads((output / BUILD_MANIFEST).read_text())
+        assert set(manifest['pages']) == {'second/index.html'}
+        assert manifest['files'] == ['static/style.css']
+
+        # The files that are no longer generated are removed
+        (templates / 'first.html.j').write_text('<p>Fixed</p>')
+        monkeypatch.setattr(distill, 'urls_to_distill', distill_urls(urlpatterns[:1]))
+        (static / 'style.css').unlink()
+        assert build() == [
+            'Rendering page: first/index.html',
+            'Removing file: second/index.html',
+            'Removing file: static/style.css',
+        ]
+        assert sorted(file.name for file in output.iterdir()) == [BUILD_MANIFEST, 'first']
+        manifest = json.loads((output / BUILD_MANIFEST).read_text())
+        assert set(manifest['pages']) == {'first/index.html'}
+        assert not manifest['files']
+
+        # Only the static files in the static file manifest are copied
+        (static / 'style.1.css').write_text('p { color: red; }')
+        (manifest_path := static / 'staticfiles.json').write_text(
+            json.dumps({'paths': {'style.css': 'style.1.css'}, 'version': '1.1'})
+        )
+        with override_settings(STORAGES={**settings.STORAGES, 'staticfiles': {
+            'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage',
+        }}):
+            assert build() == [
+                'Rendering page: first/index.html',
+                'Copying file: static/staticfiles.json',
+                'Copying file: static/style.1.css',
+            ]
+            (static / 'style.2.css').write_text('p { color: blue; }')
+            manifest_path.write_text(
+                json.dumps({'paths': {'style.css': 'style.2.css'}, 'version': '1.1'})
+            )
+            assert build() == [  # the file of the previous collection is removed
+                'Rendering page: first/index.html',
+                'Copying file: static/staticfiles.json',
+                'Copying file: static/style.2.css',
+                'Removing file: static/style.1.css',
+            ]
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+
+from django_logikal.fonts import code_points, language_subsets, unicode_range, used_characters
+from django_logikal.static import ManifestStaticFilesStorage
+from django_logikal.templates.components import STATIC_PATH
+
+
+def test_unicode_range() -> None:
+    assert code_points('U+0041-0043, U+00E9') == {0x41, 0x42, 0x43, 0xE9}
+    assert unicode_range({0x41, 0x42, 0x43, 0xE9}) == 'U+0041-0043, U+00E9'
+
+
+def test_language_subsets() -> None:
+    assert language_subsets(['en-us', 'de']) == ['latin']
+    assert language_subsets(['pl', 'ru']) == ['latin', 'latin-ext', 'cyrillic']
+
+
+@override_settings(LANGUAGES=[('en-us', 'English'), ('de', 'German')])
+def test_used_characters() -> None:
+    characters = used_characters()
+    assert {'a', 'ä', '{', '%'} <= characters
+    assert 'ł' not in characters
+
+
+@override_settings(FONT_SUBSETTING=True, LANGUAGES=[('en-us', 'English'), ('pl', 'Polish')])
+def test_font_subset_storage(tmp_path: Path) -> None:
+    source = FileSystemStorage(location=STATIC_PATH)
+    fonts = STATIC_PATH / 'django_logikal/fonts'
+    names = [
+        'django_logikal/css/fonts.css',
+        *(f'django_logikal/fonts/{file.name}' for file in fonts.glob('*.woff2')),
+    ]
+    paths = {name: (source, name) for name in names}
+    storage = ManifestStaticFilesStorage(location=tmp_path)
+    storage.subset_fonts(paths)  # type: ignore[arg-type]
+
+    css = (tmp_path / 'django_logikal/css/fonts.css').read_text()
+    assert 'src: url("../fonts/Lato-Regular.latin.woff2") format("woff2");' in css
+    assert 'src: url("../fonts/Lato-Regular.latin-ext.woff2") format("woff2");' in css
+    assert 'unicode-range: U+0020-007E' in css
+    assert 'cyrillic' not in css
+    assert paths['django_logikal/css/fonts.css'] == (storage, 'django_logikal/css/fonts.css')
+
+    subset = tmp_path / 'django_logikal/fonts/Lato-Regular.latin.woff2'
+    assert paths['django_logikal/fonts/Lato-Regular.latin.woff2'][0] is storage
+    assert 0 < subset.stat().st_size < (fonts / 'Lato-Regular.woff2').stat().st_size
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+
+from django_logikal.purge import (
+    is_component_style, purge_css, purge_report, source_selectors, used_selectors,
+)
+from django_logikal.static import ManifestStaticFilesStorage
+from django_logikal.templates.components import STATIC_PATH
+
+
+def test_source_selectors() -> None:
+    assert source_selectors('<div class="menu-bar">') == {
+        'div', '.div', '#div', '[div]',
+        'class', '.class', '#class', '[class]',
+        'menu-bar', '.menu-bar', '#menu-bar', '[menu-bar]',
+    }
+
+
+@override_settings(CSS_PURGING_SAFELIST=['.dynamic'])
+def test_used_selectors() -> None:
+    selectors = used_selectors()
+    assert {'.dynamic', '.apple-login', '.password-input', '.errors', 'menu'} <= selectors
+    assert '.ProjectViewSet' in selectors  # from the Python modules of the project applications
+    assert '.non-existent-selector' not in selectors
+
+
+def test_purge_css() -> None:
+    css = """
+    @import url('base.css');
+    .used, .unused { color: red; }
+    .unused { color: blue; }
+    @media (min-width: 10px) { .unused { color: green; } }
+    """
+    assert purge_css(css, {'.used'}) == '@import url("base.css");\n.used,.unused{color:red;}\n'
+
+
+def test_purge_report() -> None:
+    report = purge_report()
+    assert Path('django_logikal/css/commons.css') in report
+    assert all(0 < purged_size < size for size, purged_size in report.values())
+
+
+def test_is_component_style() -> None:
+    assert is_component_style('django_logikal/css/commons.css')
+    assert is_component_style('django_logikal/bundles/themed/commons.css')
+    assert not is_component_style('django_logikal/js/commons.mjs')
+    assert not is_component_style('css/style.css')
+
+
+@override_settings(CSS_PURGING=True)
+def test_style_purge_storage(tmp_path: Path) -> None:
+    source = FileSystemStorage(location=STATIC_PATH)
+    names = ['django_logikal/css/layout.css', 'django_logikal/js/commons.mjs']
+    paths = {name: (source, name) for name in names}
+    storage = ManifestStaticFilesStorage(location=tmp_path)
+    storage.purge_styles(paths)  # type: ignore[arg-type]
+
+    css = (tmp_path / 'django_logikal/css/layout.css').read_text()
+    assert css.startswith('@import url("')
+    assert len(css) < (STATIC_PATH / 'django_logikal/css/layout.css').stat().st_size
+    assert paths['django_logikal/css/layout.css'] == (storage, 'django_logikal/css/layout.css')
+    assert paths['django_logikal/js/commons.mjs'] == (source, 'django_logikal/js/commons.mjs')
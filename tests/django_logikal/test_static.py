@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+from django.core.files.base import ContentFile
+from django.test import override_settings
+
+from django_logikal.static import ManifestStaticFilesStorage
+from django_logikal.templates.icons import minify_svg
+
+
+def test_manifest_index(tmp_path: Path) -> None:
+    manifest = {'version': '1.1', 'paths': {'style.css': 'style.1234.css'}, 'hash': ''}
+    (tmp_path / 'staticfiles.json').write_text(json.dumps(manifest))
+    storage = ManifestStaticFilesStorage(location=tmp_path, base_url='/static/')
+    assert storage.url_index == {'style.css': '/static/style.1234.css'}
+    assert storage.url('style.css') == '/static/style.1234.css'
+    assert storage.url('style.css#section') == '/static/style.1234.css#section'
+    assert 'style.css#section' in storage.url_index
+    with override_settings(DEBUG=True):
+        assert storage.url('style.css') == '/static/style.css'
+
+
+def test_minify_svg() -> None:
+    svg = """<?xml version="1.0" encoding="UTF-8"?>
+    <!DOCTYPE svg>
+    <!-- comment -->
+    <svg>
+      <text><tspan>Hello</tspan> <tspan>world</tspan></text>
+    </svg>
+    """
+    assert minify_svg(svg) == '<svg><text><tspan>Hello</tspan> <tspan>world</tspan></text></svg>'
+
+
+def test_svg_minify_storage(tmp_path: Path) -> None:
+    storage = ManifestStaticFilesStorage(location=tmp_path)
+    storage.save('icon.svg', ContentFile(b'<svg>\n  <path/>\n</svg>\n'))
+    assert (tmp_path / 'icon.svg').read_text() == '<svg><path/></svg>'
@@ -48,3 +48,39 @@ def test_generate(tmp_path: Path, browser: Browser) -> None:
         '</loc><priority>0.5</priority>'
         in sitemap
     )
+
+
+def html_files(path: Path) -> dict[Path, str]:
+    return {file.relative_to(path): file.read_text() for file in path.rglob('*.html')}
+
+
+@mark.django_db
+def test_generate_jobs(tmp_path: Path) -> None:
+    settings = 'tests.static_site.settings.dev'
+    command = ['manage', 'migrate', '--settings', settings]
+    run(command, check=True)  # nosec: trusted input in testing
+    command = ['manage', 'generate', '--no-input', '--settings', settings]
+    run([*command, str(tmp_path / 'serial')], check=True)  # nosec: trusted input in testing
+    command = ['manage', 'generate', '--no-input', '--jobs', '2', '--settings', settings]
+    run([*command, str(tmp_path / 'parallel')], check=True)  # nosec: trusted input in testing
+
+    pages = html_files(tmp_path / 'serial')
+    assert Path('en-gb/localisation/index.html') in pages  # codespell:ignore localisation
+    assert html_files(tmp_path / 'parallel') == pages
+
+
+@mark.django_db
+def test_generate_incremental(tmp_path: Path) -> None:
+    settings = 'tests.static_site.settings.dev'
+    command = ['manage', 'migrate', '--settings', settings]
+    run(command, check=True)  # nosec: trusted input in testing
+    command = ['manage', 'generate', '--no-input', '--incremental', '--settings', settings]
+    command.append(str(tmp_path))
+    first = run(command, check=True, capture_output=True, text=True)  # nosec: trusted input
+    assert 'Rendering page: en-us/localization/index.html' in first.stdout
+    assert (tmp_path / 'en-us/localization/index.html').is_file()
+    assert (tmp_path / '.build-manifest.json').is_file()
+
+    second = run(command, check=True, capture_output=True, text=True)  # nosec: trusted input
+    assert 'Rendering page:' not in second.stdout
+    assert 'Rendered 0 of ' in second.stdout
@@ -10,6 +10,7 @@ def test_skipping(mocker: MockerFixture) -> None:
         headers={'Content-Type': 'text/html'},
         status_code=200,
         content=b'',
+        streaming=False,
         resolver_match=mocker.Mock(app_name='test', route='test/', func=None),
         path='/test/',
         htmx=False,
@@ -20,6 +21,11 @@ def test_skipping(mocker: MockerFixture) -> None:
     with raises(RuntimeError, match='Empty content'):
         middleware(request=request)
 
+    # Skip streaming response
+    request.streaming = True
+    middleware(request=request)  # does not raise an error
+    request.streaming = False
+
     # Skip htmx request
     request.htmx = True
     middleware(request=request)  # does not raise an error